@@ -1,6 +1,39 @@
 # algorithms.py
 import pygame
 import math
+import numpy as np
+from functools import lru_cache
+from sprite_cache import SpriteCache
+
+# Disc kecil semi-transparan di-cache per (radius, warna) agar tidak membuat surface per panggilan
+_disc_cache = SpriteCache(4 * 1024 * 1024)
+
+def _render_alpha_disc(radius, color):
+    disc = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+    pygame.draw.circle(disc, color, (radius, radius), radius)
+    return disc
+
+@lru_cache(maxsize=256)
+def _circle_outline(radius):
+    """Offset (dx, dy) titik midpoint circle untuk radius, unik, sebagai array NumPy"""
+    octant = []
+    x = radius
+    y = 0
+    err = 0
+    while x >= y:
+        octant.append((x, y))
+        y += 1
+        err += 1 + 2 * y
+        if 2 * (err - x) + 1 > 0:
+            x -= 1
+            err += 1 - 2 * x
+    
+    ox, oy = np.array(octant).T
+    # Simetri 8 oktan sekaligus
+    dx = np.concatenate((ox, oy, -oy, -ox, -ox, -oy, oy, ox))
+    dy = np.concatenate((oy, ox, ox, oy, -oy, -ox, -ox, -oy))
+    offsets = np.unique(np.stack((dx, dy), axis=1), axis=0)
+    return offsets[:, 0], offsets[:, 1]
 
 def draw_circle_midpoint(surface, center_x, center_y, radius, color):
     """Clean circle drawing with anti-aliasing approximation"""
@@ -12,42 +45,25 @@ def draw_circle_midpoint(surface, center_x, center_y, radius, color):
     # Untuk radius kecil, gunakan pygame.draw untuk kualitas lebih baik
     if radius < 10:
         if len(color) == 4:  # RGBA
-            temp_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, color, (radius, radius), radius)
-            surface.blit(temp_surf, (center_x - radius, center_y - radius))
+            disc = _disc_cache.get_or_render((radius, tuple(color)), lambda: _render_alpha_disc(radius, color))
+            surface.blit(disc, (center_x - radius, center_y - radius))
         else:
             pygame.draw.circle(surface, color, (center_x, center_y), radius)
         return
     
-    # Untuk radius besar, gunakan algoritma kita dengan smoothing
-    x = radius
-    y = 0
-    err = 0
-    
-    # Pre-calculate points for smoother circle
-    points = []
-    while x >= y:
-        points.extend([
-            (center_x + x, center_y + y),
-            (center_x + y, center_y + x),
-            (center_x - y, center_y + x),
-            (center_x - x, center_y + y),
-            (center_x - x, center_y - y),
-            (center_x - y, center_y - x),
-            (center_x + y, center_y - x),
-            (center_x + x, center_y - y)
-        ])
-        y += 1
-        err += 1 + 2 * y
-        if 2 * (err - x) + 1 > 0:
-            x -= 1
-            err += 1 - 2 * x
+    # Untuk radius besar, gunakan algoritma kita: semua titik dihitung sebagai array
+    dx, dy = _circle_outline(radius)
+    xs = center_x + dx
+    ys = center_y + dy
+    inside = (xs >= 0) & (xs < surface.get_width()) & (ys >= 0) & (ys < surface.get_height())
+    xs, ys = xs[inside], ys[inside]
+    if len(xs) == 0:
+        return
     
-    # Draw all points
-    for point in points:
-        if 0 <= point[0] < surface.get_width() and 0 <= point[1] < surface.get_height():
+    if surface.get_bytesize() not in (3, 4):
+        # Format tanpa view surfarray: blend per piksel
+        for point in zip(xs.tolist(), ys.tolist()):
             if len(color) == 4:  # Handle alpha
-                # Simple alpha blending
                 existing = surface.get_at(point)
                 alpha = color[3] / 255.0
                 blended = (
@@ -58,6 +74,28 @@ def draw_circle_midpoint(surface, center_x, center_y, radius, color):
                 surface.set_at(point, blended)
             else:
                 surface.set_at(point, color)
+        return
+    
+    # Blend semua titik sekaligus langsung di piksel surface
+    pixels = pygame.surfarray.pixels3d(surface)
+    try:
+        rgb = np.array(color[:3], dtype=np.float64)
+        if len(color) == 4:  # Handle alpha
+            alpha = color[3] / 255.0
+            existing = pixels[xs, ys].astype(np.float64)
+            pixels[xs, ys] = (rgb * alpha + existing * (1 - alpha)).astype(np.uint8)
+        else:
+            pixels[xs, ys] = rgb.astype(np.uint8)
+    finally:
+        del pixels
+    
+    # set_at dengan warna RGB menulis alpha 255; samakan untuk surface per-pixel alpha
+    if surface.get_flags() & pygame.SRCALPHA:
+        alphas = pygame.surfarray.pixels_alpha(surface)
+        try:
+            alphas[xs, ys] = 255
+        finally:
+            del alphas
 
 def draw_ellipse_orbit(surface, center_x, center_y, a, b, color):
     """Draw elliptical orbit with smooth lines"""
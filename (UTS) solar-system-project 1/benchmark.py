@@ -0,0 +1,190 @@
+# benchmark.py
+"""Benchmark headless untuk simulasi tata surya
+
+Jalankan:
+    python benchmark.py --scene --output hasil.json
+    python benchmark.py --scene --baseline hasil.json
+    python benchmark.py --scene --output      (default: benchmark_scene.json di folder ini)
+    python benchmark.py --asteroids
+"""
+import os
+import argparse
+import contextlib
+import json
+import random
+import time
+
+# Window tidak dibuka: pakai driver dummy sebelum pygame diinisialisasi di main
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Asset dimuat lewat main.ASSET_DIR; hasil default disimpan di samping file ini
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULT = os.path.join(BENCH_DIR, "benchmark_scene.json")
+
+import main
+from sprite_cache import rotation_cache
+
+ASTEROID_COUNTS = [150, 1000, 10000, 100000, 1000000]
+
+def bench_asteroid_belt(counts=ASTEROID_COUNTS, frames=30, zoom=1.0, seed=0):
+    """Ukur waktu update + draw AsteroidBelt per frame untuk berbagai jumlah asteroid"""
+    # Target offscreen: belt tidak butuh window
+    target = main.FrameBuffer(main.pygame.Surface((main.WIDTH, main.HEIGHT)))
+    results = []
+    for count in counts:
+        random.seed(seed)
+        belt = main.AsteroidBelt(280, 320, count)
+        frame_times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            belt.set_time(len(frame_times) / main.FPS)
+            belt.draw(target, 0, 0, zoom)
+            target.flush()
+            frame_times.append(time.perf_counter() - start)
+
+        frame_times.sort()
+        results.append({
+            "asteroids": count,
+            "drawn": belt.stats["drawn"],
+            "mean_ms": sum(frame_times) / len(frame_times) * 1000,
+            "p50_ms": frame_times[len(frame_times) // 2] * 1000,
+            "max_ms": frame_times[-1] * 1000
+        })
+    return results
+
+def percentile(sorted_values, q):
+    """Persentil (nearest-rank) dari list yang sudah diurutkan"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def summarize(samples):
+    """mean / p50 / p95 / p99 dalam milidetik"""
+    values = sorted(samples)
+    return {
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+    }
+
+def bench_scene(frames=300, warmup=30, seed=0, dt=None, zoom=1.0, comets=5):
+    """Jalankan Scene penuh secara deterministik dan catat waktu setiap fase
+
+    random di-seed, dt tetap dan clock.tick tidak dipanggil sehingga setiap
+    run menggambar frame yang sama persis. Frame warmup tidak dicatat
+    (mengisi cache sprite dan orbit).
+    """
+    if dt is None:
+        dt = 1 / main.FPS
+    target = main.create_window()
+    random.seed(seed)
+    scene = main.Scene()
+    scene.zoom = zoom
+    
+    names = ('update',) + main.Scene.PHASES + ('flip', 'frame')
+    timings = {name: [] for name in names}
+    recording = [False]
+    
+    @contextlib.contextmanager
+    def phase(name):
+        start = time.perf_counter()
+        yield
+        if recording[0]:
+            timings[name].append(time.perf_counter() - start)
+    
+    for frame in range(warmup + frames):
+        recording[0] = frame >= warmup
+        frame_start = time.perf_counter()
+        
+        # Jumlah komet dijaga tetap supaya beban setiap frame sebanding
+        while len(scene.comets) < comets:
+            scene.comets.append(main.Comet())
+        
+        with phase('update'):
+            scene.update(dt)
+        scene.draw(target, 1 / dt, phase)
+        with phase('flip'):
+            main.pygame.display.flip()
+        
+        if recording[0]:
+            timings['frame'].append(time.perf_counter() - frame_start)
+    
+    return {
+        "config": {"frames": frames, "warmup": warmup, "seed": seed, "dt": dt,
+                   "zoom": zoom, "comets": comets,
+                   "resolution": [main.WIDTH, main.HEIGHT]},
+        "phases": {name: summarize(timings[name]) for name in names},
+        # Jumlah benda per level LOD pada frame terakhir dan total pergantian level
+        "lod": scene.lod.frame_counts(),
+        "lod_switches": scene.lod.switches,
+        # Cache sprite per level LOD dan cache rotasi bersama: hit rate dan memori
+        "sprite_cache": {main.LOD_NAMES[level]: cache.stats()
+                         for level, cache in main.lod_sprite_caches.items()},
+        "rotation_cache": rotation_cache.stats(),
+    }
+
+def print_scene_results(result, baseline=None):
+    header = f"{'fase':>12} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    if baseline:
+        header += f" {'base p50':>9} {'rasio':>7}"
+    print(header)
+    for name, row in result["phases"].items():
+        line = (f"{name:>12} {row['mean_ms']:>9.3f} {row['p50_ms']:>9.3f} "
+                f"{row['p95_ms']:>9.3f} {row['p99_ms']:>9.3f}")
+        base = baseline["phases"].get(name) if baseline else None
+        if base:
+            ratio = row['p50_ms'] / base['p50_ms'] if base['p50_ms'] else float('inf')
+            line += f" {base['p50_ms']:>9.3f} {ratio:>6.2f}x"
+        print(line)
+    if "lod" in result:
+        levels = " ".join(f"{name}={count}" for name, count in result["lod"].items())
+        print(f"LOD: {levels} (pergantian level: {result['lod_switches']})")
+    for name, stats in result.get("sprite_cache", {}).items():
+        print(f"cache sprite {name}: {stats['entries']} sprite, {stats['resident_bytes'] / 1024:.0f} KiB, "
+              f"hit rate {stats['hit_rate']:.1%}")
+    # Cache rotasi hanya dipakai SolarSystem; scene main cukup memakai cache sprite
+    stats = result.get("rotation_cache")
+    if stats and stats['hits'] + stats['misses']:
+        print(f"cache rotasi: {stats['entries']} sprite, {stats['resident_bytes'] / 1024:.0f} KiB, "
+              f"hit rate {stats['hit_rate']:.1%} ({stats['steps']} bucket)")
+
+def print_asteroid_results(results):
+    print(f"{'asteroid':>10} {'terlihat':>10} {'mean ms':>10} {'p50 ms':>10} {'max ms':>10}")
+    for row in results:
+        print(f"{row['asteroids']:>10} {row['drawn']:>10} {row['mean_ms']:>10.2f} "
+              f"{row['p50_ms']:>10.2f} {row['max_ms']:>10.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark headless simulasi tata surya")
+    parser.add_argument("--scene", action="store_true", help="waktu per fase untuk satu scene penuh")
+    parser.add_argument("--asteroids", action="store_true", help="scaling AsteroidBelt 150 - 1M asteroid")
+    parser.add_argument("--frames", type=int, default=None)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=None, help="langkah waktu tetap (detik)")
+    parser.add_argument("--zoom", type=float, default=1.0)
+    parser.add_argument("--comets", type=int, default=5)
+    parser.add_argument("--output", nargs="?", const=DEFAULT_RESULT,
+                        help="simpan hasil --scene sebagai JSON (tanpa nilai: benchmark_scene.json)")
+    parser.add_argument("--baseline", nargs="?", const=DEFAULT_RESULT,
+                        help="bandingkan hasil --scene dengan JSON sebelumnya (tanpa nilai: benchmark_scene.json)")
+    args = parser.parse_args()
+
+    if args.scene:
+        result = bench_scene(frames=args.frames or 300, warmup=args.warmup, seed=args.seed,
+                             dt=args.dt, zoom=args.zoom, comets=args.comets)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        print_scene_results(result, baseline)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+    elif args.asteroids:
+        print_asteroid_results(bench_asteroid_belt(frames=args.frames or 30, zoom=args.zoom))
+    else:
+        parser.print_help()
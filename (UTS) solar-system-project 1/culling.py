@@ -0,0 +1,76 @@
+# culling.py
+import math
+import numpy as np
+
+TWO_PI = 2 * math.pi
+
+def circle_visible(cx, cy, radius, width, height):
+    """Apakah lingkaran (screen space) beririsan dengan layar width x height"""
+    return cx + radius >= 0 and cx - radius < width and cy + radius >= 0 and cy - radius < height
+
+def segments_visible(x0, y0, x1, y1, width, height):
+    """Mask segmen garis yang bounding box-nya beririsan dengan layar (vektor)"""
+    return ~(((x0 < 0) & (x1 < 0)) | ((x0 >= width) & (x1 >= width)) |
+             ((y0 < 0) & (y1 < 0)) | ((y0 >= height) & (y1 >= height)))
+
+def annulus_angle_ranges(x0, y0, x1, y1, inner, outer):
+    """Rentang sudut cincin inner..outer (berpusat di origin) yang bisa terlihat di rect
+
+    Rect (x0, y0, x1, y1) dalam koordinat relatif pusat cincin. Hasilnya list
+    (a0, a1) di dalam 0..2pi: kosong jika rect tidak menyentuh cincin,
+    [(0, 2pi)] jika rect memuat pusat. Hasil bersifat konservatif.
+    """
+    near_x = min(max(0.0, x0), x1)
+    near_y = min(max(0.0, y0), y1)
+    corners = ((x0, y0), (x1, y0), (x0, y1), (x1, y1))
+    if math.hypot(near_x, near_y) > outer or max(math.hypot(x, y) for x, y in corners) < inner:
+        return []
+    if x0 <= 0 <= x1 and y0 <= 0 <= y1:
+        return [(0.0, TWO_PI)]
+
+    # Rect konveks tanpa origin: rentang sudutnya dibatasi sudut sudut-sudut rect,
+    # komplemennya adalah celah terbesar di antara sudut-sudut tersebut
+    angles = sorted(math.atan2(y, x) % TWO_PI for x, y in corners)
+    gaps = [(angles[(i + 1) % 4] - angles[i]) % TWO_PI for i in range(4)]
+    widest = max(range(4), key=gaps.__getitem__)
+    start = angles[(widest + 1) % 4]
+    end = angles[widest]
+    if start <= end:
+        return [(start, end)]
+    return [(start, TWO_PI), (0.0, end)]
+
+class AngularGrid:
+    """Grid seragam per sektor sudut untuk query 'siapa yang ada di rentang sudut ini'
+
+    Setiap sel menyimpan indeks anggotanya, sehingga biaya query sebanding
+    dengan jumlah anggota di sel yang disentuh, bukan total anggota.
+    """
+
+    def __init__(self, angles, sectors=64):
+        self.sectors = sectors
+        self.cell_width = TWO_PI / sectors
+        cell = np.minimum((np.mod(angles, TWO_PI) / self.cell_width).astype(np.intp), sectors - 1)
+        self.order = np.argsort(cell, kind='stable')
+        self.starts = np.searchsorted(cell[self.order], np.arange(sectors + 1))
+
+    def query(self, ranges):
+        """Indeks terurut naik di sel yang beririsan dengan ranges; None berarti semua
+
+        Rentang boleh keluar dari 0..2pi (misal setelah ditambah drift).
+        """
+        cells = np.zeros(self.sectors, dtype=bool)
+        for a0, a1 in ranges:
+            if a1 - a0 >= TWO_PI - self.cell_width:
+                return None
+            first = math.floor(a0 / self.cell_width)
+            last = math.floor(a1 / self.cell_width)
+            cells[np.arange(first, last + 1) % self.sectors] = True
+
+        if cells.all():
+            return None
+        parts = [self.order[self.starts[c]:self.starts[c + 1]] for c in np.flatnonzero(cells).tolist()]
+        if not parts:
+            return np.zeros(0, dtype=np.intp)
+        index = np.concatenate(parts)
+        index.sort()
+        return index
@@ -0,0 +1,197 @@
+# dirty_regions.py
+import math
+import numpy as np
+import pygame
+
+# Koordinat box dipotong ke rentang ini agar satu baris muat dalam satu key uint64
+BOX_LIMIT = 1 << 13
+
+def _row_keys(rows):
+    """Satu key uint64 per baris (x0, y0, x1, y1[, extra 0..255])"""
+    coords = np.clip(rows[:, :4], -BOX_LIMIT, BOX_LIMIT - 1) + BOX_LIMIT
+    keys = np.zeros(len(rows), dtype=np.uint64)
+    for column in range(4):
+        keys = (keys << np.uint64(14)) | coords[:, column].astype(np.uint64)
+    if rows.shape[1] > 4:
+        keys = (keys << np.uint64(8)) | (rows[:, 4] & 255).astype(np.uint64)
+    return keys
+
+def _unmatched_rows(pairs):
+    """Baris yang hanya ada di salah satu sisi untuk setiap pasangan (lama, baru)
+
+    Semua pasangan diproses dengan satu lexsort: baris dikelompokkan per
+    (pasangan, key), dan kelompok yang muncul di kedua sisi dibuang.
+    """
+    arrays = [rows for pair in pairs for rows in pair]
+    rows = np.concatenate([a[:, :5] if a.shape[1] > 4 else np.pad(a, ((0, 0), (0, 1))) for a in arrays])
+    source = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+    pair, side = source >> 1, source & 1
+    keys = _row_keys(rows)
+
+    order = np.lexsort((keys, pair))
+    keys, pair, side = keys[order], pair[order], side[order]
+    starts = np.flatnonzero(np.concatenate(([True], (keys[1:] != keys[:-1]) | (pair[1:] != pair[:-1]))))
+    matched = np.minimum.reduceat(side, starts) != np.maximum.reduceat(side, starts)
+    unmatched = ~np.repeat(matched, np.diff(np.append(starts, len(keys))))
+    return rows[order[unmatched]]
+
+def segment_boxes(x0, y0, x1, y1):
+    """Box per segmen garis; kolom kelima arah segmen (rasterisasi tidak simetris)"""
+    x0, y0, x1, y1 = (np.asarray(a, dtype=np.int64) for a in (x0, y0, x1, y1))
+    direction = (x1 >= x0).astype(np.int64) | ((y1 >= y0).astype(np.int64) << 1)
+    return np.column_stack((np.minimum(x0, x1), np.minimum(y0, y1),
+                            np.maximum(x0, x1) + 1, np.maximum(y0, y1) + 1, direction))
+
+class LayerBounds:
+    """Bounding box layar setiap item yang digambar pada satu frame
+
+    Item (benda, trail, komet, bintang, asteroid) punya key unik, state
+    (input render selain posisi, misal sudut rotasi) dan baris box
+    (x0, y0, x1, y1) dalam piksel, x1/y1 eksklusif. Kolom kelima opsional
+    (0..255) hanya ikut dibandingkan, misal kecerahan bintang. Rect yang
+    pasti berubah (widget UI yang di-render ulang) dicatat lewat mark().
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        # Dict baru (bukan dikosongkan) karena DirtyRegions menyimpan milik frame lalu
+        self.items = {}
+        self.marked = []
+
+    def add(self, key, state, boxes):
+        boxes = np.asarray(boxes, dtype=np.int64)
+        if boxes.size == 0:
+            boxes = np.zeros((0, 4), dtype=np.int64)
+        self.items[key] = (state, boxes.reshape(len(boxes) if boxes.ndim > 1 else 1, -1))
+
+    def add_circle(self, key, state, x, y, radius):
+        """Item satu lingkaran berpusat (x, y)"""
+        x, y, r = int(x), int(y), int(math.ceil(radius)) + 1
+        self.add(key, state, [(x - r, y - r, x + r + 1, y + r + 1)])
+
+    def mark(self, rect):
+        self.marked.append(tuple(pygame.Rect(rect)))
+
+class DirtyRegions:
+    """Cari area layar yang berubah sejak frame terakhir yang ditampilkan
+
+    Jalur utama (collect_layers) menandai tile dari box item yang berubah:
+    box lama dan box baru setiap benda, komet dan trail, plus rect widget
+    UI yang di-render ulang. collect() membandingkan seluruh frame per
+    piksel dan hanya dipakai sebagai fallback jika bounds tidak tersedia.
+    Tile yang berubah digabung menjadi satu rect per run horizontal,
+    siap untuk pygame.display.update(rects).
+    """
+
+    def __init__(self, tile=32):
+        self.tile = tile
+        self.previous = None
+        self.layers = None
+
+    def reset(self):
+        """Paksa frame berikutnya di-update penuh (misal setelah window expose)"""
+        self.previous = None
+        self.layers = None
+
+    def collect_layers(self, surface, bounds, key):
+        """List rect yang berubah menurut bounds (LayerBounds) frame ini
+
+        key merangkum input yang memengaruhi seluruh layar (kamera, zoom,
+        layer yang ditampilkan); jika berbeda dari frame lalu, seluruh
+        layar di-update.
+        """
+        full = [surface.get_rect()]
+        previous = self.layers
+        self.layers = (key, surface.get_size(), bounds.items)
+        # Fallback piksel berikutnya tidak punya salinan frame ini
+        self.previous = None
+        if previous is None or previous[:2] != self.layers[:2]:
+            return full
+
+        boxes = [np.array([(x, y, x + w, y + h) for x, y, w, h in bounds.marked],
+                          dtype=np.int64).reshape(-1, 4)]
+        old_items = previous[2]
+        pairs = []
+        for name, (state, current) in bounds.items.items():
+            old = old_items.get(name)
+            if old is None:
+                boxes.append(current)
+            elif old[0] != state or old[1].shape[1] != current.shape[1]:
+                boxes.extend((old[1], current))
+            elif np.array_equal(old[1], current):
+                continue
+            elif len(old[1]) <= 2 or len(current) <= 2:
+                boxes.extend((old[1], current))
+            else:
+                # Item berisi banyak box (trail, bintang): hanya box yang hilang atau baru
+                pairs.append((old[1], current))
+        for name in old_items.keys() - bounds.items.keys():
+            boxes.append(old_items[name][1])
+        if pairs:
+            boxes.append(_unmatched_rows(pairs))
+
+        boxes = np.concatenate([b[:, :4] for b in boxes])
+        if len(boxes) == 0:
+            return []
+
+        # Box -> rentang tile, dipotong ke layar
+        width, height = surface.get_size()
+        cols, rows = -(-width // self.tile), -(-height // self.tile)
+        x0 = np.clip(boxes[:, 0] // self.tile, 0, cols)
+        y0 = np.clip(boxes[:, 1] // self.tile, 0, rows)
+        x1 = np.clip(-(-boxes[:, 2] // self.tile), 0, cols)
+        y1 = np.clip(-(-boxes[:, 3] // self.tile), 0, rows)
+        keep = (x0 < x1) & (y0 < y1)
+        x0, y0, x1, y1 = x0[keep], y0[keep], x1[keep], y1[keep]
+        if len(x0) == 0:
+            return []
+
+        # Tandai semua box sekaligus lewat array selisih 2D lalu prefix sum
+        counts = np.zeros((cols + 1, rows + 1), dtype=np.int32)
+        np.add.at(counts, (x0, y0), 1)
+        np.add.at(counts, (x1, y0), -1)
+        np.add.at(counts, (x0, y1), -1)
+        np.add.at(counts, (x1, y1), 1)
+        tiles = counts.cumsum(axis=0).cumsum(axis=1)[:cols, :rows] > 0
+        return self.tile_rects(tiles, full[0])
+
+    def collect(self, surface):
+        """List rect yang berubah lewat diff piksel penuh (kosong jika frame identik)"""
+        full = [surface.get_rect()]
+        self.layers = None
+        if surface.get_bytesize() != 4:
+            return full
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            if self.previous is None or self.previous.shape != pixels.shape:
+                self.previous = pixels.copy()
+                return full
+
+            changed = pixels != self.previous
+            if not changed.any():
+                return []
+            self.previous[...] = pixels
+        finally:
+            # Lepas lock surface sebelum display.update
+            del pixels
+
+        # OR per tile (tile terakhir boleh lebih kecil)
+        width, height = changed.shape
+        tiles = np.logical_or.reduceat(changed, np.arange(0, width, self.tile), axis=0)
+        tiles = np.logical_or.reduceat(tiles, np.arange(0, height, self.tile), axis=1)
+        return self.tile_rects(tiles, full[0])
+
+    def tile_rects(self, tiles, clip):
+        """Gabungkan tile berubah (kolom, baris) menjadi rect per run horizontal"""
+        # Tepi run per baris tile; padding nol di kedua ujung setiap baris
+        padded = np.zeros((tiles.shape[1], tiles.shape[0] + 2), dtype=np.int8)
+        padded[:, 1:-1] = tiles.T
+        edges = np.diff(padded, axis=1)
+        ty, start = np.nonzero(edges == 1)
+        _, end = np.nonzero(edges == -1)
+        tile = self.tile
+        return [pygame.Rect(x0 * tile, y * tile, (x1 - x0) * tile, tile).clip(clip)
+                for y, x0, x1 in zip(ty.tolist(), start.tolist(), end.tolist())]
@@ -0,0 +1,189 @@
+# framebuffer.py
+import pygame
+import numpy as np
+
+class FrameBuffer:
+    """Framebuffer berbasis view NumPy (pygame.surfarray) untuk rasterizer manual.
+
+    Setiap primitif menulis seluruh array indeks pikselnya dalam satu scatter.
+    View dikunci secara lazy dan dilepas lewat flush() sekali per frame
+    (atau sebelum blit). Mode referensi (use_numpy=False) tetap memakai
+    jalur set_at per piksel.
+    """
+
+    def __init__(self, surface, use_numpy=True):
+        self.surface = surface
+        self.use_numpy = use_numpy
+        self.width, self.height = surface.get_size()
+        self.has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        # Surface 32-bit dengan kanal 8-bit bisa ditulis sebagai satu uint32 per piksel
+        self.mapped = surface.get_bytesize() == 4 and surface.get_losses()[:3] == (0, 0, 0)
+        self._pixels = None
+        self._alpha = None
+        self._pixels2d = None
+
+    @property
+    def pixels(self):
+        """View pixels3d (x, y, rgb) dari surface target"""
+        if self._pixels is None:
+            self._pixels = pygame.surfarray.pixels3d(self.surface)
+        return self._pixels
+
+    @property
+    def pixels2d(self):
+        """View pixels2d (x, y) berisi nilai piksel yang sudah di-map"""
+        if self._pixels2d is None:
+            self._pixels2d = pygame.surfarray.pixels2d(self.surface)
+        return self._pixels2d
+
+    def map_gray(self, gray):
+        """Map array abu-abu uint8 ke nilai piksel uint32 (alpha penuh)"""
+        gray = gray.astype(np.uint32)
+        r_shift, g_shift, b_shift, a_shift = self.surface.get_shifts()
+        mapped = (gray << r_shift) | (gray << g_shift) | (gray << b_shift)
+        if self.surface.get_masks()[3]:
+            mapped |= np.uint32(255 << a_shift)
+        return mapped
+
+    @property
+    def alpha(self):
+        """View pixels_alpha (x, y), hanya untuk surface SRCALPHA"""
+        if self._alpha is None:
+            self._alpha = pygame.surfarray.pixels_alpha(self.surface)
+        return self._alpha
+
+    def clip(self, xs, ys):
+        """Buang indeks yang berada di luar surface"""
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        mask = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return xs[mask], ys[mask]
+
+    def plot(self, xs, ys, color, clip=True):
+        """Scatter satu warna ke semua piksel (xs, ys) sekaligus
+
+        clip=False hanya untuk indeks yang sudah dijamin berada di dalam surface.
+        """
+        if clip:
+            xs, ys = self.clip(xs, ys)
+        if len(xs) == 0:
+            return
+
+        if self.use_numpy and self.mapped:
+            # map_rgb mengikuti format surface, sama seperti set_at
+            self.pixels2d[xs, ys] = self.surface.map_rgb(color)
+        elif self.use_numpy:
+            # Surface display tidak punya kanal alpha, sama seperti set_at
+            self.pixels[xs, ys] = color[:3]
+            if self.has_alpha:
+                self.alpha[xs, ys] = color[3] if len(color) == 4 else 255
+        else:
+            # Mode referensi: jalur set_at per piksel
+            for px, py in zip(xs.tolist(), ys.tolist()):
+                self.surface.set_at((px, py), color)
+
+    def plot_colors(self, xs, ys, colors):
+        """Scatter dengan warna per piksel (colors berbentuk (n, 3) atau (n,) abu-abu)"""
+        xs = np.asarray(xs, dtype=np.intp)
+        ys = np.asarray(ys, dtype=np.intp)
+        colors = np.asarray(colors)
+        mask = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys, colors = xs[mask], ys[mask], colors[mask]
+        if len(xs) == 0:
+            return
+        if self.use_numpy and self.mapped and colors.ndim == 1:
+            self.pixels2d[xs, ys] = self.map_gray(colors)
+            return
+        if colors.ndim == 1:
+            colors = colors[:, None]
+
+        if self.use_numpy:
+            self.pixels[xs, ys] = colors
+            if self.has_alpha:
+                self.alpha[xs, ys] = 255
+        else:
+            colors = np.broadcast_to(colors, (len(xs), 3)).tolist()
+            for px, py, color in zip(xs.tolist(), ys.tolist(), colors):
+                self.surface.set_at((px, py), color)
+
+    def plot_points(self, points, color):
+        """Scatter dari list titik (x, y) hasil rasterizer lama"""
+        if len(points) == 0:
+            return
+        points = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+        self.plot(points[:, 0], points[:, 1], color)
+
+    def clip_spans(self, spans):
+        """Potong span (y, x_start, x_end) ke batas surface"""
+        clipped = []
+        for y, x_start, x_end in spans:
+            if 0 <= y < self.height:
+                x_start = max(0, x_start)
+                x_end = min(self.width - 1, x_end)
+                if x_start <= x_end:
+                    clipped.append((y, x_start, x_end))
+        return clipped
+
+    def fill_spans(self, spans, color):
+        """Isi setiap span horizontal dengan satu slice assignment"""
+        spans = self.clip_spans(spans)
+        if not spans:
+            return
+
+        if self.use_numpy and self.mapped:
+            pixels = self.pixels2d
+            value = self.surface.map_rgb(color)
+            for y, x_start, x_end in spans:
+                pixels[x_start:x_end + 1, y] = value
+        elif self.use_numpy:
+            pixels = self.pixels
+            rgb = color[:3]
+            for y, x_start, x_end in spans:
+                pixels[x_start:x_end + 1, y] = rgb
+            if self.has_alpha:
+                alpha = self.alpha
+                a = color[3] if len(color) == 4 else 255
+                for y, x_start, x_end in spans:
+                    alpha[x_start:x_end + 1, y] = a
+        else:
+            for y, x_start, x_end in spans:
+                for px in range(x_start, x_end + 1):
+                    self.surface.set_at((px, y), color)
+
+    def blend_spans(self, spans, color):
+        """Rata-ratakan warna span dengan isi surface (alpha menjadi 255)"""
+        spans = self.clip_spans(spans)
+        if not spans:
+            return
+
+        if self.use_numpy:
+            pixels = self.pixels
+            rgb = np.array(color[:3], dtype=np.uint16)
+            for y, x_start, x_end in spans:
+                row = pixels[x_start:x_end + 1, y]
+                row[:] = (row + rgb) // 2
+            if self.has_alpha:
+                alpha = self.alpha
+                for y, x_start, x_end in spans:
+                    alpha[x_start:x_end + 1, y] = 255
+        else:
+            for y, x_start, x_end in spans:
+                for px in range(x_start, x_end + 1):
+                    current = self.surface.get_at((px, y))
+                    self.surface.set_at((px, y), (
+                        (current[0] + color[0]) // 2,
+                        (current[1] + color[1]) // 2,
+                        (current[2] + color[2]) // 2,
+                        255
+                    ))
+
+    def blit(self, source, dest, area=None):
+        """Blit ke surface target (view harus dilepas dulu)"""
+        self.flush()
+        return self.surface.blit(source, dest, area)
+
+    def flush(self):
+        """Lepas view NumPy sehingga surface siap di-blit dan ditampilkan"""
+        self._pixels = None
+        self._alpha = None
+        self._pixels2d = None
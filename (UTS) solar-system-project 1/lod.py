@@ -0,0 +1,58 @@
+# lod.py
+
+class LodSelector:
+    """Pemilih level detail berdasarkan radius piksel, dengan hysteresis
+
+    table memetakan jenis benda ke radius minimum (naik) untuk masuk setiap
+    level, misal {'planet': (0.0, 1.5, 3.0, 12.0)}. Naik level hanya jika
+    radius melewati ambang * (1 + hysteresis), turun hanya jika radius di
+    bawah ambang * (1 - hysteresis), sehingga zoom di sekitar ambang tidak
+    membuat level berganti-ganti setiap frame.
+    """
+
+    def __init__(self, table, names, hysteresis=0.15):
+        self.table = table
+        self.names = tuple(names)
+        self.hysteresis = hysteresis
+        self.levels = {}
+        self.counts = [0] * len(self.names)
+        self.switches = 0
+
+    def target_level(self, kind, radius):
+        level = 0
+        for i, threshold in enumerate(self.table[kind]):
+            if radius >= threshold:
+                level = i
+        return level
+
+    def select(self, key, kind, radius, count=True):
+        """Level untuk benda key (jenis kind) dengan radius piksel radius
+
+        count=False untuk benda yang tidak digambar (di luar layar): state
+        hysteresis tetap diperbarui tapi tidak masuk counter frame.
+        """
+        thresholds = self.table[kind]
+        level = self.levels.get(key)
+        if level is None:
+            level = self.target_level(kind, radius)
+        else:
+            previous = level
+            while level + 1 < len(thresholds) and radius >= thresholds[level + 1] * (1 + self.hysteresis):
+                level += 1
+            while level > 0 and radius < thresholds[level] * (1 - self.hysteresis):
+                level -= 1
+            if level != previous:
+                self.switches += 1
+
+        self.levels[key] = level
+        if count:
+            self.counts[level] += 1
+        return level
+
+    def begin_frame(self):
+        """Reset counter per frame"""
+        self.counts = [0] * len(self.names)
+
+    def frame_counts(self):
+        """Jumlah benda per level pada frame ini"""
+        return dict(zip(self.names, self.counts))
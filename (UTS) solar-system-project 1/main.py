@@ -2,7 +2,19 @@ import pygame
 import math
 import random
 import os
-from pygame import gfxdraw
+import time
+import contextlib
+import numpy as np
+from framebuffer import FrameBuffer
+from sprite_cache import SpriteCache
+from ui import RetainedPanel, fonts, label_cache, render_label
+from trail import TrailBuffer
+from profiler import FrameProfiler
+from sim_clock import SimulationClock, circular_angles, circular_positions
+from dirty_regions import DirtyRegions, LayerBounds, segment_boxes
+from culling import circle_visible, segments_visible, annulus_angle_ranges, AngularGrid
+from lod import LodSelector
+from picking import PickGrid
 
 # Initialize Pygame
 pygame.init()
@@ -10,9 +22,57 @@ pygame.init()
 # Constants
 WIDTH, HEIGHT = 1200, 800
 CENTER_X, CENTER_Y = WIDTH // 2, HEIGHT // 2
+# Folder gambar planet, relatif terhadap file ini (bukan working directory)
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 FPS = 60
+FPS_BUCKET = 1.0  # Panel FPS hanya di-render ulang jika nilai melewati bucket ini
+
+# Profiler per fase: kapasitas ring buffer (frame) dan interval refresh overlay (frame)
+PROFILER_CAPACITY = 600
+PROFILER_REFRESH = 10
+
+# Fixed timestep: simulasi SIM_HZ langkah/detik, render RENDER_FPS frame/detik.
+# MAX_CATCH_UP membatasi langkah per frame agar frame lambat tidak memicu spiral.
+SIM_HZ = 60
+RENDER_FPS = FPS
+MAX_CATCH_UP = 8
+
+# Jarak maksimum label nama planet dari tepi planet (piksel), untuk culling
+LABEL_EXTENT = 140
+
+# Grid sudut asteroid dibangun ulang saat sebaran drift (radian) melewati ini
+ASTEROID_REINDEX_DRIFT = math.pi / 8
+
+# Lompatan waktu simulasi (detik) untuk tombol [ dan ]
+SEEK_STEP = 600.0
+
+# Radius klik minimum (piksel) agar planet kecil saat zoom out tetap bisa dipilih
+MIN_PICK_RADIUS = 6
+# Asteroid ikut index picking (ratusan lingkaran kecil; default mati)
+PICK_ASTEROIDS = False
+
+# True: rasterizer menulis lewat view NumPy, False: jalur referensi set_at
+USE_NUMPY_FRAMEBUFFER = True
+
+# Sprite cache planet detail: batas memori dan jumlah bucket sudut rotasi
+SPRITE_CACHE_BYTES = 32 * 1024 * 1024
+SPRITE_ANGLE_STEPS = 72
+
+# Level detail benda langit, dipilih dari radius piksel hasil proyeksi
+LOD_POINT, LOD_DISC, LOD_SPRITE, LOD_FULL = range(4)
+LOD_NAMES = ('point', 'disc', 'sprite', 'full')
+# Radius piksel minimum untuk masuk setiap level, per jenis benda
+LOD_TABLE = {
+    'sun': (0.0, 1.0, 5.0, 9.0),
+    'planet': (0.0, 1.5, 3.0, 6.0),
+}
+# Margin relatif di sekitar ambang agar level tidak berganti-ganti saat zoom
+LOD_HYSTERESIS = 0.15
+# Level sprite memakai bucket sudut lebih kasar (sprite kecil, rotasi tidak terlihat);
+# tampilannya (gambar atau tekstur prosedural) sama dengan level penuh
+LOD_SPRITE_ANGLE_STEPS = SPRITE_ANGLE_STEPS // 4
 
 # Colors for planets (if images not found)
 SUN_COLOR = (255, 223, 0)
@@ -25,10 +85,12 @@ SATURN_COLOR = (244, 214, 49)
 URANUS_COLOR = (173, 216, 230)
 NEPTUNE_COLOR = (65, 105, 225)
 
-# Create window
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("SISTEM TATA SURYA 2D - UTS GRAFIKA KOMPUTER")
-clock = pygame.time.Clock()
+planet_sprite_cache = SpriteCache(SPRITE_CACHE_BYTES)
+# Cache terpisah per level sehingga sprite kecil tidak mengusir sprite detail penuh
+lod_sprite_caches = {
+    LOD_SPRITE: SpriteCache(SPRITE_CACHE_BYTES // 4),
+    LOD_FULL: planet_sprite_cache,
+}
 
 # ==================== ALGORITMA MANUAL ====================
 
@@ -63,6 +125,41 @@ def bresenham_line(x1, y1, x2, y2):
     points.append((int(x), int(y)))
     return points
 
+def bresenham_lines(x1, y1, x2, y2):
+    """Bresenham Line Algorithm untuk banyak segmen sekaligus (NumPy)
+
+    Menghasilkan piksel yang sama dengan bresenham_line untuk setiap
+    segmen, dikembalikan sebagai dua array (xs, ys) gabungan.
+    """
+    x1 = np.asarray(x1, dtype=np.int64).ravel()
+    y1 = np.asarray(y1, dtype=np.int64).ravel()
+    x2 = np.asarray(x2, dtype=np.int64).ravel()
+    y2 = np.asarray(y2, dtype=np.int64).ravel()
+    if len(x1) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    
+    dx = np.abs(x2 - x1)
+    dy = np.abs(y2 - y1)
+    sx = np.where(x1 > x2, -1, 1)
+    sy = np.where(y1 > y2, -1, 1)
+    x_major = dx > dy
+    major = np.maximum(np.where(x_major, dx, dy), 1)
+    minor = np.where(x_major, dy, dx)
+    
+    # Langkah ke-k pada sumbu mayor, satu segmen punya (major + 1) titik
+    counts = np.where(x_major, dx, dy) + 1
+    seg = np.repeat(np.arange(len(x1)), counts)
+    starts = np.cumsum(counts) - counts
+    k = np.arange(counts.sum()) - starts[seg]
+    
+    # Jumlah langkah sumbu minor setelah k langkah (err awal = major / 2)
+    m = -((major[seg] - 2 * k * minor[seg]) // (2 * major[seg]))
+    
+    xs = x1[seg] + sx[seg] * np.where(x_major[seg], k, m)
+    ys = y1[seg] + sy[seg] * np.where(x_major[seg], m, k)
+    return xs, ys
+
 def midpoint_circle(cx, cy, radius, fill=True):
     """Midpoint Circle Algorithm"""
     points = []
@@ -92,80 +189,331 @@ def midpoint_circle(cx, cy, radius, fill=True):
     
     return list(set(points))
 
-def scanline_polygon(polygon_points, color):
-    """Scanline Polygon Algorithm"""
-    if len(polygon_points) < 3:
-        return
+def midpoint_circle_spans(cx, cy, radius):
+    """Midpoint Circle Algorithm versi span untuk lingkaran terisi
+
+    Mengembalikan satu run (y, x_start, x_end) per scanline, berisi piksel
+    yang sama dengan midpoint_circle(fill=True) tanpa alokasi per piksel.
+    """
+    if radius < 0:
+        return []
     
-    # Find y min and max
-    y_min = min(p[1] for p in polygon_points)
-    y_max = max(p[1] for p in polygon_points)
+    # Setengah lebar terbesar untuk setiap jarak baris dari pusat
+    half_width = [0] * (radius + 1)
+    x = radius
+    y = 0
+    err = 0
     
-    # Process each scanline
-    for y in range(int(y_min), int(y_max) + 1):
-        intersections = []
+    while x >= y:
+        if x > half_width[y]:
+            half_width[y] = x
+        if y > half_width[x]:
+            half_width[x] = y
         
-        # Find intersections with each edge
-        for i in range(len(polygon_points)):
-            p1 = polygon_points[i]
-            p2 = polygon_points[(i + 1) % len(polygon_points)]
-            
-            # Skip horizontal edges
-            if p1[1] == p2[1]:
-                continue
-            
-            # Ensure p1 is above p2
-            if p1[1] > p2[1]:
-                p1, p2 = p2, p1
-            
-            # Check if scanline intersects this edge
-            if p1[1] <= y < p2[1]:
-                # Calculate intersection x
-                x_intersect = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                intersections.append(x_intersect)
-        
-        # Sort intersections and fill between pairs
-        intersections.sort()
-        for i in range(0, len(intersections), 2):
-            if i + 1 < len(intersections):
-                x_start = int(intersections[i])
-                x_end = int(intersections[i + 1])
-                for x in range(x_start, x_end + 1):
-                    pygame.draw.circle(screen, color, (x, y), 1)
+        y += 1
+        err += 1 + 2*y
+        if 2*(err - x) + 1 > 0:
+            x -= 1
+            err += 1 - 2*x
+    
+    spans = []
+    for dy in range(-radius, radius + 1):
+        w = half_width[abs(dy)]
+        spans.append((cy + dy, cx - w, cx + w))
+    return spans
+
+# Cache grid koordinat lingkaran per (ukuran surface, radius)
+_circle_grid_cache = {}
+MAX_CIRCLE_GRIDS = 64
+
+def circle_grid(surface_size, scaled_radius):
+    """Grid lingkaran terisi beserta peta sudutnya (dipakai ulang antar frame)
+
+    Semua array berukuran (surface_size, surface_size) dengan indeks [x, y]
+    seperti surfarray: mask lingkaran midpoint berjari-jari int(scaled_radius),
+    offset dx/dy dari pusat, dan sin/cos dari 2 * atan2(dy, dx).
+    """
+    key = (surface_size, scaled_radius)
+    grid = _circle_grid_cache.get(key)
+    if grid is not None:
+        return grid
+    
+    center = surface_size // 2
+    mask = np.zeros((surface_size, surface_size), dtype=bool)
+    for y, x_start, x_end in midpoint_circle_spans(center, center, int(scaled_radius)):
+        if 0 <= y < surface_size:
+            mask[max(0, x_start):min(surface_size - 1, x_end) + 1, y] = True
+    
+    dx, dy = np.indices((surface_size, surface_size)) - center
+    angle = np.arctan2(dy, dx)
+    grid = {
+        'mask': mask,
+        'dx': dx,
+        'dy': dy,
+        'sin2': np.where(mask, np.sin(angle * 2), 0).astype(np.float32),
+        'cos2': np.where(mask, np.cos(angle * 2), 0).astype(np.float32)
+    }
+    if len(_circle_grid_cache) >= MAX_CIRCLE_GRIDS:
+        _circle_grid_cache.clear()
+    _circle_grid_cache[key] = grid
+    return grid
+
+# Offset piksel lingkaran terisi per radius
+_circle_stamps = {}
+
+def circle_stamp(radius):
+    """Offset (ox, oy) piksel midpoint_circle_spans berjari-jari radius di sekitar (0, 0)"""
+    stamp = _circle_stamps.get(radius)
+    if stamp is None:
+        ox, oy = [], []
+        for y, x_start, x_end in midpoint_circle_spans(0, 0, radius):
+            ox.extend(range(x_start, x_end + 1))
+            oy.extend([y] * (x_end - x_start + 1))
+        stamp = (np.array(ox, dtype=np.intp), np.array(oy, dtype=np.intp))
+        _circle_stamps[radius] = stamp
+    return stamp
+
+def scanline_polygon_spans(polygon_points):
+    """Scanline Polygon Algorithm dengan edge table dan active edge list
+
+    Setiap edge dijalankan secara inkremental (x += dx/dy per scanline)
+    dan hasilnya berupa span horizontal (y, x_start, x_end).
+    """
+    if len(polygon_points) < 3:
+        return []
+    
+    # Edge table: edge dikelompokkan berdasarkan scanline pertamanya
+    edge_table = {}
+    for i in range(len(polygon_points)):
+        p1 = polygon_points[i]
+        p2 = polygon_points[(i + 1) % len(polygon_points)]
+        
+        # Skip horizontal edges
+        if p1[1] == p2[1]:
+            continue
+        
+        # Ensure p1 is above p2
+        if p1[1] > p2[1]:
+            p1, p2 = p2, p1
+        
+        # Scanline y aktif jika p1.y <= y < p2.y
+        y_start = math.ceil(p1[1])
+        y_end = math.ceil(p2[1])
+        if y_start >= y_end:
+            continue
+        
+        inv_slope = (p2[0] - p1[0]) / (p2[1] - p1[1])
+        x = p1[0] + (y_start - p1[1]) * inv_slope
+        edge_table.setdefault(y_start, []).append([y_end, x, inv_slope])
+    
+    if not edge_table:
+        return []
+    
+    spans = []
+    active_edges = []
+    y = min(edge_table)
+    last_start = max(edge_table)
+    while active_edges or y <= last_start:
+        # Tambah edge baru dan buang edge yang sudah selesai
+        active_edges.extend(edge_table.get(y, ()))
+        active_edges = [edge for edge in active_edges if edge[0] > y]
+        active_edges.sort(key=lambda edge: edge[1])
+        
+        # Fill between pairs
+        for i in range(0, len(active_edges) - 1, 2):
+            spans.append((y, int(active_edges[i][1]), int(active_edges[i + 1][1])))
+        
+        # Langkah inkremental ke scanline berikutnya
+        for edge in active_edges:
+            edge[1] += edge[2]
+        y += 1
+    
+    return spans
+
+def scanline_polygon(polygon_points, color, target):
+    """Scanline Polygon Algorithm
+
+    target boleh berupa FrameBuffer atau pygame.Surface. Setiap span diisi
+    dengan satu slice assignment atau satu fill.
+    """
+    spans = scanline_polygon_spans(polygon_points)
+    
+    if isinstance(target, FrameBuffer):
+        target.fill_spans(spans, color)
+    else:
+        for y, x_start, x_end in spans:
+            if x_end >= x_start:
+                target.fill(color, (x_start, y, x_end - x_start + 1, 1))
+
+def screen_center(target):
+    """Pusat proyeksi (titik dunia 0, 0 saat kamera di 0, 0) untuk target"""
+    return target.width // 2, target.height // 2
+
+def numpy_rng():
+    """Generator NumPy yang diturunkan dari state modul random (ikut random.seed)"""
+    return np.random.default_rng(random.getrandbits(64))
 
 class Starfield:
+    """Bintang latar disimpan sebagai kolom NumPy (struct-of-arrays)"""
+    
     def __init__(self, num_stars=200):
-        self.stars = []
-        for _ in range(num_stars):
-            x = random.randint(0, WIDTH)
-            y = random.randint(0, HEIGHT)
-            size = random.uniform(0.1, 1.5)
-            speed = random.uniform(0.01, 0.05)
-            twinkle_speed = random.uniform(0.01, 0.03)
-            self.stars.append([x, y, size, speed, twinkle_speed, 1.0, 0])
-    
-    def update(self):
-        for star in self.stars:
-            # Twinkle effect
-            star[5] = 0.5 + 0.5 * math.sin(star[6])
-            star[6] += star[4]
-    
-    def draw(self, offset_x=0, offset_y=0):
-        for x, y, size, speed, _, alpha, _ in self.stars:
-            # Apply parallax based on offset
-            parallax_x = x + offset_x * speed * 0.5
-            parallax_y = y + offset_y * speed * 0.5
-            
-            # Wrap around screen
-            parallax_x %= WIDTH
-            parallax_y %= HEIGHT
+        rng = numpy_rng()
+        x = rng.integers(0, WIDTH + 1, num_stars)
+        y = rng.integers(0, HEIGHT + 1, num_stars)
+        size = rng.uniform(0.1, 1.5, num_stars)
+        speed = rng.uniform(0.01, 0.05, num_stars)
+        twinkle_speed = rng.uniform(0.01, 0.03, num_stars)
+        
+        # Urutkan berdasarkan radius gambar agar setiap grup berupa slice
+        # (radius -1: bintang titik, size < 0.5)
+        radius = np.where(size < 0.5, -1, size.astype(np.intp))
+        order = np.argsort(radius, kind='stable')
+        self.x = x[order].astype(np.float32)
+        self.y = y[order].astype(np.float32)
+        self.size = size[order]
+        self.speed = (speed[order] * 0.5).astype(np.float32)  # Faktor parallax 0.5
+        self.twinkle_speed = twinkle_speed[order]
+        self.alpha = np.ones(num_stars)
+        self.twinkle_phase = np.zeros(num_stars)
+        
+        radius = radius[order]
+        self.draw_radius = np.maximum(radius, 0)
+        values, starts = np.unique(radius, return_index=True)
+        ends = list(starts[1:]) + [num_stars]
+        self.groups = [(int(r), slice(int(a), int(b))) for r, a, b in zip(values, starts, ends)]
+        
+        # Bintang besar digambar dengan stamp sprite lingkaran per radius
+        self.stamps = {}
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def stamp(self, radius):
+        """Offset piksel sprite lingkaran (cache per radius)"""
+        offsets = self.stamps.get(radius)
+        if offsets is None:
+            sprite = pygame.Surface((radius * 2 + 3, radius * 2 + 3))
+            pygame.draw.circle(sprite, WHITE, (radius + 1, radius + 1), radius)
+            ox, oy = np.nonzero(pygame.surfarray.array_red(sprite))
+            offsets = (ox - radius - 1, oy - radius - 1)
+            self.stamps[radius] = offsets
+        return offsets
+    
+    def update(self, dt):
+        # Twinkle effect (twinkle_speed per frame 1/FPS, jadi tidak bergantung laju update)
+        self.alpha = 0.5 + 0.5 * np.sin(self.twinkle_phase)
+        self.twinkle_phase += self.twinkle_speed * (dt * FPS)
+    
+    def seek(self, t):
+        """Fase twinkle setelah t detik (render offline per frame)"""
+        self.twinkle_phase = self.twinkle_speed * (t * FPS)
+        self.alpha = 0.5 + 0.5 * np.sin(self.twinkle_phase)
+    
+    def draw(self, target, offset_x=0, offset_y=0, bounds=None):
+        # Posisi bintang dibuat untuk layar WIDTH x HEIGHT, diregangkan ke ukuran target
+        scale_x = np.float32(target.width / WIDTH)
+        scale_y = np.float32(target.height / HEIGHT)
+        
+        # Apply parallax based on offset, lalu wrap around screen
+        parallax_x = np.mod(self.x * scale_x + np.float32(offset_x) * self.speed, target.width).astype(np.intp)
+        parallax_y = np.mod(self.y * scale_y + np.float32(offset_y) * self.speed, target.height).astype(np.intp)
+        gray = (255 * self.alpha).astype(np.uint8)
+        
+        if bounds is not None:
+            # Satu box per bintang; kecerahan ikut dibandingkan lewat kolom kelima
+            r = self.draw_radius + 1
+            bounds.add('stars', None, np.column_stack((parallax_x - r, parallax_y - r,
+                                                      parallax_x + r + 1, parallax_y + r + 1, gray)))
+        
+        for radius, group in self.groups:
+            if radius < 0:
+                # Bintang titik: satu scatter untuk semuanya
+                target.plot_colors(parallax_x[group], parallax_y[group], gray[group])
+                continue
             
-            # Draw star with alpha
-            color = (int(255 * alpha), int(255 * alpha), int(255 * alpha))
-            if size < 0.5:
-                screen.set_at((int(parallax_x), int(parallax_y)), color)
+            # Bintang besar: stamp sprite lingkaran untuk radius ini
+            ox, oy = self.stamp(radius)
+            if len(ox) == 0:
+                continue
+            xs = (parallax_x[group][:, None] + ox[None, :]).ravel()
+            ys = (parallax_y[group][:, None] + oy[None, :]).ravel()
+            target.plot_colors(xs, ys, np.repeat(gray[group], len(ox)))
+
+class OrbitCache:
+    """Geometri orbit world-space yang dipakai bersama CelestialBody.draw dan main loop
+
+    Titik lingkaran satuan disimpan sekali per langkah sudut sebagai array
+    NumPy; tiap frame hanya transformasi affine kamera/zoom yang dihitung.
+    Hasil rasterisasi dipakai ulang selama kamera dan zoom tidak berubah.
+    """
+    
+    def __init__(self):
+        self.unit_circles = {}
+        self.rasterized = {}
+        self.view = None
+    
+    def unit_circle(self, step):
+        """cos/sin untuk sudut 0..360 derajat dengan langkah step"""
+        circle = self.unit_circles.get(step)
+        if circle is None:
+            rad = np.radians(np.arange(0, 360, step))
+            circle = (np.cos(rad), np.sin(rad))
+            self.unit_circles[step] = circle
+        return circle
+    
+    def transform(self, target, orbit_radius, camera_x, camera_y, zoom):
+        """Titik orbit di screen space target (float)"""
+        origin_x, origin_y = screen_center(target)
+        # Kurangi titik saat zoom kecil
+        cos_a, sin_a = self.unit_circle(max(1, int(5 / zoom)))
+        x = origin_x + (orbit_radius * cos_a - camera_x) * zoom
+        y = origin_y + (orbit_radius * sin_a - camera_y) * zoom
+        return x, y
+    
+    def visible(self, target, orbit_radius, camera_x, camera_y, zoom):
+        """Apakah lingkaran orbit menyentuh layar target"""
+        origin_x, origin_y = screen_center(target)
+        center_x = origin_x - camera_x * zoom
+        center_y = origin_y - camera_y * zoom
+        r = orbit_radius * zoom
+        return bool(annulus_angle_ranges(-center_x - 1, -center_y - 1,
+                                         target.width - center_x + 1, target.height - center_y + 1,
+                                         r - 1, r + 1))
+    
+    def get(self, target, kind, orbit_radius, camera_x, camera_y, zoom):
+        """Piksel orbit ('line' atau 'dots'), dirasterisasi ulang hanya jika view berubah"""
+        view = (target.width, target.height, camera_x, camera_y, zoom)
+        if view != self.view:
+            self.rasterized.clear()
+            self.view = view
+        
+        key = (kind, orbit_radius)
+        pixels = self.rasterized.get(key)
+        if pixels is None and not self.visible(target, orbit_radius, camera_x, camera_y, zoom):
+            # Orbit seluruhnya di luar layar (atau layar di dalam orbit)
+            pixels = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+            self.rasterized[key] = pixels
+        if pixels is None:
+            x, y = self.transform(target, orbit_radius, camera_x, camera_y, zoom)
+            if kind == 'line':
+                # Orbit sebagai rangkaian garis Bresenham, hanya segmen yang terlihat
+                ox = x.astype(np.int64)
+                oy = y.astype(np.int64)
+                seg = segments_visible(ox[:-1], oy[:-1], ox[1:], oy[1:], target.width, target.height)
+                pixels = bresenham_lines(ox[:-1][seg], oy[:-1][seg], ox[1:][seg], oy[1:][seg])
             else:
-                pygame.draw.circle(screen, color, (int(parallax_x), int(parallax_y)), int(size))
+                # Buang titik negatif sebelum dibulatkan (int() membulatkan ke nol)
+                visible = (x >= 0) & (y >= 0)
+                pixels = (x[visible].astype(np.int64), y[visible].astype(np.int64))
+            pixels = target.clip(*pixels)
+            self.rasterized[key] = pixels
+        return pixels
+    
+    def draw(self, target, kind, orbit_radius, camera_x, camera_y, zoom, color):
+        xs, ys = self.get(target, kind, orbit_radius, camera_x, camera_y, zoom)
+        target.plot(xs, ys, color)
+
+orbit_cache = OrbitCache()
 
 class CelestialBody:
     def __init__(self, name, radius, color, orbit_radius, orbit_speed, rotation_speed=1.0, image_name=None):
@@ -175,14 +523,19 @@ class CelestialBody:
         self.orbit_radius = orbit_radius
         self.orbit_speed = orbit_speed
         self.rotation_speed = rotation_speed
-        self.orbit_angle = random.uniform(0, 2 * math.pi)
-        self.rotation_angle = random.uniform(0, 2 * math.pi)
-        self.trail = []
+        # Fase awal (t = 0); sudut saat ini dihitung closed-form oleh Scene
+        self.orbit_phase = random.uniform(0, 2 * math.pi)
+        self.rotation_phase = random.uniform(0, 2 * math.pi)
+        self.orbit_angle = self.orbit_phase
+        self.rotation_angle = self.rotation_phase
         self.max_trail_length = 100
+        self.trail = TrailBuffer(self.max_trail_length)
         self.selected = False
         self.image_name = image_name
         self.image = None
         self.texture = None
+        self.texture_pixels = None
+        self.texture_samples = {}
         self.load_image()
         self.create_texture()
         
@@ -193,10 +546,13 @@ class CelestialBody:
     def load_image(self):
         """Load planet image from assets folder"""
         if self.image_name:
-            asset_path = f"assets/{self.image_name}"
+            asset_path = os.path.join(ASSET_DIR, self.image_name)
             if os.path.exists(asset_path):
                 try:
-                    original_image = pygame.image.load(asset_path).convert_alpha()
+                    original_image = pygame.image.load(asset_path)
+                    # convert_alpha butuh window; render offscreen memakai format asli
+                    if pygame.display.get_surface() is not None:
+                        original_image = original_image.convert_alpha()
                     # Scale image to appropriate size
                     scaled_size = int(self.radius * 4)  # Larger for better quality
                     self.image = pygame.transform.smoothscale(original_image, (scaled_size, scaled_size))
@@ -251,6 +607,9 @@ class CelestialBody:
                         255
                     )
                     self.texture.set_at((px, py), new_color)
+        
+        # Salinan array tekstur untuk sampling vektor di render_planet_detailed
+        self.texture_pixels = pygame.surfarray.array3d(self.texture)
     
     def create_rotation_markers(self):
         """Create markers to visualize rotation"""
@@ -260,38 +619,29 @@ class CelestialBody:
             marker_radius = self.radius * 0.8
             self.rotation_markers.append({
                 'angle': angle,
+                'base_angle': angle,
                 'radius': marker_radius,
                 'color': (255, 255, 255, 100) if i % 2 == 0 else (200, 200, 255, 100)
             })
     
-    def update(self, dt, time_scale):
-        # Orbit position (perfect circle orbit)
-        self.orbit_angle += self.orbit_speed * dt * time_scale
-        self.orbit_angle %= 2 * math.pi
-        
-        # Rotation angle
-        self.rotation_angle += self.rotation_speed * dt * time_scale * 2.0  # Faster rotation for visibility
-        self.rotation_angle %= 2 * math.pi
-        
-        # Update trail
-        x = self.orbit_radius * math.cos(self.orbit_angle)
-        y = self.orbit_radius * math.sin(self.orbit_angle)
-        self.trail.append((x, y))
-        if len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
+    def apply_state(self, orbit_angle, rotation_angle, marker_phase):
+        """Set sudut hasil evaluasi closed-form (lihat Scene.state_at)"""
+        self.orbit_angle = orbit_angle
+        self.rotation_angle = rotation_angle
         
         # Update rotation markers
         for marker in self.rotation_markers:
-            marker['angle'] += self.rotation_speed * dt * time_scale * 1.5
+            marker['angle'] = marker['base_angle'] + marker_phase
     
-    def get_position(self, camera_x=0, camera_y=0, zoom=1.0):
+    def get_position(self, camera_x=0, camera_y=0, zoom=1.0, center=(CENTER_X, CENTER_Y)):
+        """Posisi layar; center = pusat proyeksi target (lihat screen_center)"""
         x = self.orbit_radius * math.cos(self.orbit_angle)
         y = self.orbit_radius * math.sin(self.orbit_angle)
-        screen_x = CENTER_X + (x - camera_x) * zoom
-        screen_y = CENTER_Y + (y - camera_y) * zoom
+        screen_x = center[0] + (x - camera_x) * zoom
+        screen_y = center[1] + (y - camera_y) * zoom
         return screen_x, screen_y
     
-    def draw_sun_glow(self, screen_x, screen_y, scaled_radius):
+    def draw_sun_glow(self, target, screen_x, screen_y, scaled_radius):
         """Draw sun dengan glow effect untuk menghindari kotak"""
         # Draw multiple layers untuk glow effect
         glow_layers = [
@@ -305,81 +655,103 @@ class CelestialBody:
         for glow_radius, glow_color in glow_layers:
             if glow_radius >= 1:  # Hanya draw jika radius cukup besar
                 # Gunakan algoritma midpoint_circle untuk glow
-                points = midpoint_circle(int(screen_x), int(screen_y), int(glow_radius))
-                for px, py in points:
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        screen.set_at((px, py), glow_color)
+                spans = midpoint_circle_spans(int(screen_x), int(screen_y), int(glow_radius))
+                target.fill_spans(spans, glow_color)
     
-    def draw_planet_simple(self, screen_x, screen_y, scaled_radius):
+    def draw_planet_simple(self, target, screen_x, screen_y, scaled_radius):
         """Draw planet sederhana untuk zoom kecil"""
-        # Gunakan algoritma manual langsung ke screen
-        points = midpoint_circle(int(screen_x), int(screen_y), int(scaled_radius))
-        for px, py in points:
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                screen.set_at((px, py), self.color)
+        # Gunakan algoritma manual langsung ke target
+        spans = midpoint_circle_spans(int(screen_x), int(screen_y), int(scaled_radius))
+        target.fill_spans(spans, self.color)
         
         # Tambahkan highlight kecil
         highlight_x = int(screen_x - scaled_radius * 0.3)
         highlight_y = int(screen_y - scaled_radius * 0.3)
-        highlight_points = midpoint_circle(highlight_x, highlight_y, max(1, int(scaled_radius * 0.3)))
-        for px, py in highlight_points:
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                screen.set_at((px, py), (255, 255, 255, 150))
+        highlight_spans = midpoint_circle_spans(highlight_x, highlight_y, max(1, int(scaled_radius * 0.3)))
+        target.fill_spans(highlight_spans, (255, 255, 255, 150))
     
-    def draw_planet_detailed(self, screen_x, screen_y, scaled_radius, zoom):
-        """Draw planet dengan detail lengkap"""
+    def draw_planet_point(self, target, screen_x, screen_y):
+        """Draw planet sebagai titik (plus 5 piksel) untuk zoom sangat kecil"""
+        x, y = int(screen_x), int(screen_y)
+        target.plot(np.array([x, x - 1, x + 1, x, x]), np.array([y, y, y, y - 1, y + 1]), self.color)
+    
+    def draw_planet_detailed(self, target, screen_x, screen_y, scaled_radius, zoom, level=LOD_FULL):
+        """Draw planet dengan detail lengkap (lewat sprite cache level LOD)"""
+        # Kuantisasi parameter render agar frame berikutnya memakai sprite yang sama
+        steps = SPRITE_ANGLE_STEPS if level == LOD_FULL else LOD_SPRITE_ANGLE_STEPS
+        angle_step = 2 * math.pi / steps
+        # Benda bergambar tetap memakai gambarnya di level sprite (hanya bucket sudut lebih kasar)
+        use_image = self.image is not None and zoom > 0.3
+        radius_q = round(scaled_radius * 2) / 2
+        zoom_q = round(zoom, 2)
+        angle_q = round(self.rotation_angle / angle_step) % steps
+        
+        # Marker hanya digambar pada tekstur prosedural, fasenya sama untuk semua marker
+        marker_q = 0
+        if not use_image and self.rotation_markers:
+            marker = self.rotation_markers[0]
+            marker_q = round((marker['angle'] - marker['base_angle']) / angle_step) % steps
+        
+        key = (self.name, use_image, radius_q, zoom_q, steps, angle_q, marker_q)
+        sprite = lod_sprite_caches[level].get_or_render(key, lambda: self.render_planet_detailed(
+            radius_q, zoom_q, use_image, angle_q * angle_step, marker_q * angle_step
+        ))
+        
+        # Draw the planet surface to target
+        center = sprite.get_width() // 2
+        target.blit(sprite, (screen_x - center, screen_y - center))
+    
+    def render_planet_detailed(self, scaled_radius, zoom, use_image, rotation_angle, marker_phase):
+        """Render sprite planet detail (tekstur, marker, highlight, shadow)"""
         # Create surface for planet with alpha
         surface_size = max(10, int(scaled_radius * 2) + 4)  # Minimal 10x10 pixel
         planet_surface = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
+        planet_fb = FrameBuffer(planet_surface, USE_NUMPY_FRAMEBUFFER)
         center = surface_size // 2
         
-        if self.image and zoom > 0.3:  # Use image for high zoom
-            # Rotate the image
-            rotated_image = pygame.transform.rotate(self.image, math.degrees(self.rotation_angle))
+        if use_image:  # Use image for high zoom
+            # Rotate the image (hanya saat sprite cache miss; sudut sudah dikuantisasi)
+            rotated_image = pygame.transform.rotate(self.image, math.degrees(rotation_angle))
             img_rect = rotated_image.get_rect(center=(center, center))
             planet_surface.blit(rotated_image, img_rect)
         else:
             # Draw textured planet with manual algorithms
             # Draw main circle
-            points = midpoint_circle(center, center, int(scaled_radius))
-            for px, py in points:
-                # Calculate position in texture
+            if planet_fb.use_numpy:
                 if self.texture and scaled_radius > 0:
-                    tex_x = int((px - center) / scaled_radius * self.radius) % self.texture.get_width()
-                    tex_y = int((py - center) / scaled_radius * self.radius) % self.texture.get_height()
-                    
-                    if 0 <= tex_x < self.texture.get_width() and 0 <= tex_y < self.texture.get_height():
-                        tex_color = self.texture.get_at((tex_x, tex_y))
-                        # Apply rotation effect
-                        angle = math.atan2(py - center, px - center)
-                        rotated_angle = angle + self.rotation_angle
-                        shade = 0.8 + 0.2 * math.sin(rotated_angle * 2)
-                        
-                        final_color = (
-                            min(255, int(tex_color[0] * shade)),
-                            min(255, int(tex_color[1] * shade)),
-                            min(255, int(tex_color[2] * shade)),
-                            255
-                        )
-                        planet_surface.set_at((px, py), final_color)
+                    self.shade_texture(planet_fb, surface_size, scaled_radius, rotation_angle)
+            else:
+                for py, x_start, x_end in midpoint_circle_spans(center, center, int(scaled_radius)):
+                    for px in range(x_start, x_end + 1):
+                        # Calculate position in texture
+                        if self.texture and scaled_radius > 0:
+                            tex_x = int((px - center) / scaled_radius * self.radius) % self.texture.get_width()
+                            tex_y = int((py - center) / scaled_radius * self.radius) % self.texture.get_height()
+                            
+                            if 0 <= tex_x < self.texture.get_width() and 0 <= tex_y < self.texture.get_height():
+                                tex_color = self.texture.get_at((tex_x, tex_y))
+                                # Apply rotation effect
+                                angle = math.atan2(py - center, px - center)
+                                rotated_angle = angle + rotation_angle
+                                shade = 0.8 + 0.2 * math.sin(rotated_angle * 2)
+                            
+                                final_color = (
+                                    min(255, int(tex_color[0] * shade)),
+                                    min(255, int(tex_color[1] * shade)),
+                                    min(255, int(tex_color[2] * shade)),
+                                    255
+                                )
+                                planet_surface.set_at((px, py), final_color)
             
             # Draw rotation markers (clearly visible features)
             for marker in self.rotation_markers:
-                marker_x = int(center + marker['radius'] * zoom * math.cos(marker['angle']))
-                marker_y = int(center + marker['radius'] * zoom * math.sin(marker['angle']))
+                marker_angle = marker['base_angle'] + marker_phase
+                marker_x = int(center + marker['radius'] * zoom * math.cos(marker_angle))
+                marker_y = int(center + marker['radius'] * zoom * math.sin(marker_angle))
                 
                 # Draw a small circle for the marker
-                marker_points = midpoint_circle(marker_x, marker_y, max(1, int(scaled_radius * 0.1)))
-                for px, py in marker_points:
-                    if 0 <= px < planet_surface.get_width() and 0 <= py < planet_surface.get_height():
-                        current = planet_surface.get_at((px, py))
-                        blended = (
-                            (current[0] + marker['color'][0]) // 2,
-                            (current[1] + marker['color'][1]) // 2,
-                            (current[2] + marker['color'][2]) // 2,
-                            255
-                        )
-                        planet_surface.set_at((px, py), blended)
+                marker_spans = midpoint_circle_spans(marker_x, marker_y, max(1, int(scaled_radius * 0.1)))
+                planet_fb.blend_spans(marker_spans, marker['color'])
         
         # Apply REFLECTION: Highlight effect (top-left light source)
         if scaled_radius > 3:  # Only add highlight if planet is large enough
@@ -387,16 +759,30 @@ class CelestialBody:
             highlight_x = int(center - scaled_radius * 0.3)
             highlight_y = int(center - scaled_radius * 0.3)
             
-            highlight_points = midpoint_circle(highlight_x, highlight_y, highlight_radius)
-            for px, py in highlight_points:
-                if 0 <= px < planet_surface.get_width() and 0 <= py < planet_surface.get_height():
-                    dist = math.sqrt((px - highlight_x)**2 + (py - highlight_y)**2)
-                    if dist <= highlight_radius:
-                        alpha = int(200 * (1 - dist / highlight_radius))
-                        planet_surface.set_at((px, py), (255, 255, 255, alpha))
+            highlight_spans = midpoint_circle_spans(highlight_x, highlight_y, highlight_radius)
+            for py, x_start, x_end in planet_fb.clip_spans(highlight_spans):
+                # Alpha menurun linear dari pusat highlight, dihitung per span
+                px = np.arange(x_start, x_end + 1)
+                dist = np.sqrt((px - highlight_x)**2 + (py - highlight_y)**2)
+                inside = dist <= highlight_radius
+                alpha = (200 * (1 - dist[inside] / highlight_radius)).astype(np.uint8)
+                planet_fb.pixels[px[inside], py] = 255
+                planet_fb.alpha[px[inside], py] = alpha
         
         # Apply REFLECTION: Ground shadow (bottom) - PERBAIKAN: hindari ZeroDivisionError
-        if scaled_radius > 4:  # Only add shadow if planet is large enough
+        if scaled_radius > 4 and planet_fb.use_numpy:
+            shadow_height = max(1, int(scaled_radius * 0.2))
+            ys = np.arange(int(center + scaled_radius * 0.5), min(int(center + scaled_radius) + 2, surface_size))
+            alpha = (100 * (1 - (ys - (center + scaled_radius * 0.5)) / shadow_height)).astype(int)
+            ys = ys[alpha > 0]
+            
+            # Gelapkan seluruh blok baris shadow yang berada di dalam lingkaran
+            xs = np.arange(surface_size)
+            inside = (xs[:, None] - center)**2 + (ys[None, :] - center)**2 <= scaled_radius * scaled_radius
+            block = planet_fb.pixels[:, ys].astype(np.int16)
+            block[inside] = np.maximum(block[inside] - 30, 0)
+            planet_fb.pixels[:, ys] = block
+        elif scaled_radius > 4:  # Only add shadow if planet is large enough
             shadow_height = max(1, int(scaled_radius * 0.2))
             for y in range(int(center + scaled_radius * 0.5), int(center + scaled_radius) + 2):
                 if y < planet_surface.get_height():
@@ -418,84 +804,109 @@ class CelestialBody:
                                     )
                                     planet_surface.set_at((x, y), shadowed)
         
-        # Draw the planet surface to screen
-        screen.blit(planet_surface, (screen_x - center, screen_y - center))
+        planet_fb.flush()
+        return planet_surface
     
-    def draw(self, camera_x=0, camera_y=0, zoom=1.0, draw_trail=False):
-        screen_x, screen_y = self.get_position(camera_x, camera_y, zoom)
+    def shade_texture(self, planet_fb, surface_size, scaled_radius, rotation_angle):
+        """Sampling tekstur dan shading rotasi sebagai operasi array
+
+        planet_fb harus surface baru (transparan), karena seluruh blok
+        piksel ditulis sekaligus dan area di luar lingkaran tetap kosong.
+        """
+        grid = circle_grid(surface_size, scaled_radius)
+        
+        # Warna tekstur per piksel hanya bergantung pada ukuran, jadi di-cache
+        key = (surface_size, scaled_radius)
+        tex_color = self.texture_samples.get(key)
+        if tex_color is None:
+            tex_w, tex_h = self.texture.get_size()
+            # int() membulatkan ke nol, lalu modulo seperti Python
+            tex_x = np.trunc(grid['dx'] / scaled_radius * self.radius).astype(np.intp) % tex_w
+            tex_y = np.trunc(grid['dy'] / scaled_radius * self.radius).astype(np.intp) % tex_h
+            tex_color = self.texture_pixels[tex_x, tex_y].astype(np.float32)
+            tex_color[~grid['mask']] = 0
+            if len(self.texture_samples) >= MAX_CIRCLE_GRIDS:
+                self.texture_samples.clear()
+            self.texture_samples[key] = tex_color
+        
+        # Apply rotation effect: sin(2a + 2r) = sin2a * cos2r + cos2a * sin2r
+        shade = 0.8 + 0.2 * (grid['sin2'] * np.float32(math.cos(rotation_angle * 2)) +
+                             grid['cos2'] * np.float32(math.sin(rotation_angle * 2)))
+        # shade <= 1.0 sehingga hasil tidak melewati 255
+        planet_fb.pixels[...] = (tex_color * shade[..., None]).astype(np.uint8)
+        planet_fb.alpha[...] = grid['mask'] * np.uint8(255)
+    
+    def draw(self, target, camera_x=0, camera_y=0, zoom=1.0, draw_trail=False, bounds=None, lod=None):
+        """bounds (LayerBounds) opsional menerima box trail, benda dan label
+
+        lod: LodSelector pemilik state hysteresis (milik Scene); tanpa lod,
+        level dipilih langsung dari ambang tanpa hysteresis.
+        """
+        center_x, center_y = screen_center(target)
+        screen_x, screen_y = self.get_position(camera_x, camera_y, zoom, (center_x, center_y))
         scaled_radius = max(1, self.radius * zoom)  # Minimal radius 1 pixel
+        # Posisi yang digambar, dipakai index picking
+        self.screen_pos = (screen_x, screen_y)
         
         # Draw orbit line
         if self.orbit_radius > 0 and zoom > 0.05:
-            orbit_points = []
-            for angle in range(0, 360, max(1, int(5 / zoom))):  # Kurangi titik saat zoom kecil
-                rad = math.radians(angle)
-                ox = CENTER_X + (self.orbit_radius * math.cos(rad) - camera_x) * zoom
-                oy = CENTER_Y + (self.orbit_radius * math.sin(rad) - camera_y) * zoom
-                orbit_points.append((ox, oy))
-            
-            # Draw orbit using Bresenham lines
-            if len(orbit_points) > 1:
-                for i in range(len(orbit_points) - 1):
-                    for px, py in bresenham_line(
-                        int(orbit_points[i][0]), int(orbit_points[i][1]),
-                        int(orbit_points[i+1][0]), int(orbit_points[i+1][1])
-                    ):
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            alpha = 50
-                            color = (100, 100, 150, alpha)
-                            screen.set_at((px, py), color)
+            orbit_cache.draw(target, 'line', self.orbit_radius, camera_x, camera_y, zoom, (100, 100, 150, 50))
         
         # Draw trail
         if draw_trail and len(self.trail) > 2 and zoom > 0.1:
-            for i in range(len(self.trail) - 1):
-                x1 = CENTER_X + (self.trail[i][0] - camera_x) * zoom
-                y1 = CENTER_Y + (self.trail[i][1] - camera_y) * zoom
-                x2 = CENTER_X + (self.trail[i+1][0] - camera_x) * zoom
-                y2 = CENTER_Y + (self.trail[i+1][1] - camera_y) * zoom
-                
-                # Fade trail based on age
-                alpha = int(255 * (i / len(self.trail)))
-                color = (*self.color[:3], alpha) if len(self.color) == 4 else (*self.color, alpha)
-                
-                for px, py in bresenham_line(int(x1), int(y1), int(x2), int(y2)):
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        screen.set_at((px, py), color)
-        
-        # PERBAIKAN UTAMA: Gambar matahari dan planet dengan cara berbeda
-        if scaled_radius > 0.5:  # Only draw if visible
-            if self.name == "Matahari":
-                # Gambar matahari dengan glow effect
-                self.draw_sun_glow(screen_x, screen_y, scaled_radius)
-                
-                # Gambar inti matahari
-                if scaled_radius < 5:
-                    # Untuk zoom kecil, gunakan algoritma manual
-                    self.draw_planet_simple(screen_x, screen_y, scaled_radius)
-                else:
-                    # Untuk zoom besar, gunakan surface dengan detail
-                    self.draw_planet_detailed(screen_x, screen_y, scaled_radius, zoom)
+            trail = self.trail.view()
+            tx = (center_x + (trail[:, 0] - camera_x) * zoom).astype(np.int64)
+            ty = (center_y + (trail[:, 1] - camera_y) * zoom).astype(np.int64)
             
-            elif scaled_radius < 3:  # Planet kecil saat zoom out
-                self.draw_planet_simple(screen_x, screen_y, scaled_radius)
+            # Alpha fade tidak berpengaruh di surface display tanpa kanal alpha,
+            # jadi seluruh trail bisa ditulis dengan satu warna; segmen di luar layar dibuang
+            seg = segments_visible(tx[:-1], ty[:-1], tx[1:], ty[1:], target.width, target.height)
+            if seg.any():
+                xs, ys = bresenham_lines(tx[:-1][seg], ty[:-1][seg], tx[1:][seg], ty[1:][seg])
+                target.plot(xs, ys, self.color)
+                if bounds is not None:
+                    bounds.add(('trail', self.name), self.color, segment_boxes(tx[:-1][seg], ty[:-1][seg], tx[1:][seg], ty[1:][seg]))
+        
+        # Culling: batas layar benda (glow matahari 2.5x radius, lingkaran seleksi +5)
+        extent = scaled_radius * 2.5 if self.name == "Matahari" else scaled_radius + 6
+        body_visible = circle_visible(screen_x, screen_y, extent, target.width, target.height)
+        
+        # Level detail dari radius proyeksi asli (sebelum dibatasi minimal 1 piksel)
+        kind = 'sun' if self.name == "Matahari" else 'planet'
+        if lod is None:
+            level = LodSelector(LOD_TABLE, LOD_NAMES).target_level(kind, self.radius * zoom)
+        else:
+            level = lod.select(self.name, kind, self.radius * zoom, body_visible)
+        
+        if body_visible:  # Only draw if visible
+            # Gambar matahari dengan glow effect
+            if kind == 'sun' and level > LOD_POINT:
+                self.draw_sun_glow(target, screen_x, screen_y, scaled_radius)
             
-            else:  # Planet normal
-                self.draw_planet_detailed(screen_x, screen_y, scaled_radius, zoom)
+            if level == LOD_POINT:  # Sangat jauh: cukup satu titik
+                self.draw_planet_point(target, screen_x, screen_y)
+            elif level == LOD_DISC:  # Kecil saat zoom out: disc datar
+                self.draw_planet_simple(target, screen_x, screen_y, scaled_radius)
+            else:  # Sprite ter-cache (tekstur prosedural) atau detail penuh (gambar)
+                self.draw_planet_detailed(target, screen_x, screen_y, scaled_radius, zoom, level)
+        
+        body_boxes = []
+        if body_visible:
+            r = int(math.ceil(extent)) + 1
+            body_boxes.append((int(screen_x) - r, int(screen_y) - r, int(screen_x) + r + 1, int(screen_y) + r + 1))
         
         # Draw selection circle
-        if self.selected and scaled_radius > 2:
+        if self.selected and scaled_radius > 2 and body_visible:
             selection_radius = scaled_radius + 5
-            for angle in range(0, 360, 5):
-                rad = math.radians(angle)
-                px = int(screen_x + selection_radius * math.cos(rad))
-                py = int(screen_y + selection_radius * math.sin(rad))
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    screen.set_at((px, py), WHITE)
-        
-        # Draw planet name
-        if zoom > 0.2 and scaled_radius > 3:
-            font = pygame.font.SysFont(None, 24)
-            text = font.render(self.name, True, WHITE)
+            rad = np.radians(np.arange(0, 360, 5))
+            px = (screen_x + selection_radius * np.cos(rad)).astype(np.int64)
+            py = (screen_y + selection_radius * np.sin(rad)).astype(np.int64)
+            target.plot(px, py, WHITE)
+        
+        # Draw planet name (label paling jauh ~radius + lebar teks dari pusat)
+        label_visible = circle_visible(screen_x, screen_y, scaled_radius + LABEL_EXTENT, target.width, target.height)
+        if zoom > 0.2 and level >= LOD_SPRITE and label_visible:
+            text = render_label(self.name, 24, WHITE)
             text_width = text.get_width()
             
             # Cari posisi yang tidak overlap dengan UI
@@ -508,15 +919,21 @@ class CelestialBody:
                 text_y = screen_y
             
             # Jika overlap dengan panel kanan, pindah ke kiri
-            elif text_x + text_width > WIDTH - 320:
+            elif text_x + text_width > target.width - 320:
                 text_x = screen_x - scaled_radius - text_width - 10
                 text_y = screen_y
             
             # Gambar background untuk teks agar terbaca
-            pygame.draw.rect(screen, (0, 0, 0, 180), 
+            pygame.draw.rect(target.surface, (0, 0, 0, 180), 
                            (text_x - 2, text_y - 2, text_width + 4, 24))
             
-            screen.blit(text, (text_x, text_y))
+            target.blit(text, (text_x, text_y))
+            body_boxes.append((int(text_x) - 2, int(text_y) - 2, int(text_x) + text_width + 3,
+                               int(text_y) + max(23, text.get_height()) + 1))
+        
+        if bounds is not None and body_boxes:
+            marker = self.rotation_markers[0]['angle'] if self.rotation_markers else None
+            bounds.add(('body', self.name), (level, self.selected, self.rotation_angle, marker), body_boxes)
 
 class Comet:
     def __init__(self):
@@ -546,11 +963,16 @@ class Comet:
         self.size = random.uniform(2, 5)
         self.rotation = 0
         self.rotation_speed = random.uniform(0.02, 0.05)
-        self.trail = []
         self.max_trail_length = 50
+        self.trail = TrailBuffer(self.max_trail_length)
         self.color = (200, 230, 255)
+        
+        # State langkah sebelumnya untuk interpolasi render
+        self.prev_x, self.prev_y, self.prev_rotation = self.x, self.y, self.rotation
     
     def update(self, dt, time_scale):
+        self.prev_x, self.prev_y, self.prev_rotation = self.x, self.y, self.rotation
+        
         # TRANSLATION: Move comet
         self.x += self.vx * dt * time_scale
         self.y += self.vy * dt * time_scale
@@ -559,74 +981,91 @@ class Comet:
         self.rotation += self.rotation_speed * dt * time_scale
         
         # Update trail
-        self.trail.append((self.x, self.y))
-        if len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
+        self.trail.append(self.x, self.y)
     
-    def draw(self, camera_x=0, camera_y=0, zoom=1.0):
+    def draw(self, target, camera_x=0, camera_y=0, zoom=1.0, alpha=1.0, bounds=None):
+        """alpha: posisi render antara langkah sebelumnya (0) dan terakhir (1)
+
+        Koordinat komet relatif layar WIDTH x HEIGHT (titik dunia 0, 0 di
+        CENTER_X, CENTER_Y), diproyeksikan ke pusat target.
+        """
+        center_x, center_y = screen_center(target)
+        
         # Draw trail
         if len(self.trail) > 1:
-            for i in range(len(self.trail) - 1):
-                x1 = self.trail[i][0]
-                y1 = self.trail[i][1]
-                x2 = self.trail[i+1][0]
-                y2 = self.trail[i+1][1]
-                
-                alpha = int(255 * (i / len(self.trail)))
-                trail_color = (150, 200, 255, alpha)
-                
-                for px, py in bresenham_line(int(x1), int(y1), int(x2), int(y2)):
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        screen.set_at((px, py), trail_color)
+            trail = self.trail.view()
+            tx = (center_x + (trail[:, 0] - camera_x - CENTER_X) * zoom).astype(np.int64)
+            ty = (center_y + (trail[:, 1] - camera_y - CENTER_Y) * zoom).astype(np.int64)
+            x0, y0, x1, y1 = tx[:-1], ty[:-1], tx[1:], ty[1:]
+            seg = segments_visible(x0, y0, x1, y1, target.width, target.height)
+            if seg.any():
+                xs, ys = bresenham_lines(x0[seg], y0[seg], x1[seg], y1[seg])
+                target.plot(xs, ys, (150, 200, 255))
+                if bounds is not None:
+                    bounds.add(('comet_trail', id(self)), None, segment_boxes(x0[seg], y0[seg], x1[seg], y1[seg]))
+        
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        rotation = self.prev_rotation + (self.rotation - self.prev_rotation) * alpha
         
         # Draw comet with ROTATION
-        screen_x = CENTER_X + (self.x - camera_x - CENTER_X) * zoom
-        screen_y = CENTER_Y + (self.y - camera_y - CENTER_Y) * zoom
+        screen_x = center_x + (x - camera_x - CENTER_X) * zoom
+        screen_y = center_y + (y - camera_y - CENTER_Y) * zoom
         scaled_size = max(1, self.size * zoom)
+        self.screen_pos = (screen_x, screen_y)
+        self.screen_radius = scaled_size * 2
+        
+        # Culling: segitiga komet berada dalam lingkaran 2x ukuran
+        if not circle_visible(screen_x, screen_y, scaled_size * 2 + 1, target.width, target.height):
+            return
+        if bounds is not None:
+            bounds.add_circle(('comet', id(self)), rotation, screen_x, screen_y, scaled_size * 2 + 1)
         
         # Create comet shape (triangle)
         comet_points = []
         for i in range(3):
-            angle = self.rotation + i * (2 * math.pi / 3)
+            angle = rotation + i * (2 * math.pi / 3)
             px = screen_x + scaled_size * 2 * math.cos(angle)
             py = screen_y + scaled_size * 2 * math.sin(angle)
             comet_points.append((px, py))
         
         # Draw comet using scanline polygon algorithm
         if scaled_size > 0.5:
-            scanline_polygon(comet_points, self.color)
+            scanline_polygon(comet_points, self.color, target)
         
         # Add highlight (REFLECTION)
         if scaled_size > 1:
-            highlight_points = midpoint_circle(
-                int(screen_x + scaled_size * 0.5 * math.cos(self.rotation)),
-                int(screen_y + scaled_size * 0.5 * math.sin(self.rotation)),
+            highlight_spans = midpoint_circle_spans(
+                int(screen_x + scaled_size * 0.5 * math.cos(rotation)),
+                int(screen_y + scaled_size * 0.5 * math.sin(rotation)),
                 int(scaled_size * 0.5)
             )
-            for px, py in highlight_points:
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    screen.set_at((px, py), (255, 255, 255, 150))
+            target.fill_spans(highlight_spans, (255, 255, 255, 150))
 
 class SaturnRing:
     def __init__(self, planet):
         self.planet = planet
         self.inner_radius = planet.radius * 1.5
         self.outer_radius = planet.radius * 2.5
+        self.rotation_phase = 0
         self.rotation_angle = 0
         self.rotation_speed = planet.rotation_speed * 0.5
     
-    def update(self, dt, time_scale):
+    def angle_at(self, t):
         # ROTATION: Ring rotates
-        self.rotation_angle += self.rotation_speed * dt * time_scale
+        return self.rotation_phase + self.rotation_speed * t
     
-    def draw(self, camera_x=0, camera_y=0, zoom=1.0):
-        planet_x, planet_y = self.planet.get_position(camera_x, camera_y, zoom)
+    def draw(self, target, camera_x=0, camera_y=0, zoom=1.0, bounds=None):
+        planet_x, planet_y = self.planet.get_position(camera_x, camera_y, zoom, screen_center(target))
         scaled_inner = max(1, self.inner_radius * zoom)
         scaled_outer = max(2, self.outer_radius * zoom)
         
-        # Only draw if ring is visible
-        if scaled_outer < 1:
+        # Only draw if ring is visible (ukuran dan posisi di layar)
+        if scaled_outer < 1 or not circle_visible(planet_x, planet_y, scaled_outer + 1, target.width, target.height):
             return
+        if bounds is not None:
+            # Lapisan gradien bergeser sampai 0.3 * zoom ke luar
+            bounds.add_circle('saturn_ring', self.rotation_angle, planet_x, planet_y, scaled_outer + 0.3 * zoom + 1)
         
         # Create ring as a polygon (ellipse)
         ring_points = []
@@ -669,14 +1108,40 @@ class SaturnRing:
                     layer_points.append((x, y))
                 
                 # Draw this layer
-                scanline_polygon(layer_points, colors[layer])
+                scanline_polygon(layer_points, colors[layer], target)
 
 class UISystem:
-    def __init__(self):
-        self.font = pygame.font.SysFont(None, 24)
-        self.small_font = pygame.font.SysFont(None, 20)
-        self.title_font = pygame.font.SysFont(None, 32)
+    def __init__(self, height=HEIGHT):
+        self.font = fonts.get(None, 24)
+        self.small_font = fonts.get(None, 20)
+        self.title_font = fonts.get(None, 32)
         self.panel_width = 300
+        self.height = height
+        self.text_cache = label_cache
+        
+        # Panel retained: hanya widget yang inputnya berubah yang di-render ulang
+        self.left_panel = RetainedPanel((self.panel_width, height), (0, 0, 0, 200))
+        self.left_panel.add_widget('title', (0, 0, self.panel_width, 70), self.render_title)
+        self.left_panel.add_widget('status', (0, 70, self.panel_width, 40), self.render_status)
+        self.left_panel.add_widget('zoom', (0, 110, self.panel_width, 30), self.render_value)
+        self.left_panel.add_widget('time', (0, 140, self.panel_width, 30), self.render_value)
+        self.left_panel.add_widget('fps', (0, 170, self.panel_width, 30), self.render_value)
+        self.left_panel.add_widget('details', (0, 200, self.panel_width, height - 200), self.render_details)
+        
+        self.right_panel = RetainedPanel((self.panel_width, height), (0, 0, 0, 200))
+        self.right_panel.add_widget('header', (0, 0, self.panel_width, 90), self.render_header)
+        self.right_panel.add_widget('settings', (0, 90, self.panel_width, 110), self.render_settings)
+        self.right_panel.add_widget('controls', (0, 200, self.panel_width, height - 200), self.render_controls)
+        
+        self.indicator = RetainedPanel((200, 50), (0, 0, 0, 150))
+        self.indicator.add_widget('values', (0, 0, 200, 50), self.render_indicator)
+        
+        # Overlay profiler di bawah FPS, menutupi bagian atas detail saat aktif
+        self.profiler_panel = RetainedPanel((self.panel_width, 150), (10, 10, 25, 255))
+        self.profiler_panel.add_widget('graph', (0, 0, self.panel_width, 150), self.render_profiler)
+    
+    def text(self, font, text, color):
+        return self.text_cache.render(font, text, color)
     
     def wrap_text(self, text, font, max_width):
         """Wrap text to fit within max_width"""
@@ -700,71 +1165,100 @@ class UISystem:
         
         return lines
     
-    def draw_panel_left(self, paused, zoom, time_scale, selected_planet, fps):
-        # Draw semi-transparent panel
-        panel_surface = pygame.Surface((self.panel_width, HEIGHT), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 200))
-        screen.blit(panel_surface, (0, 0))
-        
-        y_offset = 20
-        
-        # Title
-        title = self.title_font.render("SISTEM TATA SURYA 2D", True, (255, 255, 0))
-        screen.blit(title, (20, y_offset))
-        y_offset += 50
-        
-        # Status
+    def draw_panel_left(self, target, paused, zoom, time_scale, selected_planet, fps, bounds=None):
+        # Input widget diformat dulu sehingga perubahan di bawah presisi tampilan tidak membuat dirty
+        self.left_panel.set('status', paused)
+        self.left_panel.set('zoom', f"Zoom: {zoom:.2f}x")
+        self.left_panel.set('time', f"Time Scale: {time_scale:.1f}x")
+        self.left_panel.set('fps', f"FPS: {round(fps / FPS_BUCKET) * FPS_BUCKET:.1f}")
+        self.left_panel.set('details', selected_planet)
+        self.blit_panel(target, self.left_panel, (0, 0), bounds)
+    
+    def blit_panel(self, target, panel, position, bounds=None):
+        """Blit panel ke target; rect widget yang di-render ulang dicatat ke bounds"""
+        target.blit(panel.compose(), position)
+        if bounds is not None:
+            for rect in panel.changed:
+                bounds.mark(rect.move(position))
+    
+    def draw_profiler(self, target, profiler, bounds=None):
+        """Overlay grafik waktu frame + fase terberat, di-render ulang tiap PROFILER_REFRESH frame"""
+        self.profiler_panel.set('graph', profiler, profiler.frames // PROFILER_REFRESH)
+        self.blit_panel(target, self.profiler_panel, (0, 200), bounds)
+    
+    def render_profiler(self, surface, rect, profiler, tick):
+        graph = pygame.Rect(20, 8, self.panel_width - 40, 60)
+        pygame.draw.rect(surface, (60, 60, 100), graph, 1)
+        
+        frame_times = profiler.frame_times()[-graph.width:] * 1000
+        if len(frame_times):
+            # Skala minimal 2 frame @ FPS, garis referensi di budget 1 frame
+            budget = 1000 / FPS
+            scale = max(2 * budget, float(frame_times.max()))
+            budget_y = graph.bottom - 1 - int(budget / scale * (graph.height - 2))
+            pygame.draw.line(surface, (0, 120, 0), (graph.left, budget_y), (graph.right - 1, budget_y))
+            
+            xs = graph.right - len(frame_times) + np.arange(len(frame_times))
+            ys = graph.bottom - 1 - (frame_times / scale * (graph.height - 2)).astype(int)
+            if len(xs) > 1:
+                pygame.draw.lines(surface, (255, 200, 0), False, np.column_stack((xs, ys)).tolist())
+            
+            summary = (f"Frame: {frame_times[-1]:.1f} ms  "
+                       f"max {frame_times.max():.1f} ms")
+            surface.blit(self.text(self.small_font, summary, WHITE), (20, graph.bottom + 6))
+        
+        y_offset = graph.bottom + 28
+        for name, seconds in profiler.top_phases(3):
+            label = self.text(self.small_font, f"{name}: {seconds * 1000:.2f} ms", (200, 200, 200))
+            surface.blit(label, (30, y_offset))
+            y_offset += 18
+    
+    def render_title(self, surface, rect):
+        title = self.text(self.title_font, "SISTEM TATA SURYA 2D", (255, 255, 0))
+        surface.blit(title, (20, rect.y + 20))
+    
+    def render_status(self, surface, rect, paused):
         status_color = (0, 255, 0) if not paused else (255, 100, 100)
-        status_text = self.font.render(f"Status: {'RUNNING' if not paused else 'PAUSED'}", True, status_color)
-        screen.blit(status_text, (20, y_offset))
-        y_offset += 40
-        
-        # Zoom info
-        zoom_text = self.font.render(f"Zoom: {zoom:.2f}x", True, WHITE)
-        screen.blit(zoom_text, (20, y_offset))
-        y_offset += 30
-        
-        # Time scale
-        time_text = self.font.render(f"Time Scale: {time_scale:.1f}x", True, WHITE)
-        screen.blit(time_text, (20, y_offset))
-        y_offset += 30
-        
-        # FPS
-        fps_text = self.font.render(f"FPS: {fps:.1f}", True, WHITE)
-        screen.blit(fps_text, (20, y_offset))
-        y_offset += 40
+        status_text = self.text(self.font, f"Status: {'RUNNING' if not paused else 'PAUSED'}", status_color)
+        surface.blit(status_text, (20, rect.y))
+    
+    def render_value(self, surface, rect, value):
+        surface.blit(self.text(self.font, value, WHITE), (20, rect.y))
+    
+    def render_details(self, surface, rect, selected_planet):
+        y_offset = rect.y + 10
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
         y_offset += 20
         
         # Selected planet info
         if selected_planet:
             # Background for planet info
-            pygame.draw.rect(screen, (30, 30, 60), (10, y_offset, self.panel_width - 20, 120), border_radius=5)
-            pygame.draw.rect(screen, (60, 60, 100), (10, y_offset, self.panel_width - 20, 120), 2, border_radius=5)
+            pygame.draw.rect(surface, (30, 30, 60), (10, y_offset, self.panel_width - 20, 120), border_radius=5)
+            pygame.draw.rect(surface, (60, 60, 100), (10, y_offset, self.panel_width - 20, 120), 2, border_radius=5)
             
-            planet_text = self.font.render(f"Planet: {selected_planet.name}", True, selected_planet.color)
-            screen.blit(planet_text, (20, y_offset + 10))
+            planet_text = self.text(self.font, f"Planet: {selected_planet.name}", selected_planet.color)
+            surface.blit(planet_text, (20, y_offset + 10))
             
-            radius_text = self.small_font.render(f"Radius: {selected_planet.radius:.1f}", True, WHITE)
-            screen.blit(radius_text, (20, y_offset + 40))
+            radius_text = self.text(self.small_font, f"Radius: {selected_planet.radius:.1f}", WHITE)
+            surface.blit(radius_text, (20, y_offset + 40))
             
-            orbit_text = self.small_font.render(f"Orbit Radius: {selected_planet.orbit_radius:.0f}", True, WHITE)
-            screen.blit(orbit_text, (20, y_offset + 60))
+            orbit_text = self.text(self.small_font, f"Orbit Radius: {selected_planet.orbit_radius:.0f}", WHITE)
+            surface.blit(orbit_text, (20, y_offset + 60))
             
-            speed_text = self.small_font.render(f"Speed: {selected_planet.orbit_speed:.3f}", True, WHITE)
-            screen.blit(speed_text, (20, y_offset + 80))
+            speed_text = self.text(self.small_font, f"Speed: {selected_planet.orbit_speed:.3f}", WHITE)
+            surface.blit(speed_text, (20, y_offset + 80))
             
             y_offset += 130
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
         y_offset += 20
         
         # Transformations section
-        trans_title = self.font.render("TRANSFORMASI GEOMETRI:", True, (100, 255, 255))
-        screen.blit(trans_title, (20, y_offset))
+        trans_title = self.text(self.font, "TRANSFORMASI GEOMETRI:", (100, 255, 255))
+        surface.blit(trans_title, (20, y_offset))
         y_offset += 30
         
         transformations = [
@@ -775,24 +1269,24 @@ class UISystem:
         ]
         
         for i, (title, desc) in enumerate(transformations):
-            title_text = self.small_font.render(title, True, (200, 200, 100))
-            screen.blit(title_text, (30, y_offset))
+            title_text = self.text(self.small_font, title, (200, 200, 100))
+            surface.blit(title_text, (30, y_offset))
             y_offset += 25
             
             desc_lines = self.wrap_text(desc, self.small_font, self.panel_width - 50)
             for line in desc_lines:
-                desc_text = self.small_font.render(line, True, (200, 200, 200))
-                screen.blit(desc_text, (40, y_offset))
+                desc_text = self.text(self.small_font, line, (200, 200, 200))
+                surface.blit(desc_text, (40, y_offset))
                 y_offset += 22
             y_offset += 5
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
         y_offset += 20
         
         # Algorithms section
-        algo_title = self.font.render("ALGORITMA MANUAL:", True, (255, 100, 255))
-        screen.blit(algo_title, (20, y_offset))
+        algo_title = self.text(self.font, "ALGORITMA MANUAL:", (255, 100, 255))
+        surface.blit(algo_title, (20, y_offset))
         y_offset += 30
         
         algorithms = [
@@ -803,96 +1297,99 @@ class UISystem:
         ]
         
         for algo in algorithms:
-            algo_text = self.small_font.render(algo, True, (200, 200, 255))
-            screen.blit(algo_text, (30, y_offset))
+            algo_text = self.text(self.small_font, algo, (200, 200, 255))
+            surface.blit(algo_text, (30, y_offset))
             y_offset += 25
         
         # Separator line
-        if y_offset < HEIGHT - 280:
-            pygame.draw.line(screen, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
+        if y_offset < self.height - 280:
+            pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
             y_offset += 20
     
-    def draw_panel_right(self, show_trails, show_orbits, asteroid_belt_visible, num_comets):
-        # Draw semi-transparent panel di kanan
-        panel_surface = pygame.Surface((self.panel_width, HEIGHT), pygame.SRCALPHA)
-        panel_surface.fill((0, 0, 0, 200))
-        screen.blit(panel_surface, (WIDTH - self.panel_width, 0))
-        
+    def draw_panel_right(self, target, show_trails, show_orbits, asteroid_belt_visible, num_comets, bounds=None):
+        self.right_panel.set('settings', show_trails, show_orbits, asteroid_belt_visible, num_comets)
+        self.blit_panel(target, self.right_panel, (target.width - self.panel_width, 0), bounds)
+    
+    def render_header(self, surface, rect):
         y_offset = 20
         
         # Title
-        title = self.font.render("KONTROL & INFORMASI", True, (100, 255, 100))
-        screen.blit(title, (WIDTH - self.panel_width + 20, y_offset))
+        title = self.text(self.font, "KONTROL & INFORMASI", (100, 255, 100))
+        surface.blit(title, (20, y_offset))
         y_offset += 40
         
         # Visual Settings
-        settings_title = self.font.render("SETTINGS VISUAL:", True, (200, 200, 100))
-        screen.blit(settings_title, (WIDTH - self.panel_width + 20, y_offset))
-        y_offset += 30
+        settings_title = self.text(self.font, "SETTINGS VISUAL:", (200, 200, 100))
+        surface.blit(settings_title, (20, y_offset))
+    
+    def render_settings(self, surface, rect, show_trails, show_orbits, asteroid_belt_visible, num_comets):
+        y_offset = rect.y
         
         # Show trails status
         trails_color = (0, 255, 0) if show_trails else (255, 100, 100)
-        trails_text = self.small_font.render(f"Trails: {'ON' if show_trails else 'OFF'}", True, trails_color)
-        screen.blit(trails_text, (WIDTH - self.panel_width + 40, y_offset))
+        trails_text = self.text(self.small_font, f"Trails: {'ON' if show_trails else 'OFF'}", trails_color)
+        surface.blit(trails_text, (40, y_offset))
         y_offset += 25
         
         # Show orbits status
         orbits_color = (0, 255, 0) if show_orbits else (255, 100, 100)
-        orbits_text = self.small_font.render(f"Orbit Lines: {'ON' if show_orbits else 'OFF'}", True, orbits_color)
-        screen.blit(orbits_text, (WIDTH - self.panel_width + 40, y_offset))
+        orbits_text = self.text(self.small_font, f"Orbit Lines: {'ON' if show_orbits else 'OFF'}", orbits_color)
+        surface.blit(orbits_text, (40, y_offset))
         y_offset += 25
         
         # Asteroid belt status
         asteroid_color = (0, 255, 0) if asteroid_belt_visible else (255, 100, 100)
-        asteroid_text = self.small_font.render(f"Asteroid Belt: {'ON' if asteroid_belt_visible else 'OFF'}", True, asteroid_color)
-        screen.blit(asteroid_text, (WIDTH - self.panel_width + 40, y_offset))
+        asteroid_text = self.text(self.small_font, f"Asteroid Belt: {'ON' if asteroid_belt_visible else 'OFF'}", asteroid_color)
+        surface.blit(asteroid_text, (40, y_offset))
         y_offset += 25
         
         # Comet count
-        comet_text = self.small_font.render(f"Active Comets: {num_comets}", True, (150, 200, 255))
-        screen.blit(comet_text, (WIDTH - self.panel_width + 40, y_offset))
-        y_offset += 40
+        comet_text = self.text(self.small_font, f"Active Comets: {num_comets}", (150, 200, 255))
+        surface.blit(comet_text, (40, y_offset))
+    
+    def render_controls(self, surface, rect):
+        y_offset = rect.y + 5
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), 
-                        (WIDTH - self.panel_width + 20, y_offset),
-                        (WIDTH - 20, y_offset), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
         y_offset += 20
         
         # Controls section
-        controls_title = self.font.render("KONTROL KEYBOARD:", True, (255, 150, 100))
-        screen.blit(controls_title, (WIDTH - self.panel_width + 20, y_offset))
+        controls_title = self.text(self.font, "KONTROL KEYBOARD:", (255, 150, 100))
+        surface.blit(controls_title, (20, y_offset))
         y_offset += 30
         
         controls = [
             ("Spasi", "Pause/Resume"),
             ("R", "Reset Simulasi"),
             ("+/-", "Kecepatan Waktu"),
+            ("[ / ]", "Lompat Waktu"),
             ("K", "Tambah Komet"),
             ("C", "Toggle Asteroid Belt"),
             ("T", "Toggle Trails"),
             ("O", "Toggle Orbit Lines"),
+            ("P", "Toggle Profiler"),
+            ("F12", "Simpan Profiler (CSV)"),
+            ("F5", "Mode Presentasi"),
             ("ESC", "Keluar")
         ]
         
         for key, desc in controls:
-            key_text = self.small_font.render(key, True, (255, 255, 100))
-            screen.blit(key_text, (WIDTH - self.panel_width + 40, y_offset))
+            key_text = self.text(self.small_font, key, (255, 255, 100))
+            surface.blit(key_text, (40, y_offset))
             
-            desc_text = self.small_font.render(desc, True, (200, 200, 200))
-            screen.blit(desc_text, (WIDTH - self.panel_width + 100, y_offset))
+            desc_text = self.text(self.small_font, desc, (200, 200, 200))
+            surface.blit(desc_text, (100, y_offset))
             
             y_offset += 25
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), 
-                        (WIDTH - self.panel_width + 20, y_offset),
-                        (WIDTH - 20, y_offset), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, y_offset), (self.panel_width - 20, y_offset), 2)
         y_offset += 20
         
         # Mouse controls
-        mouse_title = self.font.render("KONTROL MOUSE:", True, (100, 200, 255))
-        screen.blit(mouse_title, (WIDTH - self.panel_width + 20, y_offset))
+        mouse_title = self.text(self.font, "KONTROL MOUSE:", (100, 200, 255))
+        surface.blit(mouse_title, (20, y_offset))
         y_offset += 30
         
         mouse_controls = [
@@ -902,114 +1399,499 @@ class UISystem:
         ]
         
         for control in mouse_controls:
-            control_text = self.small_font.render(control, True, (200, 220, 255))
-            screen.blit(control_text, (WIDTH - self.panel_width + 40, y_offset))
+            control_text = self.text(self.small_font, control, (200, 220, 255))
+            surface.blit(control_text, (40, y_offset))
             y_offset += 25
         
         # Separator line
-        pygame.draw.line(screen, (100, 100, 100), 
-                        (WIDTH - self.panel_width + 20, HEIGHT - 80),
-                        (WIDTH - 20, HEIGHT - 80), 2)
+        pygame.draw.line(surface, (100, 100, 100), (20, self.height - 80), (self.panel_width - 20, self.height - 80), 2)
         
         # Info footer
-        footer = self.small_font.render("UTS GRAFIKA KOMPUTER - SIMULASI TATA SURYA", True, (150, 150, 255))
-        screen.blit(footer, (WIDTH - self.panel_width + 20, HEIGHT - 50))
+        footer = self.text(self.small_font, "UTS GRAFIKA KOMPUTER - SIMULASI TATA SURYA", (150, 150, 255))
+        surface.blit(footer, (20, self.height - 50))
+    
+    def draw_indicator(self, target, zoom, time_scale, bounds=None):
+        """Indikator zoom dan waktu di tengah atas (tidak ketimpa panel)"""
+        self.indicator.set('values', f"Zoom: {zoom:.2f}x", f"Time: {time_scale:.1f}x")
+        self.blit_panel(target, self.indicator, (target.width // 2 - 100, 10), bounds)
+    
+    def render_indicator(self, surface, rect, zoom_label, time_label):
+        surface.blit(self.text(self.small_font, zoom_label, WHITE), (10, 10))
+        surface.blit(self.text(self.small_font, time_label, WHITE), (10, 30))
 
 class AsteroidBelt:
+    """Sabuk asteroid berbasis array NumPy (radius, sudut, kecepatan, ukuran)"""
+    
     def __init__(self, inner_radius, outer_radius, num_asteroids=100):
-        self.asteroids = []
         self.inner_radius = inner_radius
         self.outer_radius = outer_radius
         self.visible = True
-        
-        for _ in range(num_asteroids):
-            radius = random.uniform(inner_radius, outer_radius)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.001, 0.003) * (inner_radius / radius)  # Kepler's third law
-            size = random.uniform(0.5, 2.0)
-            self.asteroids.append({
-                'radius': radius,
-                'angle': angle,
-                'speed': speed,
-                'size': size,
-                'color': (150, 150, 150, 200)
-            })
+        self.color = (150, 150, 150, 200)
+        
+        rng = numpy_rng()
+        radius = rng.uniform(inner_radius, outer_radius, num_asteroids)
+        angle = rng.uniform(0, 2 * math.pi, num_asteroids)
+        speed = rng.uniform(0.001, 0.003, num_asteroids) * (inner_radius / radius)  # Kepler's third law
+        size = rng.uniform(0.5, 2.0, num_asteroids)
+        
+        # Diurutkan berdasarkan ukuran agar radius gambar per grup berupa slice
+        order = np.argsort(size, kind='stable')
+        self.radius = radius[order].astype(np.float32)
+        self.phase = angle[order]
+        self.speed = speed[order]
+        self.size = size[order]
+        self.max_speed = float(speed.max()) if num_asteroids else 0.0
+        self.min_speed = float(speed.min()) if num_asteroids else 0.0
+        
+        # Sudut saat ini = phase_ref + speed * (t - t_ref), dihitung saat draw hanya
+        # untuk asteroid kandidat. Referensi (dan grid sudut) digeser saat sudut bisa
+        # melewati 64pi (presisi float32) atau sebaran drift melewati ASTEROID_REINDEX_DRIFT.
+        self.t = 0.0
+        self.rebase(0.0)
+        self.stats = {'candidates': 0, 'drawn': 0}
+        self.screen = None
     
-    def update(self, dt, time_scale):
+    def __len__(self):
+        return len(self.phase)
+    
+    def angles_at(self, t):
+        """Sudut semua asteroid pada waktu t (closed-form, mod 2pi)"""
+        return circular_angles(self.phase, self.speed, t)
+    
+    def rebase(self, t):
+        self.phase_ref = self.angles_at(t)
+        self.t_ref = t
+        self.grid = AngularGrid(self.phase_ref)
+    
+    def set_time(self, t):
+        self.t = t
         if not self.visible:
             return
         
-        for asteroid in self.asteroids:
-            asteroid['angle'] += asteroid['speed'] * dt * time_scale
+        elapsed = abs(t - self.t_ref)
+        if (elapsed * self.max_speed > 64 * math.pi or
+                elapsed * (self.max_speed - self.min_speed) > ASTEROID_REINDEX_DRIFT):
+            self.rebase(t)
+    
+    def candidates(self, target, camera_x, camera_y, zoom):
+        """Indeks asteroid yang mungkin terlihat (None = semua, lewat grid sudut)"""
+        # Viewport dalam koordinat dunia, diperlebar radius gambar terbesar
+        margin = (2.0 * zoom + 1) / zoom
+        center_x, center_y = screen_center(target)
+        x0 = camera_x - center_x / zoom - margin
+        y0 = camera_y - center_y / zoom - margin
+        x1 = camera_x + (target.width - center_x) / zoom + margin
+        y1 = camera_y + (target.height - center_y) / zoom + margin
+        ranges = annulus_angle_ranges(x0, y0, x1, y1, self.inner_radius, self.outer_radius)
+        if not ranges:
+            return np.zeros(0, dtype=np.intp)
+        if ranges == [(0.0, 2 * math.pi)]:
+            return None
+        
+        # Grid dibangun dari phase_ref: mundurkan rentang sebesar drift sejak t_ref
+        dt = self.t - self.t_ref
+        low, high = sorted((self.min_speed * dt, self.max_speed * dt))
+        return self.grid.query([(a0 - high, a1 - low) for a0, a1 in ranges])
+    
+    def draw(self, target, camera_x=0, camera_y=0, zoom=1.0, bounds=None):
+        """Posisi layar kandidat yang digambar disimpan di self.screen (x, y, radius)"""
+        self.screen = None
+        if not self.visible or zoom < 0.2 or len(self) == 0:
+            return
+        
+        # Culling sebelum proyeksi: hanya asteroid di sektor sudut yang terlihat
+        index = self.candidates(target, camera_x, camera_y, zoom)
+        if index is None:
+            radius, phase_ref, speed, size = self.radius, self.phase_ref, self.speed, self.size
+        elif len(index) == 0:
+            self.stats = {'candidates': 0, 'drawn': 0}
+            return
+        else:
+            # Indeks terurut naik sehingga ukuran tetap terurut untuk grouping
+            radius, phase_ref, speed, size = (self.radius[index], self.phase_ref[index],
+                                              self.speed[index], self.size[index])
+        
+        # World -> screen untuk kandidat sekaligus (float32 cukup untuk posisi piksel)
+        angle = (phase_ref + speed * (self.t - self.t_ref)).astype(np.float32)
+        center_x, center_y = screen_center(target)
+        screen_x = (center_x + (radius * np.cos(angle) - np.float32(camera_x)) * np.float32(zoom)).astype(np.int32)
+        screen_y = (center_y + (radius * np.sin(angle) - np.float32(camera_y)) * np.float32(zoom)).astype(np.int32)
+        
+        # Radius midpoint circle; ukuran terurut sehingga nilainya tidak turun
+        scaled_size = np.maximum(0.5, size * zoom).astype(np.intp)
+        self.screen = (screen_x, screen_y, scaled_size)
+        if bounds is not None:
+            r = scaled_size + 1
+            bounds.add('asteroids', None, np.column_stack((screen_x - r, screen_y - r, screen_x + r + 1, screen_y + r + 1)))
+        first, last = int(scaled_size[0]), int(scaled_size[-1])
+        bounds = np.searchsorted(scaled_size, np.arange(first, last + 2))
+        drawn = 0
+        
+        # Semua asteroid berwarna sama: kumpulkan piksel semua grup untuk satu scatter
+        inside_pixels = ([], [])
+        border_pixels = ([], [])
+        for i, radius in enumerate(range(first, last + 1)):
+            group = slice(bounds[i], bounds[i + 1])
+            gx = screen_x[group]
+            gy = screen_y[group]
+            
+            # Viewport masking sebelum rasterisasi: asteroid yang seluruhnya di dalam
+            # layar tidak perlu clipping per piksel
+            inside = (gx >= radius) & (gx < target.width - radius) & (gy >= radius) & (gy < target.height - radius)
+            border = ~inside & (gx >= -radius) & (gx < target.width + radius) & (gy >= -radius) & (gy < target.height + radius)
+            
+            # Draw asteroid using midpoint circle (stamp offset per radius)
+            ox, oy = circle_stamp(radius)
+            ox = ox.astype(np.int32)
+            oy = oy.astype(np.int32)
+            for mask, pixels in ((inside, inside_pixels), (border, border_pixels)):
+                if mask.any():
+                    pixels[0].append((gx[mask][:, None] + ox[None, :]).ravel())
+                    pixels[1].append((gy[mask][:, None] + oy[None, :]).ravel())
+                    drawn += int(np.count_nonzero(mask))
+        self.stats = {'candidates': len(scaled_size), 'drawn': drawn}
+        
+        if inside_pixels[0]:
+            target.plot(np.concatenate(inside_pixels[0]), np.concatenate(inside_pixels[1]),
+                             self.color, clip=False)
+        if border_pixels[0]:
+            target.plot(np.concatenate(border_pixels[0]), np.concatenate(border_pixels[1]), self.color)
+
+# ==================== SCENE ====================
+
+class Scene:
+    """Semua objek simulasi beserta state kamera, dipakai main loop dan benchmark"""
+    
+    # Nama fase render, sesuai urutan gambar di draw()
+    PHASES = ('starfield', 'orbits', 'planets', 'saturn_ring', 'asteroids', 'comets', 'ui')
+    
+    def __init__(self, ui_height=HEIGHT):
+        """ui_height: tinggi layar untuk layout panel UI; proyeksi mengikuti target draw"""
+        # Create celestial bodies
+        self.sun = CelestialBody("Matahari", 30, SUN_COLOR, 0, 0, 0.005, "sun.png")
+        
+        self.planets = [
+            CelestialBody("Merkurius", 5, MERCURY_COLOR, 100, 0.04, 0.01, "mercury.png"),
+            CelestialBody("Venus", 8, VENUS_COLOR, 150, 0.015, 0.008, "venus.png"),
+            CelestialBody("Bumi", 9, EARTH_COLOR, 200, 0.01, 0.015, "earth.png"),
+            CelestialBody("Mars", 7, MARS_COLOR, 260, 0.008, 0.012, "mars.png"),
+            CelestialBody("Jupiter", 20, JUPITER_COLOR, 350, 0.004, 0.02, "jupiter.png"),
+            CelestialBody("Saturnus", 18, SATURN_COLOR, 450, 0.003, 0.018, "saturn.png"),
+            CelestialBody("Uranus", 12, URANUS_COLOR, 550, 0.002, 0.01, "uranus.png"),
+            CelestialBody("Neptunus", 12, NEPTUNE_COLOR, 650, 0.001, 0.009, "neptune.png")
+        ]
+        
+        # Create systems
+        self.starfield = Starfield(300)
+        self.saturn_ring = SaturnRing(self.planets[5])  # Saturn is index 5
+        self.asteroid_belt = AsteroidBelt(280, 320, 150)
+        self.ui = UISystem(ui_height)
+        
+        # Game state
+        self.camera_x, self.camera_y = 0, 0
+        self.zoom = 1.0
+        self.paused = False
+        self.time_scale = 1.0
+        self.comets = []
+        self.show_trails = True
+        self.show_orbits = True
+        self.profiler = None
+        self.show_profiler = False
+        self.show_ui = True
+        # Mode presentasi: render hanya saat ada perubahan, update hanya rect yang berubah
+        self.presentation = False
+        
+        # Waktu simulasi: semua sudut dievaluasi closed-form dari clock.t
+        self.clock = SimulationClock()
+        # Lama satu langkah update fixed (detik); trail bertambah satu titik per langkah
+        self.sim_step = 1.0 / SIM_HZ
+        self.build_orbit_table()
+        self.set_time(self.clock.t)
+        
+        # Waktu langkah sebelumnya dan posisi render di antaranya (lihat interpolate)
+        self.prev_t = self.clock.t
+        self.render_alpha = 1.0
+        
+        # Index picking dari posisi layar frame terakhir yang digambar
+        self.picker = PickGrid()
+        self.pick_items = []
+        
+        # State hysteresis LOD per Scene, sehingga run berikutnya tidak mewarisi level
+        self.lod = LodSelector(LOD_TABLE, LOD_NAMES, LOD_HYSTERESIS)
+    
+    def bodies(self):
+        return self.planets + [self.sun]
+    
+    def build_orbit_table(self):
+        """Parameter orbit/rotasi semua benda sebagai array, urutan sama dengan bodies()"""
+        bodies = self.bodies()
+        self.orbit_radius = np.array([body.orbit_radius for body in bodies], dtype=float)
+        self.orbit_phase = np.array([body.orbit_phase for body in bodies])
+        self.orbit_speed = np.array([body.orbit_speed for body in bodies])
+        self.rotation_phase = np.array([body.rotation_phase for body in bodies])
+        self.rotation_speed = np.array([body.rotation_speed for body in bodies])
+    
+    def state_at(self, t):
+        """State semua benda pada waktu t dalam satu evaluasi vektor
+        
+        Gerak orbit dan rotasi beraturan, sehingga sudut = fase + kecepatan * t.
+        Rotasi planet 2x dan marker 1.5x kecepatan rotasi (agar terlihat).
+        """
+        x, y, orbit_angle = circular_positions(self.orbit_radius, self.orbit_phase, self.orbit_speed, t)
+        state = {
+            't': t,
+            'orbit_angle': orbit_angle,
+            'x': x,
+            'y': y,
+            'rotation_angle': circular_angles(self.rotation_phase, self.rotation_speed * 2.0, t),
+            'marker_phase': self.rotation_speed * 1.5 * t,
+            'ring_angle': self.saturn_ring.angle_at(t),
+        }
+        return state
     
-    def draw(self, camera_x=0, camera_y=0, zoom=1.0):
-        if not self.visible or zoom < 0.2:
+    def set_time(self, t):
+        """Terapkan state closed-form pada waktu t ke semua objek"""
+        state = self.state_at(t)
+        for body, orbit_angle, rotation_angle, marker_phase in zip(
+                self.bodies(), state['orbit_angle'].tolist(),
+                state['rotation_angle'].tolist(), state['marker_phase'].tolist()):
+            body.apply_state(orbit_angle, rotation_angle, marker_phase)
+        self.saturn_ring.rotation_angle = state['ring_angle']
+        self.asteroid_belt.set_time(t)
+        return state
+    
+    def seek(self, t):
+        """Lompat ke waktu t tanpa mensimulasikan frame di antaranya"""
+        self.prev_t = self.clock.seek(t)
+        self.set_time(t)
+        self.fill_trails(t, self.time_scale * self.sim_step)
+    
+    def fill_trails(self, t, step):
+        """Bangun ulang trail dari posisi closed-form pada t - k * step"""
+        for body, radius, phase, speed in zip(self.bodies(), self.orbit_radius,
+                                              self.orbit_phase, self.orbit_speed):
+            times = t - step * np.arange(body.trail.capacity - 1, -1, -1)
+            xs, ys, _ = circular_positions(radius, phase, speed, times[times >= 0])
+            body.trail.clear()
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                body.trail.append(x, y)
+    
+    def reset(self):
+        """Reset kamera, waktu, fase orbit acak baru, dan hapus komet"""
+        self.camera_x, self.camera_y = 0, 0
+        self.zoom = 1.0
+        self.time_scale = 1.0
+        for planet in self.planets:
+            planet.orbit_phase = random.uniform(0, 2 * math.pi)
+        self.build_orbit_table()
+        self.seek(self.clock.t)
+        self.comets.clear()
+    
+    def selected_planet(self):
+        for planet in self.bodies():
+            if planet.selected:
+                return planet
+        return None
+    
+    def build_pick_index(self, width, height):
+        """Index posisi layar dari draw terakhir, dalam urutan gambar
+
+        Matahari, planet, asteroid (jika PICK_ASTEROIDS) lalu komet; indeks
+        terbesar yang kena adalah yang teratas.
+        """
+        bodies = [self.sun] + self.planets
+        xs = [body.screen_pos[0] for body in bodies]
+        ys = [body.screen_pos[1] for body in bodies]
+        radii = [max(body.radius * self.zoom, MIN_PICK_RADIUS) for body in bodies]
+        self.pick_items = list(bodies)
+        
+        belt = self.asteroid_belt.screen
+        if PICK_ASTEROIDS and belt is not None:
+            xs.extend(belt[0].tolist())
+            ys.extend(belt[1].tolist())
+            radii.extend((belt[2] + 1).tolist())
+            self.pick_items.extend([self.asteroid_belt] * len(belt[0]))
+        
+        for comet in self.comets:
+            xs.append(comet.screen_pos[0])
+            ys.append(comet.screen_pos[1])
+            radii.append(max(comet.screen_radius, MIN_PICK_RADIUS))
+            self.pick_items.append(comet)
+        self.picker.build(xs, ys, radii, width, height)
+    
+    def pick(self, x, y):
+        """Objek teratas di bawah titik layar (x, y), atau None"""
+        index = self.picker.pick(x, y)
+        return self.pick_items[index] if index is not None else None
+    
+    def update(self, dt):
+        # Twinkle ikut langkah fixed; mode presentasi: bintang ikut berhenti saat pause
+        if not (self.presentation and self.paused):
+            self.starfield.update(dt)
+        
+        if self.paused:
             return
         
-        for asteroid in self.asteroids:
-            x = asteroid['radius'] * math.cos(asteroid['angle'])
-            y = asteroid['radius'] * math.sin(asteroid['angle'])
+        # Sun, planets, Saturn's ring dan asteroid belt: closed-form pada waktu t
+        self.prev_t = self.clock.t
+        state = self.set_time(self.clock.advance(dt, self.time_scale))
+        self.render_alpha = 1.0
+        
+        # Update trail
+        for body, x, y in zip(self.bodies(), state['x'].tolist(), state['y'].tolist()):
+            body.trail.append(x, y)
+        
+        # Update comets
+        for comet in self.comets[:]:
+            comet.update(dt, self.time_scale)
+            # Remove comets that are too far away
+            if (comet.x < -200 or comet.x > WIDTH + 200 or 
+                comet.y < -200 or comet.y > HEIGHT + 200):
+                self.comets.remove(comet)
+    
+    def interpolate(self, alpha):
+        """Posisikan state render di antara dua langkah terakhir (0 <= alpha <= 1)
+        
+        Benda orbit cukup dievaluasi closed-form pada waktu di antaranya;
+        komet di-lerp saat draw.
+        """
+        if self.paused:
+            alpha = 1.0
+        self.render_alpha = alpha
+        self.set_time(self.prev_t + (self.clock.t - self.prev_t) * alpha)
+    
+    def change_key(self):
+        """Ringkasan input render per layer; sama dengan frame sebelumnya berarti layar tidak berubah
+        
+        FPS sengaja tidak ikut, sehingga saat diam angka FPS tidak memicu render.
+        """
+        profiler_tick = None
+        if self.show_profiler and self.profiler is not None:
+            profiler_tick = self.profiler.frames // PROFILER_REFRESH
+        return (
+            ('camera', self.camera_x, self.camera_y, self.zoom),
+            ('starfield', not (self.presentation and self.paused)),
+            ('bodies', self.clock.t, self.render_alpha, self.selected_planet()),
+            ('comets', tuple((comet.x, comet.y, comet.rotation) for comet in self.comets)),
+            ('layers', self.show_trails, self.show_orbits, self.asteroid_belt.visible),
+            ('ui', self.show_ui, self.paused, self.time_scale, profiler_tick),
+        )
+    
+    def view_key(self):
+        """Input yang memengaruhi seluruh layar; berubah berarti dirty rect = layar penuh"""
+        return (self.camera_x, self.camera_y, self.zoom, self.show_trails, self.show_orbits,
+                self.asteroid_belt.visible, self.show_ui, self.show_profiler)
+    
+    def draw(self, target, fps=0.0, phase=None, bounds=None):
+        """Gambar satu frame ke target (FrameBuffer)
+
+        phase(name) opsional mengembalikan context manager per fase.
+        bounds (LayerBounds) opsional diisi box setiap item untuk dirty rect.
+        """
+        if bounds is not None:
+            bounds.clear()
+        if phase is None:
+            phase = lambda name: contextlib.nullcontext()
+        camera_x, camera_y, zoom = self.camera_x, self.camera_y, self.zoom
+        
+        # Clear target
+        target.flush()
+        target.surface.fill(BLACK)
+        
+        # Draw starfield with camera offset for parallax
+        with phase('starfield'):
+            self.starfield.draw(target, camera_x * 0.1, camera_y * 0.1, bounds)
+        
+        # Draw orbits if enabled
+        with phase('orbits'):
+            if self.show_orbits and zoom > 0.05:
+                for planet in self.planets:
+                    if planet.orbit_radius > 0:
+                        # Draw orbit circle using points
+                        orbit_cache.draw(target, 'dots', planet.orbit_radius, camera_x, camera_y, zoom, (100, 100, 150, 30))
+        
+        with phase('planets'):
+            self.lod.begin_frame()
             
-            screen_x = CENTER_X + (x - camera_x) * zoom
-            screen_y = CENTER_Y + (y - camera_y) * zoom
-            scaled_size = max(0.5, asteroid['size'] * zoom)
+            # Draw sun
+            self.sun.draw(target, camera_x, camera_y, zoom, self.show_trails, bounds, self.lod)
             
-            if scaled_size > 0.3:
-                # Draw asteroid using midpoint circle
-                points = midpoint_circle(int(screen_x), int(screen_y), int(scaled_size))
-                for px, py in points:
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        screen.set_at((px, py), asteroid['color'])
+            # Draw planets
+            for planet in self.planets:
+                planet.draw(target, camera_x, camera_y, zoom, self.show_trails, bounds, self.lod)
+        
+        # Draw Saturn's ring
+        with phase('saturn_ring'):
+            self.saturn_ring.draw(target, camera_x, camera_y, zoom, bounds)
+        
+        # Draw asteroid belt
+        with phase('asteroids'):
+            self.asteroid_belt.draw(target, camera_x, camera_y, zoom, bounds)
+        
+        # Draw comets
+        with phase('comets'):
+            for comet in self.comets:
+                comet.draw(target, camera_x, camera_y, zoom, self.render_alpha, bounds)
+            self.build_pick_index(target.width, target.height)
+        
+        with phase('ui'):
+            # Lepas view framebuffer sebelum UI di-blit
+            target.flush()
+            
+            if self.show_ui:
+                # Draw UI panels (kiri dan kanan)
+                self.ui.draw_panel_left(target, self.paused, zoom, self.time_scale, self.selected_planet(), fps, bounds)
+                if self.show_profiler and self.profiler is not None:
+                    self.ui.draw_profiler(target, self.profiler, bounds)
+                self.ui.draw_panel_right(target, self.show_trails, self.show_orbits, self.asteroid_belt.visible, len(self.comets), bounds)
+                
+                # Draw zoom and time indicators di tengah atas (tidak ketimpa panel)
+                self.ui.draw_indicator(target, zoom, self.time_scale, bounds)
+        target.flush()
 
 # ==================== MAIN GAME LOOP ====================
 
-def main():
-    # Create celestial bodies
-    sun = CelestialBody("Matahari", 30, SUN_COLOR, 0, 0, 0.005, "sun.png")
-    
-    planets = [
-        CelestialBody("Merkurius", 5, MERCURY_COLOR, 100, 0.04, 0.01, "mercury.png"),
-        CelestialBody("Venus", 8, VENUS_COLOR, 150, 0.015, 0.008, "venus.png"),
-        CelestialBody("Bumi", 9, EARTH_COLOR, 200, 0.01, 0.015, "earth.png"),
-        CelestialBody("Mars", 7, MARS_COLOR, 260, 0.008, 0.012, "mars.png"),
-        CelestialBody("Jupiter", 20, JUPITER_COLOR, 350, 0.004, 0.02, "jupiter.png"),
-        CelestialBody("Saturnus", 18, SATURN_COLOR, 450, 0.003, 0.018, "saturn.png"),
-        CelestialBody("Uranus", 12, URANUS_COLOR, 550, 0.002, 0.01, "uranus.png"),
-        CelestialBody("Neptunus", 12, NEPTUNE_COLOR, 650, 0.001, 0.009, "neptune.png")
-    ]
-    
-    # Create systems
-    starfield = Starfield(300)
-    saturn_ring = SaturnRing(planets[5])  # Saturn is index 5
-    asteroid_belt = AsteroidBelt(280, 320, 150)
-    ui = UISystem()
-    
-    # Game state
-    camera_x, camera_y = 0, 0
-    zoom = 1.0
+def create_window():
+    """Buka window aplikasi dan kembalikan FrameBuffer untuk surface-nya"""
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("SISTEM TATA SURYA 2D - UTS GRAFIKA KOMPUTER")
+    return FrameBuffer(screen, USE_NUMPY_FRAMEBUFFER)
+
+def main(sim_hz=SIM_HZ, render_fps=RENDER_FPS, max_catch_up=MAX_CATCH_UP, presentation=False):
+    """Loop fixed timestep: update tiap 1/sim_hz detik, render dibatasi render_fps"""
+    sim_step = 1.0 / sim_hz
+    target = create_window()
+    clock = pygame.time.Clock()
+    scene = Scene()
+    scene.presentation = presentation
+    scene.sim_step = sim_step
+    profiler = FrameProfiler(('update',) + Scene.PHASES + ('flip',), PROFILER_CAPACITY)
+    scene.profiler = profiler
+    
+    # Mode presentasi: key frame terakhir yang digambar dan deteksi rect berubah
+    dirty_regions = DirtyRegions()
+    layer_bounds = LayerBounds()
+    last_key = None
+    
     min_zoom, max_zoom = 0.1, 3.0
     dragging = False
     last_mouse_pos = (0, 0)
-    paused = False
-    time_scale = 1.0
-    comets = []
-    show_trails = True
-    show_orbits = True
     
     # Create assets folder if it doesn't exist
-    if not os.path.exists("assets"):
-        os.makedirs("assets")
+    if not os.path.exists(ASSET_DIR):
+        os.makedirs(ASSET_DIR)
         print("Folder 'assets' dibuat. Silakan tambahkan gambar planet PNG ke folder tersebut.")
         print("Nama file yang diharapkan: sun.png, mercury.png, venus.png, earth.png,")
         print("mars.png, jupiter.png, saturn.png, uranus.png, neptune.png")
         print("Jika tidak ada gambar, program akan menggunakan warna default.")
     
     running = True
-    last_time = pygame.time.get_ticks()
+    last_time = time.perf_counter()
+    accumulator = 0.0
     
     while running:
-        current_time = pygame.time.get_ticks()
-        dt = (current_time - last_time) / 1000.0  # Delta time in seconds
+        current_time = time.perf_counter()
+        accumulator += current_time - last_time  # Delta time in seconds
         last_time = current_time
         
         # Handle events
@@ -1017,6 +1899,11 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
             
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Isi window hilang: gambar dan update penuh
+                last_key = None
+                dirty_regions.reset()
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     dragging = True
@@ -1027,20 +1914,18 @@ def main():
                     
                     # Skip jika klik di panel UI
                     if mouse_x > 300 and mouse_x < WIDTH - 300:
-                        for planet in planets + [sun]:
-                            px, py = planet.get_position(camera_x, camera_y, zoom)
-                            dist = math.sqrt((mouse_x - px)**2 + (mouse_y - py)**2)
-                            if dist < planet.radius * zoom:
-                                for p in planets + [sun]:
-                                    p.selected = False
-                                planet.selected = True
-                                break
+                        picked = scene.pick(mouse_x, mouse_y)
+                        # Hanya planet/matahari yang bisa dipilih; komet di atasnya menghalangi
+                        if isinstance(picked, CelestialBody):
+                            for p in scene.bodies():
+                                p.selected = False
+                            picked.selected = True
                 
                 elif event.button == 4:  # Scroll up - zoom in
-                    zoom = min(max_zoom, zoom * 1.1)
+                    scene.zoom = min(max_zoom, scene.zoom * 1.1)
                 
                 elif event.button == 5:  # Scroll down - zoom out
-                    zoom = max(min_zoom, zoom / 1.1)
+                    scene.zoom = max(min_zoom, scene.zoom / 1.1)
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:
@@ -1049,129 +1934,90 @@ def main():
             elif event.type == pygame.MOUSEMOTION:
                 if dragging:
                     mouse_x, mouse_y = pygame.mouse.get_pos()
-                    dx = (mouse_x - last_mouse_pos[0]) / zoom
-                    dy = (mouse_y - last_mouse_pos[1]) / zoom
-                    camera_x -= dx
-                    camera_y -= dy
+                    dx = (mouse_x - last_mouse_pos[0]) / scene.zoom
+                    dy = (mouse_y - last_mouse_pos[1]) / scene.zoom
+                    scene.camera_x -= dx
+                    scene.camera_y -= dy
                     last_mouse_pos = (mouse_x, mouse_y)
             
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
                 elif event.key == pygame.K_SPACE:
-                    paused = not paused
+                    scene.paused = not scene.paused
                 elif event.key == pygame.K_r:
                     # Reset simulation
-                    camera_x, camera_y = 0, 0
-                    zoom = 1.0
-                    time_scale = 1.0
-                    for planet in planets:
-                        planet.orbit_angle = random.uniform(0, 2 * math.pi)
-                        planet.trail.clear()
-                    comets.clear()
+                    scene.reset()
+                elif event.key == pygame.K_LEFTBRACKET:
+                    scene.seek(max(0.0, scene.clock.t - SEEK_STEP))
+                elif event.key == pygame.K_RIGHTBRACKET:
+                    scene.seek(scene.clock.t + SEEK_STEP)
                 elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                    time_scale = min(10.0, time_scale * 1.2)
+                    scene.time_scale = min(10.0, scene.time_scale * 1.2)
                 elif event.key == pygame.K_MINUS:
-                    time_scale = max(0.1, time_scale / 1.2)
+                    scene.time_scale = max(0.1, scene.time_scale / 1.2)
                 elif event.key == pygame.K_k:
-                    comets.append(Comet())
-                    if len(comets) > 10:
-                        comets.pop(0)
+                    scene.comets.append(Comet())
+                    if len(scene.comets) > 10:
+                        scene.comets.pop(0)
                 elif event.key == pygame.K_c:
-                    asteroid_belt.visible = not asteroid_belt.visible
+                    scene.asteroid_belt.visible = not scene.asteroid_belt.visible
                 elif event.key == pygame.K_t:
-                    show_trails = not show_trails
+                    scene.show_trails = not scene.show_trails
                 elif event.key == pygame.K_o:
-                    show_orbits = not show_orbits
-        
-        # Clear screen
-        screen.fill(BLACK)
-        
-        # Update starfield with camera offset for parallax
-        starfield.update()
-        starfield.draw(camera_x * 0.1, camera_y * 0.1)
-        
-        if not paused:
-            # Update sun
-            sun.update(dt, time_scale)
-            
-            # Update planets
-            for planet in planets:
-                planet.update(dt, time_scale)
-            
-            # Update Saturn's ring
-            saturn_ring.update(dt, time_scale)
-            
-            # Update asteroid belt
-            asteroid_belt.update(dt, time_scale)
-            
-            # Update comets
-            for comet in comets[:]:
-                comet.update(dt, time_scale)
-                # Remove comets that are too far away
-                if (comet.x < -200 or comet.x > WIDTH + 200 or 
-                    comet.y < -200 or comet.y > HEIGHT + 200):
-                    comets.remove(comet)
-        
-        # Draw orbits if enabled
-        if show_orbits and zoom > 0.05:
-            for planet in planets:
-                if planet.orbit_radius > 0:
-                    # Draw orbit circle using points
-                    for angle in range(0, 360, max(1, int(5 / zoom))):
-                        rad = math.radians(angle)
-                        x = CENTER_X + (planet.orbit_radius * math.cos(rad) - camera_x) * zoom
-                        y = CENTER_Y + (planet.orbit_radius * math.sin(rad) - camera_y) * zoom
-                        
-                        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                            alpha = 30
-                            orbit_color = (100, 100, 150, alpha)
-                            screen.set_at((int(x), int(y)), orbit_color)
-        
-        # Draw sun
-        sun.draw(camera_x, camera_y, zoom, show_trails)
-        
-        # Draw planets
-        for planet in planets:
-            planet.draw(camera_x, camera_y, zoom, show_trails)
-        
-        # Draw Saturn's ring
-        saturn_ring.draw(camera_x, camera_y, zoom)
-        
-        # Draw asteroid belt
-        asteroid_belt.draw(camera_x, camera_y, zoom)
-        
-        # Draw comets
-        for comet in comets:
-            comet.draw(camera_x, camera_y, zoom)
-        
-        # Draw UI panels (kiri dan kanan)
-        selected_planet = None
-        for planet in planets + [sun]:
-            if planet.selected:
-                selected_planet = planet
-                break
-        
-        fps = clock.get_fps()
-        ui.draw_panel_left(paused, zoom, time_scale, selected_planet, fps)
-        ui.draw_panel_right(show_trails, show_orbits, asteroid_belt.visible, len(comets))
-        
-        # Draw zoom and time indicators di tengah atas (tidak ketimpa panel)
-        indicator_bg = pygame.Surface((200, 50), pygame.SRCALPHA)
-        indicator_bg.fill((0, 0, 0, 150))
-        screen.blit(indicator_bg, (WIDTH // 2 - 100, 10))
-        
-        zoom_text = ui.small_font.render(f"Zoom: {zoom:.2f}x", True, WHITE)
-        screen.blit(zoom_text, (WIDTH // 2 - 90, 20))
+                    scene.show_orbits = not scene.show_orbits
+                elif event.key == pygame.K_p:
+                    scene.show_profiler = not scene.show_profiler
+                elif event.key == pygame.K_F12:
+                    path = profiler.dump_csv(time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+                    print(f"Profiler disimpan ke {path} ({len(profiler)} frame)")
+                elif event.key == pygame.K_F5:
+                    scene.presentation = not scene.presentation
+                    last_key = None
+                    dirty_regions.reset()
+        
+        profiler.begin_frame()
+        with profiler.scope('update'):
+            # Simulasi maju dengan langkah tetap sebanyak waktu nyata yang terkumpul
+            steps = 0
+            while accumulator >= sim_step and steps < max_catch_up:
+                scene.update(sim_step)
+                accumulator -= sim_step
+                steps += 1
+            # Tertinggal terlalu jauh: buang sisa agar tidak mengejar terus
+            if steps == max_catch_up:
+                accumulator = min(accumulator, sim_step)
+            scene.interpolate(accumulator / sim_step)
+        
+        if scene.presentation:
+            # Tidak ada yang berubah (pause, kamera diam): lewati render sepenuhnya
+            key = scene.change_key()
+            if key == last_key:
+                clock.tick(render_fps)
+                continue
+            last_key = key
         
-        time_text = ui.small_font.render(f"Time: {time_scale:.1f}x", True, WHITE)
-        screen.blit(time_text, (WIDTH // 2 - 90, 40))
+        scene.draw(target, clock.get_fps(), profiler.scope, layer_bounds if scene.presentation else None)
         
         # Update display
-        pygame.display.flip()
-        clock.tick(FPS)
+        with profiler.scope('flip'):
+            if scene.presentation:
+                rects = dirty_regions.collect_layers(target.surface, layer_bounds, scene.view_key())
+                if rects:
+                    pygame.display.update(rects)
+            else:
+                pygame.display.flip()
+        profiler.end_frame()
+        clock.tick(render_fps)
     
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Simulasi tata surya 2D")
+    parser.add_argument("--sim-hz", type=float, default=SIM_HZ, help="langkah simulasi per detik")
+    parser.add_argument("--render-fps", type=int, default=RENDER_FPS, help="batas frame render per detik")
+    parser.add_argument("--max-catch-up", type=int, default=MAX_CATCH_UP, help="langkah simulasi maksimum per frame")
+    parser.add_argument("--presentation", action="store_true", help="render hanya saat berubah, update rect yang berubah saja")
+    args = parser.parse_args()
+    main(args.sim_hz, args.render_fps, args.max_catch_up, args.presentation)
\ No newline at end of file
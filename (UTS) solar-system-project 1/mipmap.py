@@ -0,0 +1,58 @@
+# mipmap.py
+import math
+import pygame
+from collections import OrderedDict
+
+class MipPyramid:
+    """Piramida mip dari satu asset: level ukuran turun per faktor sqrt(2)
+
+    Semua smoothscale berat dilakukan sekali saat dibangun. Ukuran yang
+    diminta dilayani dari level terdekat yang tidak lebih kecil, paling
+    banyak satu scale kecil dari level itu, dan hasilnya di-cache.
+    Ukuran berarti sisi terpanjang; rasio aspek asset selalu dipertahankan.
+    """
+
+    def __init__(self, image, min_size=4, max_cached=64):
+        self.levels = [image]
+        size = max(image.get_size())
+        while size > min_size:
+            size = max(min_size, int(round(size / math.sqrt(2))))
+            self.levels.append(pygame.transform.smoothscale(self.levels[-1], self.fit(size)))
+        self.max_cached = max_cached
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def fit(self, size):
+        """(lebar, tinggi) dengan sisi terpanjang size, rasio aspek sama dengan asset"""
+        width, height = self.levels[0].get_size()
+        scale = size / max(width, height)
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def level_for(self, size):
+        """Indeks level terkecil yang ukurannya masih >= size"""
+        index = 0
+        for i, level in enumerate(self.levels):
+            if max(level.get_size()) >= size:
+                index = i
+        return index
+
+    def get(self, size):
+        """Surface dengan sisi terpanjang size"""
+        surface = self.cache.get(size)
+        if surface is not None:
+            self.hits += 1
+            self.cache.move_to_end(size)
+            return surface
+
+        self.misses += 1
+        level = self.levels[self.level_for(size)]
+        if max(level.get_size()) == size:
+            surface = level
+        else:
+            # Level terdekat paling besar sqrt(2) kali target, jadi scale ini murah
+            surface = pygame.transform.smoothscale(level, self.fit(size))
+        self.cache[size] = surface
+        if len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+        return surface
@@ -0,0 +1,61 @@
+# picking.py
+import numpy as np
+
+class PickGrid:
+    """Grid seragam di screen space untuk mencari benda teratas di bawah sebuah titik
+
+    build() dipanggil sekali per frame dengan posisi layar yang sama dengan
+    yang digambar. Urutan input adalah urutan gambar: indeks lebih besar
+    berada di atas. Setiap benda didaftarkan ke semua sel yang disentuh
+    lingkarannya, sehingga pick() cukup memeriksa isi satu sel.
+    """
+
+    def __init__(self, cell=32):
+        self.cell = cell
+        self.build(np.zeros(0), np.zeros(0), np.zeros(0), 0, 0)
+
+    def build(self, xs, ys, radii, width, height):
+        """Index ulang lingkaran (xs, ys, radii) yang beririsan dengan layar width x height"""
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.radii = np.asarray(radii, dtype=np.float64)
+        self.cols = max(1, -(-int(width) // self.cell))
+        self.rows = max(1, -(-int(height) // self.cell))
+
+        # Rentang sel bounding box setiap lingkaran, dipotong ke layar
+        x0 = np.maximum(np.floor((self.xs - self.radii) / self.cell), 0).astype(np.int64)
+        x1 = np.minimum(np.floor((self.xs + self.radii) / self.cell), self.cols - 1).astype(np.int64)
+        y0 = np.maximum(np.floor((self.ys - self.radii) / self.cell), 0).astype(np.int64)
+        y1 = np.minimum(np.floor((self.ys + self.radii) / self.cell), self.rows - 1).astype(np.int64)
+        span_x = np.maximum(x1 - x0 + 1, 0)
+        counts = span_x * np.maximum(y1 - y0 + 1, 0)
+
+        # Satu entri (sel, benda) per sel yang disentuh, dibuat tanpa loop Python
+        body = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(len(body)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = x0[body] + local % np.maximum(span_x[body], 1)
+        cy = y0[body] + local // np.maximum(span_x[body], 1)
+        keys = cy * self.cols + cx
+
+        # Urut per sel; stable menjaga urutan gambar di dalam sel
+        order = np.argsort(keys, kind='stable')
+        self.members = body[order]
+        self.starts = np.searchsorted(keys[order], np.arange(self.cols * self.rows + 1))
+
+    def pick(self, x, y):
+        """Indeks benda teratas yang lingkarannya memuat (x, y), atau None"""
+        cx = int(x // self.cell)
+        cy = int(y // self.cell)
+        if not (0 <= cx < self.cols and 0 <= cy < self.rows):
+            return None
+        key = cy * self.cols + cx
+        candidates = self.members[self.starts[key]:self.starts[key + 1]]
+        if len(candidates) == 0:
+            return None
+
+        dx = self.xs[candidates] - x
+        dy = self.ys[candidates] - y
+        hits = candidates[dx * dx + dy * dy <= self.radii[candidates] ** 2]
+        if len(hits) == 0:
+            return None
+        return int(hits[-1])
@@ -0,0 +1,86 @@
+# profiler.py
+import csv
+import time
+import contextlib
+import numpy as np
+
+class FrameProfiler:
+    """Profiler per frame: waktu setiap fase bernama disimpan di ring buffer
+
+    Satu baris per frame (detik per fase + total frame). Buffer berkapasitas
+    tetap sehingga bisa dibiarkan menyala selama sesi panjang; frame yang
+    lebih lama dari capacity otomatis tertimpa.
+    """
+
+    def __init__(self, phases, capacity=600):
+        self.phases = tuple(phases)
+        self.index = {name: i for i, name in enumerate(self.phases)}
+        self.capacity = capacity
+        # Kolom terakhir adalah total waktu frame
+        self.samples = np.zeros((capacity, len(self.phases) + 1))
+        self.frame_ids = np.zeros(capacity, dtype=np.int64)
+        self.current = np.zeros(len(self.phases) + 1)
+        self.head = 0
+        self.count = 0
+        self.frames = 0
+        self.frame_start = None
+
+    def __len__(self):
+        return self.count
+
+    def begin_frame(self):
+        self.current[:] = 0
+        self.frame_start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def scope(self, name):
+        """Context manager yang menambahkan waktu blok ke fase name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[self.index[name]] += time.perf_counter() - start
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        self.current[-1] = time.perf_counter() - self.frame_start
+        self.samples[self.head] = self.current
+        self.frame_ids[self.head] = self.frames
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames += 1
+        self.frame_start = None
+
+    def view(self):
+        """Array (count, fase + 1) berurutan dari frame terlama ke terbaru"""
+        if self.count < self.capacity:
+            return self.samples[:self.count]
+        return np.concatenate((self.samples[self.head:], self.samples[:self.head]))
+
+    def frame_times(self):
+        """Total waktu frame (detik), terlama ke terbaru"""
+        return self.view()[:, -1]
+
+    def top_phases(self, n=3, window=60):
+        """n fase dengan rata-rata waktu terbesar pada window frame terakhir"""
+        recent = self.view()[-window:]
+        if len(recent) == 0:
+            return []
+        means = recent[:, :-1].mean(axis=0)
+        order = np.argsort(means)[::-1][:n]
+        return [(self.phases[i], means[i]) for i in order]
+
+    def dump_csv(self, path):
+        """Tulis seluruh isi ring buffer ke CSV (milidetik)"""
+        rows = self.view()
+        if self.count < self.capacity:
+            ids = self.frame_ids[:self.count]
+        else:
+            ids = np.concatenate((self.frame_ids[self.head:], self.frame_ids[:self.head]))
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in self.phases] + ["frame_ms"])
+            for frame_id, row in zip(ids.tolist(), (rows * 1000).tolist()):
+                writer.writerow([frame_id] + [f"{value:.4f}" for value in row])
+        return path
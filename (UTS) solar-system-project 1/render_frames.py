@@ -0,0 +1,101 @@
+# render_frames.py
+"""Render offline simulasi tata surya ke rangkaian PNG bernomor
+
+Setiap worker (proses terpisah) membuat Scene sendiri, mengevaluasi state
+closed-form pada waktu t frame-nya lalu merender ke surface offscreen.
+Tidak ada window yang dibuka.
+
+Jalankan:
+    python render_frames.py --start 0 --end 120 --fps 30 --size 1920x1080 --out frames
+"""
+import os
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Driver dummy sebelum pygame diinisialisasi (juga di proses worker)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import main
+
+# State per proses worker, dibuat sekali oleh init_worker
+_worker = {}
+
+def init_worker(width, height, seed, zoom, time_scale, show_ui, show_trails, show_orbits):
+    random.seed(seed)
+    scene = main.Scene(ui_height=height)
+    scene.zoom = zoom
+    scene.time_scale = time_scale
+    scene.show_ui = show_ui
+    scene.show_trails = show_trails
+    scene.show_orbits = show_orbits
+    _worker['scene'] = scene
+    _worker['target'] = main.FrameBuffer(main.pygame.Surface((width, height)))
+
+def render_frame(job):
+    """Render satu frame (index, t, path) dan simpan sebagai PNG"""
+    index, t, path = job
+    scene = _worker['scene']
+    target = _worker['target']
+
+    # Semua state diturunkan dari t dan index, tidak bergantung frame sebelumnya
+    scene.set_time(t)
+    scene.fill_trails(t, scene.time_scale * scene.sim_step)
+    scene.starfield.seek(t)
+    scene.draw(target)
+    main.pygame.image.save(target.surface, path)
+    return index
+
+def frame_jobs(start, end, fps, out_dir, pattern="frame_%05d.png"):
+    """(index, t, path) untuk setiap frame dalam rentang [start, end)"""
+    count = max(0, int(round((end - start) * fps)))
+    return [(i, start + i / fps, os.path.join(out_dir, pattern % i)) for i in range(count)]
+
+def render_sequence(start, end, fps, out_dir, size=(main.WIDTH, main.HEIGHT), workers=None,
+                    seed=0, zoom=None, time_scale=1.0, show_ui=False, show_trails=True,
+                    show_orbits=True, chunksize=4):
+    """Bagi index frame ke ProcessPoolExecutor, kembalikan jumlah frame yang ditulis
+
+    zoom default mengikuti tinggi output sehingga komposisi sama di semua resolusi.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    width, height = size
+    if zoom is None:
+        zoom = height / main.HEIGHT
+
+    jobs = frame_jobs(start, end, fps, out_dir)
+    init_args = (width, height, seed, zoom, time_scale, show_ui, show_trails, show_orbits)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=init_args) as pool:
+        for _ in pool.map(render_frame, jobs, chunksize=chunksize):
+            pass
+    return len(jobs)
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render offline ke PNG bernomor")
+    parser.add_argument("--start", type=float, default=0.0, help="waktu simulasi awal (detik)")
+    parser.add_argument("--end", type=float, default=10.0, help="waktu simulasi akhir (detik)")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--size", type=parse_size, default=(main.WIDTH, main.HEIGHT), help="misal 1920x1080")
+    parser.add_argument("--out", default="frames")
+    parser.add_argument("--workers", type=int, default=None, help="default: jumlah core")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--zoom", type=float, default=None)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="skala waktu untuk trail")
+    parser.add_argument("--ui", action="store_true", help="ikut gambar panel UI")
+    parser.add_argument("--no-trails", action="store_true")
+    parser.add_argument("--no-orbits", action="store_true")
+    args = parser.parse_args()
+
+    begin = time.perf_counter()
+    count = render_sequence(args.start, args.end, args.fps, args.out, args.size, args.workers,
+                            args.seed, args.zoom, args.time_scale, args.ui,
+                            not args.no_trails, not args.no_orbits)
+    elapsed = time.perf_counter() - begin
+    print(f"{count} frame ditulis ke {args.out} dalam {elapsed:.2f} s "
+          f"({count / elapsed if elapsed else 0:.1f} frame/s)")
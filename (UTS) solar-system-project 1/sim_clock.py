@@ -0,0 +1,32 @@
+# sim_clock.py
+import math
+import numpy as np
+
+TWO_PI = 2 * math.pi
+
+def circular_angles(phase, speed, t):
+    """Sudut gerak melingkar beraturan pada waktu t (vektor, mod 2pi)
+
+    Closed-form: phase + speed * t, jadi state di t berapapun dihitung
+    langsung tanpa mengintegrasi setiap frame di antaranya.
+    """
+    return np.mod(np.asarray(phase) + np.asarray(speed) * t, TWO_PI)
+
+def circular_positions(radius, phase, speed, t):
+    """Posisi (x, y) dan sudut orbit lingkaran pada waktu t"""
+    angle = circular_angles(phase, speed, t)
+    return radius * np.cos(angle), radius * np.sin(angle), angle
+
+class SimulationClock:
+    """Waktu simulasi dalam detik (sudah dikali time_scale), bisa di-seek"""
+
+    def __init__(self, t=0.0):
+        self.t = float(t)
+
+    def advance(self, dt, time_scale=1.0):
+        self.t += dt * time_scale
+        return self.t
+
+    def seek(self, t):
+        self.t = float(t)
+        return self.t
@@ -3,7 +3,29 @@ import pygame
 import math
 import random
 import os
+import numpy as np
 from algorithms import draw_circle_midpoint, draw_ellipse_orbit
+from trail import TrailBuffer
+from dirty_regions import DirtyRegions, LayerBounds
+from ui import fonts, label_cache
+from mipmap import MipPyramid
+from sprite_cache import rotation_cache
+from picking import PickGrid
+
+# Selisih di bawah ini dianggap sudah konvergen (animasi smooth berhenti tepat di target)
+SETTLE_EPSILON = 0.01
+
+# Satu baris per benda di render list: posisi layar, radius tampil dan visibilitas
+RENDER_DTYPE = np.dtype([('x', np.float64), ('y', np.float64), ('radius', np.float64), ('visible', np.bool_)])
+
+# Batas gambar benda relatif radius (cincin Saturnus 1.8x, atmosfer 1.3x)
+RENDER_EXTENT = 1.8
+# Box dirty rect: cincin 1.8x ditambah setengah tebal garisnya
+DIRTY_EXTENT = 1.9
+
+# Radius hover relatif radius tampil, minimal beberapa piksel agar benda kecil tetap bisa dipilih
+HOVER_SCALE = 1.5
+MIN_PICK_RADIUS = 6
 
 class CelestialBody:
     def __init__(self, name, distance, radius, color, orbital_speed, rotation_speed, 
@@ -16,6 +38,7 @@ class CelestialBody:
         self.rotation_speed = rotation_speed
         self.has_atmosphere = has_atmosphere
         self.has_ring = has_ring
+        self.image_path = image_path
         
         # Posisi dan rotasi
         self.angle = random.uniform(0, 2 * math.pi)
@@ -28,12 +51,14 @@ class CelestialBody:
         
         # Handling gambar
         self.original_image = None
+        self.mip = None
         self.current_image = None
         self.has_image = False
         
         if image_path and os.path.exists(image_path):
             try:
                 self.original_image = pygame.image.load(image_path).convert_alpha()
+                self.mip = MipPyramid(self.original_image)
                 self.has_image = True
                 self.update_image_size()
             except:
@@ -41,12 +66,11 @@ class CelestialBody:
                 self.has_image = False
     
     def update_image_size(self):
-        """Update ukuran gambar dengan smooth scaling"""
-        if self.has_image and self.original_image:
+        """Update ukuran gambar dari piramida mip (tanpa smoothscale dari gambar asli)"""
+        if self.has_image and self.mip:
             target_size = int(self.radius * 2 * self.current_scale)
             target_size = max(4, min(target_size, 200))  # Batasi ukuran
-            self.current_image = pygame.transform.smoothscale(self.original_image, 
-                                                             (target_size, target_size))
+            self.current_image = self.mip.get(target_size)
     
     def update(self, dt):
         """Update dengan delta time untuk smooth animation"""
@@ -59,6 +83,8 @@ class CelestialBody:
         # Smooth scaling
         scale_diff = self.target_scale - self.current_scale
         self.current_scale += scale_diff * self.scale_speed * dt
+        if abs(self.target_scale - self.current_scale) < SETTLE_EPSILON:
+            self.current_scale = self.target_scale
         
         if self.has_image and abs(scale_diff) > 0.01:
             self.update_image_size()
@@ -69,10 +95,10 @@ class CelestialBody:
         y = center_y + self.distance * math.sin(self.angle)
         return int(x), int(y)
     
-    def draw(self, surface, center_x, center_y):
-        """Draw planet with smooth effects"""
-        x, y = self.get_position(center_x, center_y)
-        display_radius = int(self.radius * self.current_scale)
+    def draw(self, surface, x, y, display_radius):
+        """Draw planet with smooth effects di posisi layar dari render list"""
+        x, y = int(x), int(y)
+        display_radius = int(display_radius)
         
         # Gambar atmosfer (jika ada)
         if self.has_atmosphere and display_radius > 5:
@@ -84,8 +110,9 @@ class CelestialBody:
         if self.has_image and self.current_image:
             # Rotasi smooth
             if display_radius > 8:  # Hanya rotasi jika cukup besar
-                rotation_angle = math.degrees(self.rotation) % 360
-                rotated_img = pygame.transform.rotate(self.current_image, rotation_angle)
+                # Level mip (ukuran gambar) menjadi level di cache rotasi
+                rotated_img = rotation_cache.get(self.image_path, self.current_image.get_width(),
+                                                 self.current_image, self.rotation)
                 img_rect = rotated_img.get_rect(center=(x, y))
                 surface.blit(rotated_img, img_rect)
             else:
@@ -169,8 +196,18 @@ class SolarSystem:
         
         # Informasi planet yang sedang dihover
         self.hovered_planet = None
+        self.hovered_index = None
         self.info_panel = None
         
+        # Render list frame terakhir: baris planet lalu satu baris bulan
+        self.render_list = np.zeros(len(self.planets) + 1, dtype=RENDER_DTYPE)
+        self.moon_index = len(self.planets)
+        self.earth_index = 3
+        # Index picking di screen space, dibangun ulang bersama render list;
+        # pick_offset = jumlah komet di depan baris render list
+        self.picker = PickGrid()
+        self.pick_offset = 0
+        
         # Zoom dan camera
         self.zoom_level = 1.0
         self.target_zoom = 1.0
@@ -181,6 +218,11 @@ class SolarSystem:
         
         # TAMBAH ATTRIBUTE INI
         self.paused = False
+        
+        # Mode presentasi (render_on_demand): key frame terakhir dan rect yang berubah
+        self.last_change_key = None
+        self.dirty_regions = DirtyRegions()
+        self.layer_bounds = LayerBounds()
     
     def init_comets(self):
         """Initialize comets with realistic trajectories"""
@@ -191,7 +233,7 @@ class SolarSystem:
                 "vx": random.uniform(-1.5, -0.5),
                 "vy": random.uniform(-0.3, 0.3),
                 "size": random.uniform(2, 4),
-                "trail": [],
+                "trail": TrailBuffer(15),
                 "max_trail": 15
             })
     
@@ -210,9 +252,7 @@ class SolarSystem:
         # Update comets (translasi linear)
         for comet in self.comets:
             # Simpan posisi untuk trail
-            comet["trail"].append((comet["x"], comet["y"]))
-            if len(comet["trail"]) > comet["max_trail"]:
-                comet["trail"].pop(0)
+            comet["trail"].append(comet["x"], comet["y"])
             
             # Translasi posisi
             comet["x"] += comet["vx"] * dt * 60  # Normalize untuk 60 FPS
@@ -224,7 +264,7 @@ class SolarSystem:
                 comet["y"] = random.randint(100, 700)
                 comet["vx"] = random.uniform(-1.5, -0.5)
                 comet["vy"] = random.uniform(-0.3, 0.3)
-                comet["trail"] = []
+                comet["trail"].clear()
         
         # Smooth camera movement
         camera_speed = 0.1 * dt * 60
@@ -235,41 +275,141 @@ class SolarSystem:
         zoom_speed = 0.05 * dt * 60
         self.zoom_level += (self.target_zoom - self.zoom_level) * zoom_speed
         
+        # Snap ke target saat sudah konvergen sehingga state benar-benar diam
+        if abs(self.target_camera_x - self.camera_x) < SETTLE_EPSILON:
+            self.camera_x = self.target_camera_x
+        if abs(self.target_camera_y - self.camera_y) < SETTLE_EPSILON:
+            self.camera_y = self.target_camera_y
+        if abs(self.target_zoom - self.zoom_level) < SETTLE_EPSILON * 0.1:
+            self.zoom_level = self.target_zoom
+        
         # Update hover effect
         self.update_hover_effect()
     
-    def update_hover_effect(self):
-        """Update highlight pada planet yang dihover"""
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        
-        self.hovered_planet = None
+    def update_hover_effect(self, mouse_pos=None):
+        """Update highlight pada planet teratas di bawah mouse (lewat index picking)"""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        
+        # Komet digambar paling bawah: jika komet teratas, tidak ada benda yang dihover
+        index = self.picker.pick(*mouse_pos)
+        if index is not None:
+            index -= self.pick_offset
+            if index < 0:
+                index = None
+        self.hovered_index = index
+        self.hovered_planet = self.planets[index] if index is not None and index < self.moon_index else None
         for planet in self.planets:
-            px, py = planet.get_position(self.center_x + self.camera_x, 
-                                        self.center_y + self.camera_y)
-            dx = mouse_x - px
-            dy = mouse_y - py
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance < planet.radius * planet.current_scale * 1.5:
-                self.hovered_planet = planet
-                planet.set_highlight(True)
-                
-                # Update info panel
-                self.info_panel = {
-                    "name": planet.name,
-                    "distance": f"{planet.distance:.0f} unit",
-                    "radius": f"{planet.radius:.1f} unit",
-                    "speed": f"{planet.orbital_speed * 100:.2f}°/s"
-                }
-                break
-            else:
-                planet.set_highlight(False)
+            planet.set_highlight(planet is self.hovered_planet)
+        
+        if self.hovered_planet:
+            planet = self.hovered_planet
+            # Update info panel
+            self.info_panel = {
+                "name": planet.name,
+                "distance": f"{planet.distance:.0f} unit",
+                "radius": f"{planet.radius:.1f} unit",
+                "speed": f"{planet.orbital_speed * 100:.2f}°/s"
+            }
+        elif index == self.moon_index:
+            # Bulan: jarak relatif terhadap Bumi
+            self.info_panel = {
+                "name": "Bulan",
+                "distance": f"{self.moon['distance']:.0f} unit",
+                "radius": f"{self.moon['radius']:.1f} unit",
+                "speed": f"{self.moon['speed'] * 100:.2f}°/s"
+            }
+    
+    def change_key(self):
+        """Ringkasan semua state yang mempengaruhi gambar; sama berarti frame tidak berubah"""
+        return (
+            tuple((planet.angle, planet.rotation, planet.current_scale) for planet in self.planets),
+            self.moon["angle"],
+            tuple((comet["x"], comet["y"], len(comet["trail"])) for comet in self.comets),
+            self.camera_x, self.camera_y, self.zoom_level,
+            self.hovered_index,
+        )
+    
+    def render_on_demand(self, surface, background=(0, 0, 0)):
+        """Mode presentasi: gambar hanya jika state berubah
+        
+        Mengembalikan rect yang berubah untuk pygame.display.update(rects);
+        list kosong berarti tidak ada yang perlu ditampilkan.
+        """
+        key = self.change_key()
+        if key == self.last_change_key:
+            return []
+        self.last_change_key = key
+        
+        surface.fill(background)
+        self.draw(surface, self.layer_bounds)
+        view_key = (self.camera_x, self.camera_y, self.zoom_level)
+        return self.dirty_regions.collect_layers(surface, self.layer_bounds, view_key)
     
-    def draw(self, surface):
-        """Draw semua objek dengan efek smooth"""
+    def invalidate(self):
+        """Paksa render dan update penuh berikutnya (window expose, ganti mode)"""
+        self.last_change_key = None
+        self.dirty_regions.reset()
+    
+    def build_render_list(self, width, height):
+        """Hitung posisi layar, radius dan visibilitas semua benda sekali per frame
+        
+        Hasilnya array RENDER_DTYPE yang dibaca oleh draw, hover dan panel info;
+        state model (radius, posisi) tidak diubah.
+        """
+        eff_center_x = self.center_x + self.camera_x
+        eff_center_y = self.center_y + self.camera_y
+        zoom = self.zoom_level
+        
+        distance = np.array([planet.distance for planet in self.planets], dtype=np.float64)
+        angle = np.array([planet.angle for planet in self.planets], dtype=np.float64)
+        scale = np.array([planet.radius * planet.current_scale for planet in self.planets], dtype=np.float64)
+        
+        rows = self.render_list
+        planets = rows[:self.moon_index]
+        planets['x'] = eff_center_x + distance * zoom * np.cos(angle)
+        planets['y'] = eff_center_y + distance * zoom * np.sin(angle)
+        planets['radius'] = scale * zoom
+        
+        # Bulan mengorbit posisi layar Bumi
+        earth = rows[self.earth_index]
+        moon = rows[self.moon_index]
+        moon_distance = self.moon["distance"] * zoom
+        moon['x'] = earth['x'] + moon_distance * math.cos(self.moon["angle"])
+        moon['y'] = earth['y'] + moon_distance * math.sin(self.moon["angle"])
+        moon['radius'] = self.moon["radius"] * zoom
+        
+        extent = rows['radius'] * RENDER_EXTENT
+        rows['visible'] = ((rows['x'] + extent >= 0) & (rows['x'] - extent < width) &
+                           (rows['y'] + extent >= 0) & (rows['y'] - extent < height))
+        # Orbit bulan ikut terlihat selama Bumi terlihat
+        moon['visible'] = moon['visible'] or earth['visible']
+        
+        # Urutan pick = urutan gambar: komet, planet, lalu bulan (jika digambar);
+        # indeks terbesar yang kena adalah yang teratas
+        moon_drawn = moon['visible'] and moon['radius'] > 1
+        drawn = rows[:self.moon_index + 1] if moon_drawn else rows[:self.moon_index]
+        comet_x = [comet["x"] for comet in self.comets]
+        comet_y = [comet["y"] for comet in self.comets]
+        comet_r = [max(comet["size"], MIN_PICK_RADIUS) for comet in self.comets]
+        self.pick_offset = len(self.comets)
+        self.picker.build(np.concatenate((comet_x, drawn['x'])),
+                          np.concatenate((comet_y, drawn['y'])),
+                          np.concatenate((comet_r, np.maximum(drawn['radius'] * HOVER_SCALE, MIN_PICK_RADIUS))),
+                          width, height)
+        return rows
+    
+    def draw(self, surface, bounds=None):
+        """Draw semua objek dengan efek smooth
+
+        bounds (LayerBounds) opsional diisi box setiap benda untuk dirty rect.
+        """
+        if bounds is not None:
+            bounds.clear()
         # Calculate effective center with camera
         eff_center_x = self.center_x + self.camera_x
         eff_center_y = self.center_y + self.camera_y
+        rows = self.build_render_list(surface.get_width(), surface.get_height())
         
         # Gambar orbit (hanya untuk planet)
         for planet in self.planets[1:]:
@@ -282,63 +422,63 @@ class SolarSystem:
         
         # Gambar komet (translasi linear)
         for comet in self.comets:
-            # Gambar trail
-            for i, (trail_x, trail_y) in enumerate(comet["trail"]):
-                alpha = int(100 * (i / len(comet["trail"])))
-                size = comet["size"] * (i / len(comet["trail"]))
-                if size > 0.5:
-                    trail_color = (150, 200, 255, alpha)
-                    pygame.draw.circle(surface, trail_color[:3], 
-                                     (int(trail_x), int(trail_y)), int(size))
+            # Gambar trail (ukuran dihitung untuk seluruh trail sekaligus)
+            trail = comet["trail"].view()
+            if len(trail):
+                sizes = comet["size"] * np.arange(len(trail)) / len(trail)
+                visible = sizes > 0.5
+                for (trail_x, trail_y), size in zip(trail[visible].astype(int).tolist(),
+                                                    sizes[visible].astype(int).tolist()):
+                    pygame.draw.circle(surface, (150, 200, 255), (trail_x, trail_y), size)
             
             # Gambar kepala komet
             pygame.draw.circle(surface, (200, 230, 255), 
                              (int(comet["x"]), int(comet["y"])), int(comet["size"]))
-        
-        # Gambar planet dengan zoom
-        for planet in self.planets:
-            # Apply zoom ke distance untuk posisi
-            scaled_distance = planet.distance * self.zoom_level
-            angle = planet.angle
-            
-            # Hitung posisi dengan zoom
-            if planet.name == "Matahari":
-                px, py = eff_center_x, eff_center_y
-            else:
-                px = eff_center_x + scaled_distance * math.cos(angle)
-                py = eff_center_y + scaled_distance * math.sin(angle)
             
-            # Simpan posisi yang sudah di-scale untuk drawing
-            planet._temp_pos = (int(px), int(py))
-            
-            # Apply zoom ke radius untuk drawing
-            original_radius = planet.radius
-            planet.radius = original_radius * self.zoom_level
-            planet.draw(surface, eff_center_x, eff_center_y)
-            planet.radius = original_radius  # Kembalikan ke original
+            if bounds is not None:
+                # Box setiap lingkaran trail; ukuran gambar ikut dibandingkan karena
+                # ukuran titik trail berubah saat titik itu menua
+                r = int(comet["size"]) + 1
+                if len(trail):
+                    points = trail.astype(int)
+                    drawn = np.where(visible, sizes.astype(int), 0)
+                    bounds.add(('comet_trail', id(comet)), None,
+                               np.column_stack((points - r, points + r + 1, drawn)))
+                bounds.add_circle(('comet', id(comet)), None, comet["x"], comet["y"], r)
+        
+        # Gambar planet dengan zoom (posisi dan radius dari render list)
+        for planet, row in zip(self.planets, rows.tolist()):
+            x, y, radius, visible = row
+            if visible:
+                planet.draw(surface, x, y, radius)
+                if bounds is not None:
+                    bounds.add_circle(('body', planet.name), (planet.rotation, planet.current_scale),
+                                      x, y, radius * DIRTY_EXTENT + 1)
         
         # Gambar bulan (mengorbit Bumi)
-        earth = self.planets[3]  # Bumi
-        earth_pos = earth._temp_pos if hasattr(earth, '_temp_pos') else earth.get_position(eff_center_x, eff_center_y)
-        
-        moon_angle = self.moon["angle"]
-        moon_distance = self.moon["distance"] * self.zoom_level
-        moon_x = earth_pos[0] + moon_distance * math.cos(moon_angle)
-        moon_y = earth_pos[1] + moon_distance * math.sin(moon_angle)
-        
-        moon_radius = self.moon["radius"] * self.zoom_level
-        if moon_radius > 1:
+        earth = rows[self.earth_index]
+        moon = rows[self.moon_index]
+        if moon['visible'] and moon['radius'] > 1:
+            earth_pos = (int(earth['x']), int(earth['y']))
             pygame.draw.circle(surface, self.moon["color"], 
-                             (int(moon_x), int(moon_y)), int(moon_radius))
+                             (int(moon['x']), int(moon['y'])), int(moon['radius']))
             
             # Orbit bulan
             moon_orbit_color = (150, 150, 180, 30)
             pygame.draw.circle(surface, moon_orbit_color[:3], earth_pos, 
-                             int(moon_distance), 1)
+                             int(self.moon["distance"] * self.zoom_level), 1)
+            if bounds is not None:
+                # Orbit bulan beserta bulannya, berpusat di Bumi
+                bounds.add_circle(('body', 'moon'), self.moon["angle"], earth_pos[0], earth_pos[1],
+                                  self.moon["distance"] * self.zoom_level + moon['radius'] + 1)
         
         # Gambar informasi jika ada planet dihover
-        if self.hovered_planet and self.info_panel:
-            self.draw_planet_info(surface, self.hovered_planet._temp_pos)
+        if self.hovered_index is not None and self.info_panel:
+            row = rows[self.hovered_index]
+            panel = self.draw_planet_info(surface, (int(row['x']), int(row['y'])))
+            if bounds is not None:
+                bounds.add('info_panel', tuple(self.info_panel.values()), [
+                    (panel.left, panel.top, panel.right, panel.bottom)])
         
         # Gambar informasi zoom
         self.draw_zoom_info(surface)
@@ -368,8 +508,8 @@ class SolarSystem:
         surface.blit(panel_surf, (panel_x, panel_y))
         
         # Informasi planet
-        font = pygame.font.Font(None, 24)
-        small_font = pygame.font.Font(None, 20)
+        font = fonts.get(None, 24)
+        small_font = fonts.get(None, 20)
         
         info_lines = [
             self.info_panel["name"],
@@ -381,19 +521,20 @@ class SolarSystem:
         for i, line in enumerate(info_lines):
             color = (255, 220, 100) if i == 0 else (220, 220, 240)
             text_font = font if i == 0 else small_font
-            text = text_font.render(line, True, color)
+            text = label_cache.render(text_font, line, color)
             surface.blit(text, (panel_x + 10, panel_y + 10 + i * 28))
+        return pygame.Rect(panel_x, panel_y, panel_width, panel_height)
     
     def draw_zoom_info(self, surface):
         """Draw informasi zoom level"""
         zoom_text = f"Zoom: {self.zoom_level:.2f}x"
-        font = pygame.font.Font(None, 24)
-        text = font.render(zoom_text, True, (200, 200, 255))
+        font = fonts.get(None, 24)
+        text = label_cache.render(font, zoom_text, (200, 200, 255))
         surface.blit(text, (20, surface.get_height() - 40))
         
         # Camera position
         cam_text = f"Posisi: ({int(self.camera_x)}, {int(self.camera_y)})"
-        cam_text_surf = font.render(cam_text, True, (200, 200, 255))
+        cam_text_surf = label_cache.render(font, cam_text, (200, 200, 255))
         surface.blit(cam_text_surf, (20, surface.get_height() - 70))
     
     def zoom_in(self):
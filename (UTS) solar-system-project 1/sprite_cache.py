@@ -0,0 +1,120 @@
+# sprite_cache.py
+import math
+import pygame
+from collections import OrderedDict
+
+class SpriteCache:
+    """Cache surface hasil render dengan batas memori dan eviksi LRU
+
+    Key bebas (biasanya tuple nilai yang sudah dikuantisasi). Ukuran setiap
+    entri dihitung dari width * height * bytesize surface.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key):
+        """Ambil surface dari cache (None jika tidak ada)"""
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key, surface):
+        """Simpan surface, buang entri paling lama tidak dipakai jika penuh"""
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.resident_bytes -= self.surface_bytes(old)
+
+        size = self.surface_bytes(surface)
+        if size > self.max_bytes:
+            return surface
+
+        while self.entries and self.resident_bytes + size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.resident_bytes -= self.surface_bytes(evicted)
+            self.evictions += 1
+
+        self.entries[key] = surface
+        self.resident_bytes += size
+        return surface
+
+    def get_or_render(self, key, render):
+        """Lookup cache, panggil render() hanya saat miss"""
+        surface = self.get(key)
+        if surface is None:
+            surface = self.put(key, render())
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.resident_bytes = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Counter untuk tuning kuantisasi"""
+        return {
+            "entries": len(self.entries),
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate(),
+        }
+
+class RotationCache:
+    """Sprite pra-rotasi: steps bucket sudut per (asset, level ukuran), diisi lazy
+
+    asset sebaiknya path file gambar (bukan nama benda) agar dua aplikasi
+    dengan nama planet sama tidak saling menimpa; level adalah ukuran
+    gambar yang diputar (misal level mip). Semua asset berbagi satu
+    SpriteCache sehingga batas memori dan eviksi LRU berlaku global.
+    steps bisa diatur antara 32 dan 360.
+    """
+
+    MIN_STEPS = 32
+    MAX_STEPS = 360
+
+    def __init__(self, steps=72, max_bytes=16 * 1024 * 1024):
+        self.cache = SpriteCache(max_bytes)
+        self.set_steps(steps)
+
+    def set_steps(self, steps):
+        """Ganti jumlah bucket sudut; isi cache lama dibuang"""
+        if not self.MIN_STEPS <= steps <= self.MAX_STEPS:
+            raise ValueError(f"steps harus {self.MIN_STEPS}..{self.MAX_STEPS}, bukan {steps}")
+        self.steps = steps
+        self.cache.clear()
+
+    def bucket(self, angle):
+        """Indeks bucket untuk sudut dalam radian"""
+        return round(angle / (2 * math.pi) * self.steps) % self.steps
+
+    def get(self, asset, level, image, angle):
+        """image (milik asset pada level ukuran level) yang diputar angle radian"""
+        bucket = self.bucket(angle)
+        return self.cache.get_or_render((asset, level, bucket), lambda: pygame.transform.rotate(
+            image, bucket * 360.0 / self.steps
+        ))
+
+    def stats(self):
+        return dict(self.cache.stats(), steps=self.steps)
+
+# Cache rotasi bersama untuk seluruh proses
+rotation_cache = RotationCache()
@@ -0,0 +1,55 @@
+# test_asteroid_culling.py
+import os
+import random
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import main
+
+def render_belt(belt, camera_x, camera_y, zoom, cull=True):
+    """Pixel hasil draw belt pada surface offscreen hitam"""
+    target = main.FrameBuffer(main.pygame.Surface((main.WIDTH, main.HEIGHT)))
+    if not cull:
+        # Tanpa culling: semua asteroid diproyeksikan dan digambar
+        belt.candidates = lambda *args: None
+    try:
+        belt.draw(target, camera_x, camera_y, zoom)
+    finally:
+        belt.__dict__.pop('candidates', None)
+    target.flush()
+    return main.pygame.surfarray.array2d(target.surface)
+
+@pytest.mark.parametrize("seed", range(8))
+def test_culled_draw_matches_full_draw(seed):
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    belt = main.AsteroidBelt(280, 320, 2000)
+
+    # Waktu acak, termasuk yang cukup jauh untuk memicu rebase grid sudut
+    for t in np.sort(rng.uniform(0, 2e5, 6)):
+        belt.set_time(float(t))
+        zoom = float(np.exp(rng.uniform(np.log(0.2), np.log(5.0))))
+        camera_x, camera_y = rng.uniform(-450, 450, 2)
+        culled = render_belt(belt, camera_x, camera_y, zoom)
+        full = render_belt(belt, camera_x, camera_y, zoom, cull=False)
+        assert np.array_equal(culled, full), (t, camera_x, camera_y, zoom)
+
+def test_candidates_cover_visible_asteroids():
+    random.seed(1)
+    belt = main.AsteroidBelt(280, 320, 5000)
+    target = main.FrameBuffer(main.pygame.Surface((main.WIDTH, main.HEIGHT)))
+    for t, camera_x, camera_y, zoom in [(0.0, 300, 0, 3.0), (500.0, -290, 120, 4.5), (9e4, 0, -310, 2.0)]:
+        belt.set_time(t)
+        index = belt.candidates(target, camera_x, camera_y, zoom)
+        angle = belt.angles_at(t)
+        x = target.width // 2 + (belt.radius * np.cos(angle) - camera_x) * zoom
+        y = target.height // 2 + (belt.radius * np.sin(angle) - camera_y) * zoom
+        margin = belt.size * zoom + 1
+        visible = np.flatnonzero((x + margin >= 0) & (x - margin < target.width) &
+                                 (y + margin >= 0) & (y - margin < target.height))
+        assert index is not None and len(index) < len(belt)
+        assert np.isin(visible, index).all()
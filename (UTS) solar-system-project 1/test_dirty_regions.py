@@ -0,0 +1,66 @@
+# test_dirty_regions.py
+import os
+import random
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import main
+from dirty_regions import DirtyRegions, LayerBounds
+
+pygame = main.pygame
+
+def present(shown, surface, rects):
+    """Tiru display.update(rects): hanya rect yang berubah yang disalin ke layar"""
+    for rect in rects:
+        shown.blit(surface, rect, rect)
+
+def pixels(surface):
+    return pygame.surfarray.array2d(surface)
+
+@pytest.mark.parametrize("seed", range(2))
+def test_presented_frame_matches_full_blit(seed):
+    random.seed(seed)
+    target = main.FrameBuffer(pygame.Surface((main.WIDTH, main.HEIGHT)))
+    surface = target.surface
+    shown = pygame.Surface(surface.get_size(), 0, surface)
+    scene = main.Scene()
+    scene.presentation = True
+    scene.planets[2].selected = True
+    regions, bounds = DirtyRegions(), LayerBounds()
+    partial = 0
+
+    for frame in range(120):
+        # Zoom, pause dan komet baru di tengah jalan
+        if frame == 40:
+            scene.zoom = 2.0
+        if frame == 70:
+            scene.paused = True
+        if frame == 85:
+            scene.paused = False
+        if frame % 25 == 0:
+            scene.comets.append(main.Comet())
+        scene.update(1 / 60)
+        scene.draw(target, 60.0, None, bounds)
+        rects = regions.collect_layers(surface, bounds, scene.view_key())
+        partial += rects != [surface.get_rect()]
+        present(shown, surface, rects)
+        assert np.array_equal(pixels(shown), pixels(surface)), frame
+    # Sebagian besar frame memang hanya meng-update sebagian layar
+    assert partial > 100
+
+def test_pixel_fallback():
+    surface = pygame.Surface((100, 70), 0, 32)
+    regions = DirtyRegions(tile=32)
+    assert regions.collect(surface) == [surface.get_rect()]
+    assert regions.collect(surface) == []
+
+    surface.set_at((40, 65), (255, 255, 255))
+    rects = regions.collect(surface)
+    assert any(rect.collidepoint(40, 65) for rect in rects)
+    # Tile terakhir dipotong ke ukuran surface
+    assert all(surface.get_rect().contains(rect) for rect in rects)
+    assert regions.collect(surface) == []
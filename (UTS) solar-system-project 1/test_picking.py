@@ -0,0 +1,65 @@
+# test_picking.py
+import numpy as np
+import pytest
+
+from picking import PickGrid
+
+WIDTH, HEIGHT = 1200, 800
+
+def linear_pick(xs, ys, radii, x, y):
+    """Referensi: benda terakhir (teratas) yang lingkarannya memuat (x, y)"""
+    hit = None
+    for i in range(len(xs)):
+        if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 <= radii[i] ** 2:
+            hit = i
+    return hit
+
+def random_circles(rng, count):
+    # Sebagian pusat di luar layar agar lingkaran yang terpotong tepi ikut diuji
+    xs = rng.uniform(-150, WIDTH + 150, count)
+    ys = rng.uniform(-150, HEIGHT + 150, count)
+    radii = rng.uniform(1, 120, count)
+    return xs, ys, radii
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("cell", [16, 32, 57])
+def test_pick_matches_linear_scan(seed, cell):
+    rng = np.random.default_rng(seed)
+    xs, ys, radii = random_circles(rng, 60)
+    grid = PickGrid(cell)
+    grid.build(xs, ys, radii, WIDTH, HEIGHT)
+
+    for x, y in zip(rng.uniform(0, WIDTH, 500), rng.uniform(0, HEIGHT, 500)):
+        assert grid.pick(x, y) == linear_pick(xs, ys, radii, x, y)
+
+def test_circle_straddling_cells():
+    # Lingkaran tepat di sudut empat sel: semua sel yang disentuh harus memuatnya
+    grid = PickGrid(32)
+    grid.build([64.0], [64.0], [10.0], WIDTH, HEIGHT)
+    for x, y in [(58, 58), (70, 58), (58, 70), (70, 70), (64, 54.5), (64, 73.5)]:
+        assert grid.pick(x, y) == 0
+    assert grid.pick(75, 75) is None
+
+def test_topmost_wins_across_cells():
+    # Benda besar di bawah, benda kecil di atas yang melintasi batas sel
+    xs, ys, radii = [100.0, 96.0], [100.0, 96.0], [80.0, 6.0]
+    grid = PickGrid(32)
+    grid.build(xs, ys, radii, WIDTH, HEIGHT)
+    assert grid.pick(96, 96) == 1
+    assert grid.pick(92, 93) == 1
+    assert grid.pick(60, 60) == 0
+
+def test_offscreen_circles():
+    grid = PickGrid(32)
+    # Seluruhnya di luar layar, dan sebagian masuk dari tepi kiri atas
+    grid.build([-300.0, WIDTH + 50.0, -20.0], [100.0, HEIGHT + 50.0, -20.0], [40.0, 20.0, 40.0],
+               WIDTH, HEIGHT)
+    assert grid.pick(0, 100) is None
+    assert grid.pick(WIDTH - 1, HEIGHT - 1) is None
+    assert grid.pick(2, 2) == 2
+    assert grid.pick(-5, 5) is None  # titik di luar layar tidak pernah kena
+
+def test_empty_grid():
+    grid = PickGrid(32)
+    grid.build([], [], [], WIDTH, HEIGHT)
+    assert grid.pick(10, 10) is None
@@ -0,0 +1,95 @@
+# test_sim_clock.py
+import math
+import os
+import random
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import main
+from sim_clock import SimulationClock, circular_angles, circular_positions
+
+DT = 1 / 60
+
+def angle_error(a, b):
+    """Selisih sudut terkecil (mod 2pi)"""
+    return np.abs((np.asarray(a) - np.asarray(b) + math.pi) % (2 * math.pi) - math.pi)
+
+def stepped_bodies(scene, steps, time_scales):
+    """Referensi: loop update lama, sudut ditambah kecepatan * dt setiap langkah"""
+    result = []
+    for body in scene.bodies():
+        orbit_angle, rotation_angle, marker_phase = body.orbit_phase, body.rotation_phase, 0.0
+        trail = []
+        for step in range(steps):
+            time_scale = time_scales[step]
+            orbit_angle = (orbit_angle + body.orbit_speed * DT * time_scale) % (2 * math.pi)
+            rotation_angle = (rotation_angle + body.rotation_speed * DT * time_scale * 2.0) % (2 * math.pi)
+            marker_phase += body.rotation_speed * DT * time_scale * 1.5
+            trail.append((body.orbit_radius * math.cos(orbit_angle), body.orbit_radius * math.sin(orbit_angle)))
+            if len(trail) > body.max_trail_length:
+                trail.pop(0)
+        result.append((orbit_angle, rotation_angle, marker_phase, trail))
+    return result
+
+def test_circular_positions_match_stepping():
+    rng = np.random.default_rng(0)
+    radius = rng.uniform(50, 700, 16)
+    phase = rng.uniform(0, 2 * math.pi, 16)
+    speed = rng.uniform(-0.05, 0.05, 16)
+
+    angle = phase.copy()
+    for step in range(1, 2001):
+        angle = np.mod(angle + speed * DT, 2 * math.pi)
+        if step % 250 == 0:
+            x, y, closed = circular_positions(radius, phase, speed, step * DT)
+            assert angle_error(closed, angle).max() < 1e-9
+            assert np.allclose(x, radius * np.cos(angle), atol=1e-7)
+            assert np.allclose(y, radius * np.sin(angle), atol=1e-7)
+            assert np.array_equal(closed, circular_angles(phase, speed, step * DT))
+
+def test_clock_advance_and_seek():
+    clock = SimulationClock()
+    for _ in range(120):
+        clock.advance(DT, 2.0)
+    assert clock.t == pytest.approx(4.0)
+    assert clock.seek(10) == 10.0 and clock.t == 10.0
+
+def test_scene_update_matches_stepped_loop():
+    random.seed(3)
+    scene = main.Scene()
+    scene.comets.clear()
+    steps = 300
+    # time_scale berubah di tengah jalan: closed-form harus memakai waktu simulasi, bukan jumlah frame
+    time_scales = [1.0] * 100 + [3.5] * 150 + [0.5] * 50
+    expected = stepped_bodies(scene, steps, time_scales)
+    ring_angle = scene.saturn_ring.rotation_phase
+
+    for step in range(steps):
+        scene.time_scale = time_scales[step]
+        scene.update(DT)
+        ring_angle += scene.saturn_ring.rotation_speed * DT * time_scales[step]
+
+    for body, (orbit_angle, rotation_angle, marker_phase, trail) in zip(scene.bodies(), expected):
+        assert angle_error(body.orbit_angle, orbit_angle) < 1e-9, body.name
+        assert angle_error(body.rotation_angle, rotation_angle) < 1e-9, body.name
+        for marker in body.rotation_markers:
+            assert angle_error(marker['angle'], marker['base_angle'] + marker_phase) < 1e-9
+        assert np.allclose(body.trail.view(), trail, atol=1e-7), body.name
+    assert angle_error(scene.saturn_ring.rotation_angle, ring_angle) < 1e-9
+
+def test_seek_matches_stepped_loop():
+    random.seed(4)
+    scene = main.Scene()
+    steps = 240
+    expected = stepped_bodies(scene, steps, [1.0] * steps)
+
+    # Seek langsung ke waktu akhir: trail dibangun ulang dari posisi closed-form
+    scene.seek(steps * DT)
+    for body, (orbit_angle, rotation_angle, _, trail) in zip(scene.bodies(), expected):
+        assert angle_error(body.orbit_angle, orbit_angle) < 1e-9, body.name
+        assert angle_error(body.rotation_angle, rotation_angle) < 1e-9, body.name
+        assert np.allclose(body.trail.view(), trail, atol=1e-7), body.name
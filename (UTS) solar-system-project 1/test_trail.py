@@ -0,0 +1,45 @@
+# test_trail.py
+import numpy as np
+import pytest
+
+from trail import TrailBuffer
+
+def list_trail(points, max_length):
+    """Referensi: trail lama berbasis list dengan append + pop(0)"""
+    trail = []
+    for point in points:
+        trail.append(point)
+        if len(trail) > max_length:
+            trail.pop(0)
+    return trail
+
+@pytest.mark.parametrize("capacity", [1, 2, 7, 50])
+def test_ring_matches_list(capacity):
+    rng = np.random.default_rng(capacity)
+    points = [tuple(p) for p in rng.uniform(-500, 500, (capacity * 3 + 2, 2)).tolist()]
+    buffer = TrailBuffer(capacity)
+
+    # Bandingkan setelah setiap append: sebelum penuh, tepat penuh, dan setelah beberapa kali wrap
+    for n, (x, y) in enumerate(points, 1):
+        buffer.append(x, y)
+        expected = list_trail(points[:n], capacity)
+        assert len(buffer) == len(expected)
+        assert list(buffer) == expected
+        assert buffer.view().tolist() == [list(p) for p in expected]
+
+def test_view_is_contiguous_slice():
+    buffer = TrailBuffer(4)
+    for i in range(10):
+        buffer.append(i, -i)
+    view = buffer.view()
+    assert view.base is buffer.points
+    assert view[:, 0].tolist() == [6, 7, 8, 9]
+
+def test_clear():
+    buffer = TrailBuffer(3)
+    for i in range(5):
+        buffer.append(i, i)
+    buffer.clear()
+    assert len(buffer) == 0 and list(buffer) == []
+    buffer.append(1.5, 2.5)
+    assert list(buffer) == [(1.5, 2.5)]
@@ -0,0 +1,39 @@
+# trail.py
+import numpy as np
+
+class TrailBuffer:
+    """Ring buffer berkapasitas tetap untuk titik trail (x, y)
+
+    Setiap titik ditulis dua kali (slot head dan head + capacity), sehingga
+    view() selalu berupa slice kontigu dari yang terlama ke terbaru tanpa
+    menyalin data. append() O(1), tanpa pop(0).
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.points = np.zeros((capacity * 2, 2))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, x, y):
+        self.points[self.head] = (x, y)
+        self.points[self.head + self.capacity] = (x, y)
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def view(self):
+        """Array (count, 2) berurutan dari titik terlama ke terbaru"""
+        if self.count < self.capacity:
+            return self.points[:self.count]
+        return self.points[self.head:self.head + self.capacity]
+
+    def __iter__(self):
+        return iter(map(tuple, self.view().tolist()))
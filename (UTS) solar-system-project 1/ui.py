@@ -1,7 +1,127 @@
 # ui.py
 import pygame
+from collections import OrderedDict
+
+class FontRegistry:
+    """Font dimuat sekali per (nama, ukuran, bold, italic) dan dipakai bersama
+
+    Lookup SysFont mahal (memindai font sistem), jadi jangan pernah membuat
+    font di dalam fungsi draw; ambil dari registry ini.
+    """
+    
+    def __init__(self):
+        self.fonts = {}
+    
+    def get(self, name=None, size=24, bold=False, italic=False):
+        key = (name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(name, size, bold, italic)
+            self.fonts[key] = font
+        return font
+
+class TextCache:
+    """Cache surface teks (LRU) agar label yang sama tidak di-render ulang"""
+    
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, antialias, color)
+            self.entries[key] = surface
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return surface
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+# Registry font dan cache label bersama untuk seluruh proses
+fonts = FontRegistry()
+label_cache = TextCache(max_entries=512)
+
+def render_label(text, size=24, color=(255, 255, 255), name=None, bold=False, antialias=True):
+    """Surface label dari cache bersama, font diambil dari registry"""
+    return label_cache.render(fonts.get(name, size, bold), text, color, antialias)
+
+class Widget:
+    """Area di dalam panel dengan input dan flag dirty sendiri"""
+    
+    def __init__(self, rect, render):
+        self.rect = pygame.Rect(rect)
+        self.render = render
+        self.inputs = ()
+        self.dirty = True
+
+class RetainedPanel:
+    """Panel yang dikomposit ke surface sendiri dan hanya digambar ulang saat berubah
+
+    Setiap widget di-render ulang hanya jika inputnya berubah (lihat set),
+    sehingga biaya per frame cukup satu blit surface panel.
+    """
+    
+    def __init__(self, size, bg_color):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.bg_color = bg_color
+        self.widgets = {}
+        self.changed = []
+        self.surface.fill(bg_color)
+    
+    def add_widget(self, name, rect, render):
+        """render(surface, rect, *inputs) menggambar widget dalam koordinat panel"""
+        self.widgets[name] = Widget(rect, render)
+    
+    def set(self, name, *inputs):
+        """Perbarui input widget, tandai dirty jika berbeda dari sebelumnya"""
+        widget = self.widgets[name]
+        if inputs != widget.inputs:
+            widget.inputs = inputs
+            widget.dirty = True
+    
+    def is_dirty(self):
+        return any(widget.dirty for widget in self.widgets.values())
+    
+    def compose(self):
+        """Gambar ulang widget yang dirty, lalu kembalikan surface panel
+
+        Rect widget yang di-render ulang tersimpan di changed (koordinat panel).
+        """
+        self.changed = []
+        for widget in self.widgets.values():
+            if widget.dirty:
+                self.changed.append(widget.rect)
+                self.surface.set_clip(widget.rect)
+                self.surface.fill(self.bg_color, widget.rect)
+                widget.render(self.surface, widget.rect, *widget.inputs)
+                widget.dirty = False
+        self.surface.set_clip(None)
+        return self.surface
 
 class Button:
+    # Cache teks dipakai bersama oleh semua tombol (dan seluruh proses)
+    text_cache = label_cache
+    
     def __init__(self, x, y, width, height, text, color=(60, 60, 80), hover_color=(90, 90, 110)):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
@@ -10,22 +130,27 @@ class Button:
         self.is_hovered = False
         self.is_active = False
     
-    def draw(self, surface):
+    def draw(self, surface, offset=(0, 0)):
+        """Gambar tombol, offset menggeser rect ke koordinat surface tujuan"""
         color = self.hover_color if self.is_hovered else self.color
         if self.is_active:
             color = (120, 120, 180)
         
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, (180, 180, 200), self.rect, 2, border_radius=8)
+        rect = self.rect.move(offset)
+        pygame.draw.rect(surface, color, rect, border_radius=8)
+        pygame.draw.rect(surface, (180, 180, 200), rect, 2, border_radius=8)
         
         try:
-            font = pygame.font.Font(None, 22)
-            text_surf = font.render(self.text, True, (255, 255, 255))
-            text_rect = text_surf.get_rect(center=self.rect.center)
+            text_surf = Button.text_cache.render(fonts.get(None, 22), self.text, (255, 255, 255))
+            text_rect = text_surf.get_rect(center=rect.center)
             surface.blit(text_surf, text_rect)
         except:
             pass
     
+    def state(self):
+        """Input visual tombol, dipakai sebagai dirty key panel retained"""
+        return (self.text, self.is_hovered, self.is_active)
+    
     def check_hover(self, mouse_pos):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
         return self.is_hovered
@@ -55,61 +180,77 @@ class UI:
         self.speed_multiplier = 1.0
         self.translation_mode = True  # Default aktif
         self.scale_mode = True  # Default aktif
+        
+        # Panel retained: tombol dan info hanya di-render ulang saat berubah
+        self.panel_x = width - 180
+        self.panel = RetainedPanel((180, height), (20, 20, 40, 220))
+        for i, button in enumerate(self.buttons):
+            self.panel.add_widget(i, button.rect.move(-self.panel_x, 0), self.render_button)
+        self.panel.add_widget('info', (0, 350, 180, 9 * 24), self.render_info)
+        
+        self.text_cache = label_cache
+        try:
+            self.font = fonts.get(None, 24)
+            self.small_font = fonts.get(None, 18)
+        except:
+            self.font = self.small_font = None
     
     def draw(self, surface, tx, ty, scale):
-        # Panel background dengan transparansi
-        panel = pygame.Surface((180, self.height), pygame.SRCALPHA)
-        panel.fill((20, 20, 40, 220))
-        surface.blit(panel, (self.width - 180, 0))
-        
         # Update button states
         self.buttons[0].text = "▶️ Resume" if self.paused else "⏸️ Pause"
         self.buttons[2].is_active = self.translation_mode
         self.buttons[3].is_active = self.scale_mode
         
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+        for i, button in enumerate(self.buttons):
+            self.panel.set(i, button, button.state())
+        self.panel.set('info', f"{tx:.0f}", f"{ty:.0f}", f"{scale:.2f}", self.speed_multiplier,
+                       self.paused, self.translation_mode, self.scale_mode)
         
+        # Panel background dengan transparansi
+        surface.blit(self.panel.compose(), (self.panel_x, 0))
+    
+    def render_button(self, surface, rect, button, state):
+        button.draw(surface, (-self.panel_x, 0))
+    
+    def render_info(self, surface, rect, tx, ty, scale, speed_multiplier, paused, translation_mode, scale_mode):
         # Draw info panel
+        if self.font is None:
+            return
         try:
-            font = pygame.font.Font(None, 24)
-            small_font = pygame.font.Font(None, 18)
-            
-            info_x = self.width - 170
+            info_x = 10
             info = [
                 "STATUS SISTEM:",
-                f"Translasi: ({tx:.0f}, {ty:.0f})",
-                f"Skala: {scale:.2f}x",
-                f"Kecepatan: {self.speed_multiplier:.1f}x",
-                f"Status: {'PAUSED' if self.paused else 'RUNNING'}",
+                f"Translasi: ({tx}, {ty})",
+                f"Skala: {scale}x",
+                f"Kecepatan: {speed_multiplier:.1f}x",
+                f"Status: {'PAUSED' if paused else 'RUNNING'}",
                 "",
                 "MODE AKTIF:",
-                f"{'✓' if self.translation_mode else '✗'} Translasi",
-                f"{'✓' if self.scale_mode else '✗'} Skala"
+                f"{'✓' if translation_mode else '✗'} Translasi",
+                f"{'✓' if scale_mode else '✗'} Skala"
             ]
             
             for i, text in enumerate(info):
                 if "STATUS" in text or "MODE" in text:
                     color = (255, 220, 100)
-                    text_surf = font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.font, text, color)
                 elif "PAUSED" in text:
                     color = (255, 100, 100)
-                    text_surf = small_font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.small_font, text, color)
                 elif "RUNNING" in text:
                     color = (100, 255, 100)
-                    text_surf = small_font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.small_font, text, color)
                 elif "✓" in text:
                     color = (100, 255, 100)
-                    text_surf = small_font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.small_font, text, color)
                 elif "✗" in text:
                     color = (255, 100, 100)
-                    text_surf = small_font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.small_font, text, color)
                 else:
                     color = (200, 200, 220)
-                    text_surf = small_font.render(text, True, color)
+                    text_surf = self.text_cache.render(self.small_font, text, color)
                 
-                surface.blit(text_surf, (info_x, 350 + i * 24))
+                surface.blit(text_surf, (info_x, rect.y + i * 24))
         except:
             pass
     
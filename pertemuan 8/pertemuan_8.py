@@ -2,8 +2,34 @@ import pygame
 import sys
 import math
 import numpy as np
+from collections import OrderedDict
 from pygame.locals import *
 
+# Registry font per proses: SysFont memindai font sistem, jadi cukup sekali per ukuran
+_fonts = {}
+
+def get_font(name, size, bold=False):
+    key = (name, size, bold)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.SysFont(name, size, bold=bold)
+    return _fonts[key]
+
+# Cache label (LRU) dengan key (teks, font, warna, antialias)
+_labels = OrderedDict()
+MAX_LABELS = 256
+
+def render_label(text, font, color, antialias=True):
+    key = (text, font, tuple(color), antialias)
+    surface = _labels.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color)
+        _labels[key] = surface
+        if len(_labels) > MAX_LABELS:
+            _labels.popitem(last=False)
+    else:
+        _labels.move_to_end(key)
+    return surface
+
 class Transformasi3D:
     def __init__(self):
         # Inisialisasi PyGame
@@ -27,8 +53,8 @@ class Transformasi3D:
         self.GRAY = (128, 128, 128)
         
         # Font
-        self.font = pygame.font.SysFont('Arial', 20)
-        self.title_font = pygame.font.SysFont('Arial', 28, bold=True)
+        self.font = get_font('Arial', 20)
+        self.title_font = get_font('Arial', 28, bold=True)
         
         # Parameter kamera
         self.camera_pos = [0, 0, -800]  # Posisi kamera lebih jauh
@@ -318,8 +344,8 @@ class Transformasi3D:
             
             # Label sumbu X
             if end[0] > 0 and end[1] > 0:
-                font = pygame.font.SysFont('Arial', 16, bold=True)
-                x_label = font.render('X', True, self.RED)
+                font = get_font('Arial', 16, bold=True)
+                x_label = render_label('X', font, self.RED)
                 self.screen.blit(x_label, (end[0] + 5, end[1] - 10))
             
             # Sumbu Y (Hijau)
@@ -329,7 +355,7 @@ class Transformasi3D:
             
             # Label sumbu Y
             if end[0] > 0 and end[1] > 0:
-                y_label = font.render('Y', True, self.GREEN)
+                y_label = render_label('Y', font, self.GREEN)
                 self.screen.blit(y_label, (end[0] + 5, end[1] - 10))
             
             # Sumbu Z (Biru)
@@ -339,7 +365,7 @@ class Transformasi3D:
             
             # Label sumbu Z
             if end[0] > 0 and end[1] > 0:
-                z_label = font.render('Z', True, self.BLUE)
+                z_label = render_label('Z', font, self.BLUE)
                 self.screen.blit(z_label, (end[0] + 5, end[1] - 10))
         except Exception as e:
             print(f"Error drawing axes: {e}")
@@ -352,39 +378,39 @@ class Transformasi3D:
             pygame.draw.rect(self.screen, (50, 50, 60), (10, 10, 400, 250), 2, border_radius=10)
             
             # Judul
-            title = self.title_font.render("TRANSFORMASI 3D - UNU Blitar", True, self.CYAN)
+            title = render_label("TRANSFORMASI 3D - UNU Blitar", self.title_font, self.CYAN)
             self.screen.blit(title, (20, 20))
             
-            subtitle = self.font.render("Mini Project Grafika Komputer - Program Studi Ilmu Komputer", True, self.WHITE)
+            subtitle = render_label("Mini Project Grafika Komputer - Program Studi Ilmu Komputer", self.font, self.WHITE)
             self.screen.blit(subtitle, (20, 55))
             
             # Informasi objek
             objects = ["KUBUS", "PIRAMIDA", "PRISMA"]
-            obj_text = self.font.render(f"OBJEK: {objects[self.active_object]}", True, self.YELLOW)
+            obj_text = render_label(f"OBJEK: {objects[self.active_object]}", self.font, self.YELLOW)
             self.screen.blit(obj_text, (20, 90))
             
             # Status transformasi
-            mode_text = self.font.render(f"MODE: {self.transform_mode.upper()}", True, self.GREEN)
+            mode_text = render_label(f"MODE: {self.transform_mode.upper()}", self.font, self.GREEN)
             self.screen.blit(mode_text, (20, 120))
             
             # Parameter transformasi
-            trans_text = self.font.render(f"Translasi: X={self.translation[0]:.1f}, Y={self.translation[1]:.1f}, Z={self.translation[2]:.1f}", True, self.WHITE)
+            trans_text = render_label(f"Translasi: X={self.translation[0]:.1f}, Y={self.translation[1]:.1f}, Z={self.translation[2]:.1f}", self.font, self.WHITE)
             self.screen.blit(trans_text, (20, 150))
             
-            rot_text = self.font.render(f"Rotasi: X={self.rotation[0]:.1f}°, Y={self.rotation[1]:.1f}°, Z={self.rotation[2]:.1f}°", True, self.WHITE)
+            rot_text = render_label(f"Rotasi: X={self.rotation[0]:.1f}°, Y={self.rotation[1]:.1f}°, Z={self.rotation[2]:.1f}°", self.font, self.WHITE)
             self.screen.blit(rot_text, (20, 175))
             
-            scale_text = self.font.render(f"Skala: X={self.scale[0]:.2f}, Y={self.scale[1]:.2f}, Z={self.scale[2]:.2f}", True, self.WHITE)
+            scale_text = render_label(f"Skala: X={self.scale[0]:.2f}, Y={self.scale[1]:.2f}, Z={self.scale[2]:.2f}", self.font, self.WHITE)
             self.screen.blit(scale_text, (20, 200))
             
-            refl_text = self.font.render(f"Refleksi: X={'-' if self.reflection[0] < 0 else '+'}, Y={'-' if self.reflection[1] < 0 else '+'}, Z={'-' if self.reflection[2] < 0 else '+'}", True, self.WHITE)
+            refl_text = render_label(f"Refleksi: X={'-' if self.reflection[0] < 0 else '+'}, Y={'-' if self.reflection[1] < 0 else '+'}, Z={'-' if self.reflection[2] < 0 else '+'}", self.font, self.WHITE)
             self.screen.blit(refl_text, (20, 225))
             
             # Panel kontrol di kanan
             pygame.draw.rect(self.screen, (30, 40, 30), (self.WIDTH - 350, 10, 340, 320), border_radius=10)
             pygame.draw.rect(self.screen, (50, 60, 50), (self.WIDTH - 350, 10, 340, 320), 2, border_radius=10)
             
-            ctrl_title = self.font.render("KONTROL TRANSFORMASI", True, self.YELLOW)
+            ctrl_title = render_label("KONTROL TRANSFORMASI", self.font, self.YELLOW)
             self.screen.blit(ctrl_title, (self.WIDTH - 340, 20))
             
             controls = [
@@ -410,7 +436,7 @@ class Transformasi3D:
             
             y_offset = 50
             for control in controls:
-                ctrl_text = pygame.font.SysFont('Arial', 14).render(control, True, self.WHITE)
+                ctrl_text = render_label(control, get_font('Arial', 14), self.WHITE)
                 self.screen.blit(ctrl_text, (self.WIDTH - 340, y_offset))
                 y_offset += 20
             
@@ -418,7 +444,7 @@ class Transformasi3D:
             pygame.draw.rect(self.screen, (40, 30, 30), (10, self.HEIGHT - 220, 500, 210), border_radius=10)
             pygame.draw.rect(self.screen, (60, 50, 50), (10, self.HEIGHT - 220, 500, 210), 2, border_radius=10)
             
-            info_title = self.font.render("INFORMASI TRANSFORMASI 3D", True, self.CYAN)
+            info_title = render_label("INFORMASI TRANSFORMASI 3D", self.font, self.CYAN)
             self.screen.blit(info_title, (20, self.HEIGHT - 210))
             
             info_text = [
@@ -437,7 +463,7 @@ class Transformasi3D:
             
             y_offset = self.HEIGHT - 180
             for line in info_text:
-                info_line = pygame.font.SysFont('Courier', 12).render(line, True, self.WHITE)
+                info_line = render_label(line, get_font('Courier', 12), self.WHITE)
                 self.screen.blit(info_line, (20, y_offset))
                 y_offset += 18
         except Exception as e: